@@ -1,25 +1,37 @@
 from .ports import (
     StyleSetter,
     FileSystem,
+    FileWatcher,
+    ContentSniffer,
+    DuplicateFinder,
     Logger,
     AppConfig,
     RuleRepository,
     StyleRepository,
     ConfigRepository,
+    PlanRepository,
 )
 
-from .dto import OrganizeResult, OrganizeRequest
-from .use_cases import OrganizeFilesUseCase
+from .dto import OrganizeResult, OrganizeRequest, MovePlan, PlannedMove
+from .use_cases import OrganizeFilesUseCase, WatchFilesUseCase, ApplyPlanUseCase
 
 __all__ = [
     'StyleSetter',
     'FileSystem',
+    'FileWatcher',
+    'ContentSniffer',
+    'DuplicateFinder',
     'Logger',
     'RuleRepository',
     'StyleRepository',
     'AppConfig',
     'ConfigRepository',
+    'PlanRepository',
     'OrganizeRequest',
     'OrganizeResult',
+    'MovePlan',
+    'PlannedMove',
     'OrganizeFilesUseCase',
+    'WatchFilesUseCase',
+    'ApplyPlanUseCase',
 ]
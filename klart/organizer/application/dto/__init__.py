@@ -1,7 +1,10 @@
 from .organize_request import OrganizeRequest
 from .organize_result import OrganizeResult
+from .move_plan import MovePlan, PlannedMove
 
 __all__ = [
     'OrganizeRequest',
     'OrganizeResult',
+    'MovePlan',
+    'PlannedMove',
 ]
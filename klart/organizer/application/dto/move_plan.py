@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+
+class PlannedMove:
+    """One planned move: the file's current path and its final destination path (conflicts already resolved)."""
+
+    __slots__ = ('_source', '_destination')
+
+    def __init__(self, source: Path, destination: Path) -> None:
+        self._source = source
+        self._destination = destination
+
+    @property
+    def source(self) -> Path:
+        return self._source
+
+    @property
+    def destination(self) -> Path:
+        return self._destination
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlannedMove):
+            return NotImplemented
+        return self._source == other._source and self._destination == other._destination
+
+    def __hash__(self) -> int:
+        return hash((self._source, self._destination))
+
+    def __repr__(self) -> str:
+        return f'PlannedMove(source={self._source!r}, destination={self._destination!r})'
+
+
+class MovePlan:
+    """
+    What a run would do, computed up front.
+
+    Filled by the plan phase (classification and conflict resolution, nothing
+    moved), saved by a PlanRepository, reviewed, and later executed by the
+    apply phase without classifying again.
+
+    Fields:
+        source_dir - the organized source directory
+        dest_dir   - the destination base (source_dir when no dest was given)
+        moves      - list of PlannedMove, in scan order
+    """
+
+    __slots__ = ('_source_dir', '_dest_dir', '_moves')
+
+    def __init__(self, source_dir: Path, dest_dir: Path, moves: Optional[List[PlannedMove]] = None) -> None:
+        self._source_dir = source_dir
+        self._dest_dir = dest_dir
+        self._moves: List[PlannedMove] = list(moves) if moves else []
+
+    def add(self, source: Path, destination: Path) -> None:
+        self._moves.append(PlannedMove(source, destination))
+
+    @property
+    def source_dir(self) -> Path:
+        return self._source_dir
+
+    @property
+    def dest_dir(self) -> Path:
+        return self._dest_dir
+
+    @property
+    def moves(self) -> List[PlannedMove]:
+        return list(self._moves)
+
+    def __len__(self) -> int:
+        return len(self._moves)
+
+    def __iter__(self) -> Iterator[PlannedMove]:
+        return iter(self._moves)
+
+    def __repr__(self) -> str:
+        return (
+            f'MovePlan('
+            f'source_dir={self._source_dir!r}, '
+            f'dest_dir={self._dest_dir!r}, '
+            f'moves={len(self._moves)})'
+        )
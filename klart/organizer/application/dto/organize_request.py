@@ -20,6 +20,10 @@ class OrganizeRequest:
         '_dry_run',
         '_recursive',
         '_clean_mode',
+        '_streaming',
+        '_columnar',
+        '_dedup',
+        '_jobs',
         '_ignore_patterns',
     )
 
@@ -31,6 +35,10 @@ class OrganizeRequest:
         dry_run: bool = False,
         recursive: bool = False,
         clean_mode: bool = False,
+        streaming: bool = False,
+        columnar: bool = False,
+        dedup: Optional[str] = None,
+        jobs: int = 1,
         ignore_patterns: Optional[List[str]] = None,
     ) -> None:
         self._source_dir = source_dir
@@ -39,6 +47,10 @@ class OrganizeRequest:
         self._dry_run = dry_run
         self._recursive = recursive
         self._clean_mode = clean_mode
+        self._streaming = streaming
+        self._columnar = columnar
+        self._dedup = dedup
+        self._jobs = jobs
         self._ignore_patterns = ignore_patterns or []
 
     @property
@@ -65,6 +77,22 @@ class OrganizeRequest:
     def clean_mode(self) -> bool:
         return self._clean_mode
 
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
+    @property
+    def columnar(self) -> bool:
+        return self._columnar
+
+    @property
+    def dedup(self) -> Optional[str]:
+        return self._dedup
+
+    @property
+    def jobs(self) -> int:
+        return self._jobs
+
     @property
     def ignore_patterns(self) -> List[str]:
         return self._ignore_patterns
@@ -77,5 +105,9 @@ class OrganizeRequest:
             f'dry_run={self._dry_run!r}, '
             f'recursive={self._recursive!r}, '
             f'clean_mode={self._clean_mode!r}, '
+            f'streaming={self._streaming!r}, '
+            f'columnar={self._columnar!r}, '
+            f'dedup={self._dedup!r}, '
+            f'jobs={self._jobs!r}, '
             f'ignore_patterns={self._ignore_patterns!r}'
         )
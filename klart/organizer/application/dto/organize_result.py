@@ -13,6 +13,8 @@ class OrganizeResult:
         moved   - list of (source_path, dest_path) tuples
         skipped - list of source_path that were skipped (ignored by rules)
         errors  - list of (source_path, error_message) tuples
+        duplicates - list of (source_path, original_path) tuples: files whose
+                  content already existed, handled by the dedup policy
         dry_run - whether this was a simulation run
     """
 
@@ -21,6 +23,7 @@ class OrganizeResult:
         '_skipped',
         '_removed',
         '_errors',
+        '_duplicates',
         '_dry_run',
         '_recursive',
         '_clean_mode',
@@ -36,6 +39,7 @@ class OrganizeResult:
         self._skipped: List[Path] = []
         self._removed: List[Path] = []
         self._errors: List[Tuple[Path, str]] = []
+        self._duplicates: List[Tuple[Path, Path]] = []
         self._dry_run: bool = dry_run
         self._recursive: bool = recursive
         self._clean_mode: bool = clean_mode
@@ -54,6 +58,9 @@ class OrganizeResult:
     def add_removed(self, source: Path) -> None:
         self._removed.append(source)
 
+    def add_duplicate(self, source: Path, original: Path) -> None:
+        self._duplicates.append((source, original))
+
     # Read-only properties
 
     @property
@@ -72,6 +79,10 @@ class OrganizeResult:
     def errors(self) -> List[Tuple[Path, str]]:
         return self._errors
 
+    @property
+    def duplicates(self) -> List[Tuple[Path, Path]]:
+        return self._duplicates
+
     @property
     def dry_run(self) -> bool:
         return self._dry_run
@@ -86,7 +97,7 @@ class OrganizeResult:
 
     @property
     def total_files(self) -> int:
-        return len(self._moved) + len(self._skipped) + len(self._errors)
+        return len(self._moved) + len(self._skipped) + len(self._errors) + len(self._duplicates)
 
     @property
     def success(self) -> bool:
@@ -99,6 +110,7 @@ class OrganizeResult:
             f'skipped={len(self._skipped)}, '
             f'removed={len(self._removed)}, '
             f'errors={len(self._errors)}, '
+            f'duplicates={len(self._duplicates)}, '
             f'dry_run={self._dry_run!r}, '
             f'recursive={self._recursive!r}, '
             f'clean_mode={self._clean_mode!r} '
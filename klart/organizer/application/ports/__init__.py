@@ -1,15 +1,22 @@
 from .setter import StyleSetter
 from .file_system import FileSystem
+from .file_watcher import FileWatcher
+from .content_sniffer import ContentSniffer
+from .duplicate_finder import DuplicateFinder
 from .logger import Logger
 from .config import AppConfig
-from .repo_loaders import RuleRepository, StyleRepository, ConfigRepository
+from .repo_loaders import RuleRepository, StyleRepository, ConfigRepository, PlanRepository
 
 __all__ = [
     'StyleSetter',
     'FileSystem',
+    'FileWatcher',
+    'ContentSniffer',
+    'DuplicateFinder',
     'Logger',
     'AppConfig',
     'RuleRepository',
     'StyleRepository',
     'ConfigRepository',
+    'PlanRepository',
 ]
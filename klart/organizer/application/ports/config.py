@@ -26,7 +26,14 @@ class AppConfig:
         '_dry_run',
         '_recursive',
         '_clean_mode',
+        '_streaming',
+        '_watch',
+        '_columnar',
+        '_dedup',
         '_ignore_patterns',
+        '_scan_workers',
+        '_jobs',
+        '_scan_index',
         '_rules_file',
         '_rules_cfg',
         '_rules_combine',
@@ -36,6 +43,9 @@ class AppConfig:
         '_logging',
     )
 
+    # What to do with a file whose content already exists (dedup option)
+    DEDUP_POLICIES = ('skip', 'delete', 'hardlink', 'move')
+
     def __init__(
         self,
         source_dir: Optional[Path] = None,
@@ -43,7 +53,14 @@ class AppConfig:
         dry_run: Optional[bool] = None,
         recursive: Optional[bool] = None,
         clean_mode: Optional[bool] = None,
+        streaming: Optional[bool] = None,
+        watch: Optional[bool] = None,
+        columnar: Optional[bool] = None,
+        dedup: Optional[str] = None,
         ignore_patterns: Optional[List[str]] = None,
+        scan_workers: Optional[int] = None,
+        jobs: Optional[int] = None,
+        scan_index: Optional[bool] = None,
         rules_file: Optional[Path] = None,
         rules_cfg: Optional[Dict[str, Any]] = None,
         rules_combine: Optional[bool] = None,
@@ -57,7 +74,14 @@ class AppConfig:
         self._dry_run = dry_run
         self._recursive = recursive
         self._clean_mode = clean_mode
+        self._streaming = streaming
+        self._watch = watch
+        self._columnar = columnar
+        self._dedup = dedup
         self._ignore_patterns = ignore_patterns
+        self._scan_workers = scan_workers
+        self._jobs = jobs
+        self._scan_index = scan_index
         self._rules_file = rules_file
         self._rules_cfg = rules_cfg
         self._rules_combine = rules_combine
@@ -86,11 +110,23 @@ class AppConfig:
             raise ValueError(f'recursive must be a boolean, got {type(self._recursive)}')
         if self._clean_mode is not None and not isinstance(self._clean_mode, bool):
             raise ValueError(f'clean_mode must be a boolean, got {type(self._clean_mode)}')
+        if self._streaming is not None and not isinstance(self._streaming, bool):
+            raise ValueError(f'streaming must be a boolean, got {type(self._streaming)}')
+        if self._columnar is not None and not isinstance(self._columnar, bool):
+            raise ValueError(f'columnar must be a boolean, got {type(self._columnar)}')
+        if self._watch is not None and not isinstance(self._watch, bool):
+            raise ValueError(f'watch must be a boolean, got {type(self._watch)}')
+        if self._scan_index is not None and not isinstance(self._scan_index, bool):
+            raise ValueError(f'scan_index must be a boolean, got {type(self._scan_index)}')
         if self._rules_combine is not None and not isinstance(self._rules_combine, bool):
             raise ValueError(f'rules_combine must be a boolean, got({type(self._rules_combine)})')
         if self._styles_combine is not None and not isinstance(self._styles_combine, bool):
             raise ValueError(f'styles_combine must be a boolean, got({type(self._styles_combine)})')
 
+        # dedup: None (off) or one of the policies
+        if self._dedup is not None and self._dedup not in self.DEDUP_POLICIES:
+            raise ValueError(f'dedup must be one of {self.DEDUP_POLICIES}, got {self._dedup!r}')
+
         # ignore_patterns: None or list of strings
         if self._ignore_patterns is not None:
             if not isinstance(self._ignore_patterns, list):
@@ -99,6 +135,20 @@ class AppConfig:
                 if not isinstance(pat, str):
                     raise ValueError(f'ignore pattern must be string, got {type(pat)}')
 
+        # scan_workers: None or positive integer
+        if self._scan_workers is not None:
+            if isinstance(self._scan_workers, bool) or not isinstance(self._scan_workers, int):
+                raise ValueError(f'scan_workers must be an integer, got {type(self._scan_workers)}')
+            if self._scan_workers < 1:
+                raise ValueError(f'scan_workers must be >= 1, got {self._scan_workers}')
+
+        # jobs: None or positive integer
+        if self._jobs is not None:
+            if isinstance(self._jobs, bool) or not isinstance(self._jobs, int):
+                raise ValueError(f'jobs must be an integer, got {type(self._jobs)}')
+            if self._jobs < 1:
+                raise ValueError(f'jobs must be >= 1, got {self._jobs}')
+
         # rules_cfg and styles_cfg must be dicts if provided
         if self._rules_cfg is not None and not isinstance(self._rules_cfg, dict):
             raise ValueError(f'rules_cfg must be a dict, got {type(self._rules_cfg)}')
@@ -132,11 +182,49 @@ class AppConfig:
         """If True, cleans all empty dirs from source path"""
         return self._clean_mode
 
+    @property
+    def streaming(self) -> Optional[bool]:
+        """If True, organize files while the scan is still running (ignored in clean mode)."""
+        return self._streaming
+
+    @property
+    def columnar(self) -> Optional[bool]:
+        """If True, scan into a compact FileTable instead of a Directory tree (ignored in clean mode)."""
+        return self._columnar
+
+    @property
+    def dedup(self) -> Optional[str]:
+        """
+        Duplicate handling policy ('skip', 'delete', 'hardlink', 'move'),
+        or None to move duplicates like any file.
+        """
+        return self._dedup
+
+    @property
+    def watch(self) -> Optional[bool]:
+        """If True, keep running and organize new files as they arrive."""
+        return self._watch
+
     @property
     def ignore_patterns(self) -> Optional[List[str]]:
         """List of glob patterns to ignore during scanning."""
         return self._ignore_patterns
 
+    @property
+    def scan_workers(self) -> Optional[int]:
+        """Number of worker threads for recursive scans (1 = sequential)."""
+        return self._scan_workers
+
+    @property
+    def jobs(self) -> Optional[int]:
+        """Number of files moved in parallel (1 = one at a time)."""
+        return self._jobs
+
+    @property
+    def scan_index(self) -> Optional[bool]:
+        """If True, reuse listings of unchanged directories from the on-disk scan index."""
+        return self._scan_index
+
     @property
     def rules_cfg(self) -> Optional[Dict[str, Any]]:
         """Inline rules config dict, or None."""
@@ -180,7 +268,14 @@ class AppConfig:
             f'dry_run={self._dry_run!r}, '
             f'recursive={self._recursive!r}, '
             f'clean_mode={self._clean_mode!r}, '
+            f'streaming={self._streaming!r}, '
+            f'watch={self._watch!r}, '
+            f'columnar={self._columnar!r}, '
+            f'dedup={self._dedup!r}, '
             f'ignore_patterns={self._ignore_patterns!r}, '
+            f'scan_workers={self._scan_workers!r}, '
+            f'jobs={self._jobs!r}, '
+            f'scan_index={self._scan_index!r}, '
             f'rules_cfg={self._rules_cfg!r}, '
             f'rules_file={self._rules_file!r}, '
             f'rules_combine={self._rules_combine!r}, '
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Iterator
+
+# Project modules
+from ...domain.entities import FileItem
+
+
+class ContentSniffer(ABC):
+    """
+    Port for loading file headers (FileItem.header) ahead of classification.
+    Any adapter (thread pool, async I/O, test fake) must implement this.
+    """
+
+    @abstractmethod
+    def prefetch(self, files: Iterable[FileItem], wanted: Callable[[FileItem], bool]) -> Iterator[FileItem]:
+        """
+        Yield files in their original order. Before a file is yielded, its
+        header is already loaded if wanted(file_item) is True - so content rules
+        do no I/O of their own. Files wanted() rejects are passed through untouched.
+        """
+        pass
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Sequence
+
+# Project modules
+from ...domain.entities import FileItem
+
+
+class DuplicateFinder(ABC):
+    """
+    Port for detecting files with identical content.
+    Any adapter (hashing, test fake) must implement this.
+    """
+
+    @abstractmethod
+    def find(self, files: Sequence[FileItem]) -> Dict[Path, Path]:
+        """
+        Find duplicates among files.
+        Returns duplicate path -> path of the copy that is kept; the kept copy
+        of every group is the first of its files in the given order.
+        Files whose content is unique do not appear in the result.
+        """
+        pass
+
+    @abstractmethod
+    def same_content(self, first: Path, second: Path) -> bool:
+        """
+        True if both paths are different files with identical content (e.g. a file
+        and an existing destination). A path and itself, or two hard links to the
+        same file, are one file - never a duplicate.
+        """
+        pass
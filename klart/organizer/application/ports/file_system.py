@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterator, List, Optional
 
 # Project modules
-from ...domain.entities import Directory, FileItem
+from ...domain.entities import Directory, FileItem, FileTable
 
 
 class FileSystem(ABC):
@@ -13,15 +13,59 @@ class FileSystem(ABC):
     """
 
     @abstractmethod
-    def scan(self, path: Path, recursive: bool = False, ignore_patterns: Optional[List[str]] = None) -> Directory:
+    def scan(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[Callable[[str], bool]] = None,
+    ) -> Directory:
         """
         Scan a directory and build an in‑memory tree.
         If recursive=False, only immediate children are scanned.
         ignore_patterns: list of glob patterns to exclude from scanning.
+        needs_stat: called with a file suffix; files it returns False for are not
+                    stat-ed during the scan (FileItem still fetches stat lazily if asked).
+                    None - stat data may be collected for every file.
         Returns the root Directory entity with all descendants.
         """
         pass
 
+    def stream(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[Callable[[str], bool]] = None,
+    ) -> Iterator[FileItem]:
+        """
+        Yield files one by one while the directory is still being scanned.
+        Unlike scan(), no full tree is kept in memory - each FileItem only
+        references its own (detached) parent Directory.
+
+        Default implementation falls back to scan() + walk_files();
+        adapters that can really stream should override it.
+        """
+        root = self.scan(path, recursive=recursive, ignore_patterns=ignore_patterns, needs_stat=needs_stat)
+        yield from root.walk_files()
+
+    def scan_table(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[Callable[[str], bool]] = None,
+    ) -> FileTable:
+        """
+        Scan a directory into a compact FileTable instead of a Directory tree.
+        Only files are kept, in flat column buffers - meant for very large trees.
+
+        Default implementation converts the result of scan();
+        adapters should override it to skip building the tree at all.
+        """
+        root = self.scan(path, recursive=recursive, ignore_patterns=ignore_patterns, needs_stat=needs_stat)
+        return FileTable.from_files(root.walk_files())
+
     @abstractmethod
     def move(self, file_item: FileItem, destination: Path, new_parent: Directory, dry_run: bool) -> None:
         """
@@ -32,6 +76,40 @@ class FileSystem(ABC):
         """
         pass
 
+    @abstractmethod
+    def reserve_name(self, destination: Path) -> Path:
+        """
+        Resolve the final path a move to destination would use (same conflict
+        rules as move()) without moving anything, and keep that name reserved
+        so later reservations and moves in this process do not get it too.
+        Used by the plan phase.
+        """
+        pass
+
+    def device(self, path: Path) -> Optional[int]:
+        """
+        Id of the device (file system) path is on - for a path that does not exist
+        yet, the device of its nearest existing parent. None if unknown.
+        Moves within one device are renames; used to group planned moves.
+        """
+        return None
+
+    @abstractmethod
+    def remove(self, file_item: FileItem, dry_run: bool) -> None:
+        """
+        Delete a file. After successful removal, the file is detached from its parent directory.
+        If dry_run is True, nothing is deleted.
+        """
+        pass
+
+    @abstractmethod
+    def replace_with_link(self, file_item: FileItem, target: Path, dry_run: bool) -> None:
+        """
+        Replace a file by a hard link to target (a file with the same content),
+        so both names share one copy on disk. If dry_run is True, nothing changes.
+        """
+        pass
+
     @abstractmethod
     def mkdir(self, path: Path, parents: bool = True) -> None:
         """Create a directory. If parents=True, create missing parents."""
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+
+class FileWatcher(ABC):
+    """
+    Port for watching a directory for new files.
+    Any adapter (inotify, polling, fsevents, test fake) must implement this.
+    """
+
+    @abstractmethod
+    def watch(self, path: Path, recursive: bool = False, ignore_patterns: Optional[List[str]] = None) -> Iterator[Path]:
+        """
+        Yield paths of files that were created (and fully written) or moved into path.
+        Blocks while waiting for events; the iterator ends after stop() is called.
+        Files that exist before watch() starts are not reported.
+        """
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Ask a running watch() to finish. Safe to call from another thread."""
+        pass
@@ -1,9 +1,11 @@
 from .rule_repo import RuleRepository
 from .style_repo import StyleRepository
 from .config_repo import ConfigRepository
+from .plan_repo import PlanRepository
 
 __all__ = [
     'RuleRepository',
     'StyleRepository',
     'ConfigRepository',
+    'PlanRepository',
 ]
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+# Project modules
+from ...dto import MovePlan
+
+
+class PlanRepository(ABC):
+    """
+    Port for saving and loading move plans (plan/apply mode).
+    Any concrete adapter (JSON file, database, etc.) must implement this interface.
+    """
+
+    @abstractmethod
+    def save(self, plan: MovePlan) -> None:
+        """
+        Store the plan. May raise PlanError subclasses in case of failure.
+        """
+        pass
+
+    @abstractmethod
+    def load(self) -> MovePlan:
+        """
+        Load and return a stored plan.
+        May raise PlanError subclasses: PlanFileNotFoundError, PlanFormatError.
+        """
+        pass
@@ -1,3 +1,5 @@
 from .organize_files import OrganizeFilesUseCase
+from .watch_files import WatchFilesUseCase
+from .apply_plan import ApplyPlanUseCase
 
-__all__ = ['OrganizeFilesUseCase']
+__all__ = ['OrganizeFilesUseCase', 'WatchFilesUseCase', 'ApplyPlanUseCase']
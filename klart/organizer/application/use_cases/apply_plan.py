@@ -0,0 +1,174 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..ports import ConfigRepository, FileSystem, Logger, PlanRepository
+from ..dto import MovePlan, OrganizeResult, PlannedMove
+from ...domain import Directory, FileItem
+
+# Moves per task: a large destination folder is still spread over several workers
+_CHUNK_SIZE = 256
+
+# Group order: (cross-device, source device, destination device, destination folder)
+GroupKey = Tuple[bool, int, int, str]
+
+
+class ApplyPlanUseCase:
+    """
+    Apply phase of plan/apply mode: executes a saved MovePlan without
+    scanning or classifying again.
+
+    Moves are grouped by destination folder and by the devices involved:
+    same-device groups (plain renames) run first, cross-device groups (data
+    copies) after them, grouped per device pair; inside a group moves go in
+    source path order. Groups are cut into chunks that run on a thread pool
+    with jobs > 1. Outcomes are recorded in that order.
+
+    A file missing since planning is recorded as an error; a destination name
+    taken since planning is resolved again by file_system.move().
+    """
+
+    def __init__(
+        self,
+        config_repo: ConfigRepository,
+        plan_repo: PlanRepository,
+        file_system: FileSystem,
+        logger: Logger,
+    ) -> None:
+        self._config_repo = config_repo
+        self._plan_repo = plan_repo
+        self._file_system = file_system
+        self._logger = logger
+        # Destination tree of the current run: folder path -> its shared Directory node
+        self._dest_nodes: Dict[Path, Directory] = {}
+        self._dest_root: Optional[Directory] = None
+
+    @property
+    def destination_tree(self) -> Optional[Directory]:
+        """In-memory tree of the destination folders used by the last execute()."""
+        return self._dest_root
+
+    def execute(self) -> OrganizeResult:
+        """
+        Apply the plan.
+
+        Steps:
+            1. Load config (dry_run, jobs) and the plan
+            2. Group and order the moves by destination folder and device
+            3. Move each chunk of a group (on a thread pool with jobs > 1)
+            4. Return OrganizeResult with full summary
+        """
+        config = self._config_repo.load_config()
+        plan = self._plan_repo.load()
+        dry_run = config.dry_run or False
+        jobs = config.jobs or 1
+
+        result = OrganizeResult(dry_run=dry_run)
+        self._dest_nodes = {}
+        self._dest_root = None
+
+        self._logger.info('Applying move plan')
+        self._logger.info(f'Source    : {plan.source_dir}')
+        self._logger.info(f'Dest      : {plan.dest_dir}')
+        self._logger.info(f'Dry run   : {dry_run}')
+        self._logger.info(f'Moves     : {len(plan)}')
+        if jobs > 1:
+            self._logger.info(f'Jobs      : {jobs}')
+
+        # Destination nodes are created here - workers only attach files to them
+        chunks = [
+            (moves[i : i + _CHUNK_SIZE], self._dest_node(moves[0].destination.parent, plan))
+            for moves in self._group(plan)
+            for i in range(0, len(moves), _CHUNK_SIZE)
+        ]
+        if jobs > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix='mover') as pool:
+                futures = [pool.submit(self._apply_chunk, moves, node, dry_run) for moves, node in chunks]
+                for (moves, _), future in zip(chunks, futures):
+                    self._record(moves, future.result(), dry_run, result)
+        else:
+            for moves, node in chunks:
+                self._record(moves, self._apply_chunk(moves, node, dry_run), dry_run, result)
+
+        self._logger.info(
+            f'Done.  Moved: {len(result.moved)} | '
+            f'Errors: {len(result.errors)}'
+        )
+        return result
+
+    def _group(self, plan: MovePlan) -> List[List[PlannedMove]]:
+        """Moves grouped per destination folder and device pair, in apply order."""
+        # One device lookup per directory, not per file
+        devices: Dict[Path, int] = {}
+
+        def device(folder: Path) -> int:
+            dev = devices.get(folder)
+            if dev is None:
+                found = self._file_system.device(folder)
+                dev = devices[folder] = found if found is not None else -1
+            return dev
+
+        groups: Dict[GroupKey, List[PlannedMove]] = {}
+        for move in plan:
+            folder = move.destination.parent
+            source_dev = device(move.source.parent)
+            dest_dev = device(folder)
+            key = (source_dev != dest_dev, source_dev, dest_dev, str(folder))
+            groups.setdefault(key, []).append(move)
+        return [sorted(groups[key], key=lambda move: str(move.source)) for key in sorted(groups)]
+
+    def _dest_node(self, folder: Path, plan: MovePlan) -> Directory:
+        """The Directory node of destination folder, created once per run under the plan's dest_dir."""
+        node = self._dest_nodes.get(folder)
+        if node is not None:
+            return node
+        base = plan.dest_dir
+        if folder == base or base not in folder.parents:
+            node = Directory(folder)
+            if folder == base:
+                self._dest_root = node
+        else:
+            node = Directory(folder, self._dest_node(folder.parent, plan))
+        self._dest_nodes[folder] = node
+        return node
+
+    def _apply_chunk(
+        self, moves: List[PlannedMove], new_parent: Directory, dry_run: bool
+    ) -> List[Optional[Exception]]:
+        """Move the files of one chunk; returns the error (or None) of each move. Runs on a worker."""
+        # Source files get detached parents private to this chunk
+        sources: Dict[Path, Directory] = {}
+        outcomes: List[Optional[Exception]] = []
+        for move in moves:
+            parent = sources.get(move.source.parent)
+            if parent is None:
+                parent = sources[move.source.parent] = Directory(move.source.parent)
+            try:
+                self._file_system.move(
+                    file_item=FileItem(move.source, parent),
+                    destination=move.destination,
+                    new_parent=new_parent,
+                    dry_run=dry_run,
+                )
+                outcomes.append(None)
+            except Exception as exc:
+                # One bad file must not stop the whole run
+                outcomes.append(exc)
+        return outcomes
+
+    def _record(
+        self,
+        moves: List[PlannedMove],
+        outcomes: List[Optional[Exception]],
+        dry_run: bool,
+        result: OrganizeResult,
+    ) -> None:
+        """Log and record the outcomes of one chunk (on the calling thread)."""
+        prefix = '[DRY RUN] ' if dry_run else ''
+        for move, error in zip(moves, outcomes):
+            if error is not None:
+                self._logger.error(f'Failed: {move.source} - {error}')
+                result.add_error(move.source, str(error))
+            else:
+                self._logger.info(f'{prefix}Moved: {move.source.name} -> {move.destination}')
+                result.add_moved(move.source, move.destination)
@@ -1,8 +1,31 @@
-from ..ports import ConfigRepository, RuleRepository, FileSystem, Logger
-from ..dto import OrganizeRequest, OrganizeResult
-from ...domain import Directory
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from ..ports import (
+    AppConfig,
+    ConfigRepository,
+    ContentSniffer,
+    DuplicateFinder,
+    RuleRepository,
+    FileSystem,
+    Logger,
+    PlanRepository,
+)
+from ..dto import MovePlan, OrganizeRequest, OrganizeResult
+from ...domain import Directory, FileItem, RuleSet
 from ...exceptions import RuleNotFoundError
 
+# _organize_file() decision placeholder: classify the file itself
+_UNDECIDED = object()
+
+# Parallel moves: how many moves may be queued per job before results are collected
+_MOVES_PER_JOB = 4
+
+# A move handed to the pool: (future, file, source path, destination path)
+PendingMove = Tuple[Future, FileItem, Path, Path]
+
 
 class OrganizeFilesUseCase:
     """
@@ -19,11 +42,39 @@ class OrganizeFilesUseCase:
         rule_repo: RuleRepository,
         file_system: FileSystem,
         logger: Logger,
+        sniffer: Optional[ContentSniffer] = None,
+        finder: Optional[DuplicateFinder] = None,
+        plan_repo: Optional[PlanRepository] = None,
     ) -> None:
+        """
+        sniffer:   reads file headers ahead of classification when rules look at
+                   content; without one, headers are read lazily one by one.
+        finder:    detects duplicates when the dedup policy is set; without one
+                   duplicates are moved like any other file.
+        plan_repo: plan phase of plan/apply mode - nothing is moved; every move is
+                   resolved to its final path and the MovePlan is saved here
+                   (applied later by ApplyPlanUseCase).
+        """
         self._config_repo = config_repo
         self._rule_repo = rule_repo
         self._file_system = file_system
         self._logger = logger
+        self._sniffer = sniffer
+        self._finder = finder
+        self._plan_repo = plan_repo
+        # Plan being built by the current run (plan phase only)
+        self._plan: Optional[MovePlan] = None
+        # Destination tree of the current run: folder path -> its shared Directory node
+        self._dest_nodes: Dict[Path, Directory] = {}
+        self._dest_root: Optional[Directory] = None
+
+    @property
+    def destination_tree(self) -> Optional[Directory]:
+        """
+        In-memory tree of the destination folders used by the last execute(),
+        holding the files moved there (None before the first move).
+        """
+        return self._dest_root
 
     def execute(self) -> OrganizeResult:
         """
@@ -33,9 +84,18 @@ class OrganizeFilesUseCase:
             1. Load config and rules from repositories
             2. Build OrganizeRequest from loaded data
             3. Scan source directory -> Directory tree
-            4. Walk files via walk_files() generator (memory efficient)
-            5. For each file: get folder from RuleSet -> mkdir -> move
-            6. Return OrganizeResult with full summary
+               (or, in streaming mode, consume files while the scan runs;
+               in columnar mode, scan into a FileTable and use FileItem views)
+            4. Dedup stage (if a dedup policy is set): classify every file, then find
+               files whose content already exists among the files that would move -
+               they are handled by the policy
+            5. Walk files via walk_files() generator (memory efficient)
+            6. For each file: get folder from RuleSet -> mkdir -> move
+               (with jobs > 1 files are classified here and moved on a thread pool;
+               results are recorded in scan order as the moves finish)
+            7. Return OrganizeResult with full summary
+               (plan phase: steps 1-5 as usual, but step 6 only resolves and
+               records the final paths, and the MovePlan is saved - a dry run)
         """
 
         # Loading configs from ConfigRepository
@@ -43,83 +103,164 @@ class OrganizeFilesUseCase:
         rule_set = self._rule_repo.load_rules()
 
         # Building user request data cls
-        request = OrganizeRequest(
-            source_dir=config.source_dir,  # type: ignore
-            dest_dir=config.dest_dir,
-            rule_set=rule_set,
-            dry_run=config.dry_run or False,
-            recursive=config.recursive or False,
-            clean_mode=config.clean_mode or False,
-            ignore_patterns=config.ignore_patterns or [],
-        )
+        request = self._build_request(config, rule_set)
 
         result = OrganizeResult(
             dry_run=request.dry_run,
             clean_mode=request.clean_mode,
             recursive=request.recursive,
         )
+        self._dest_nodes = {}
+        self._dest_root = None
+        self._plan = None
+        if self._plan_repo is not None:
+            base = request.dest_dir if request.dest_dir is not None else request.source_dir
+            self._plan = MovePlan(request.source_dir, base)
 
         self._logger.info('Starting file organization')
         self._logger.info(f'Source    : {request.source_dir}')
         self._logger.info(f'Dest      : {request.dest_dir}')
         self._logger.info(f'Dry run   : {request.dry_run}')
         self._logger.info(f'Recursive : {request.recursive}')
+        if self._plan is not None:
+            self._logger.info('Plan      : True')
+        elif request.jobs > 1:
+            self._logger.info(f'Jobs      : {request.jobs}')
 
-        # Scan source root directory with file_system
-        source_dir = self._file_system.scan(
-            path=request.source_dir,
-            recursive=request.recursive,
-            ignore_patterns=request.ignore_patterns,
-        )
+        # Dedup compares every file with all others before the first move, so it
+        # needs the full tree scan (streaming and columnar modes are not used)
+        dedup = request.dedup is not None and self._finder is not None
+        if dedup:
+            self._logger.info(f'Dedup     : {request.dedup}')
 
-        # Running directory root walk files method to yield all files one by one
-        # For optimizing and economy memory resources
-        for file_item in source_dir.walk_files():
-            try:
-                # Asking RuleSetter for folder name
-                folder_name = request.rule_set.get_folder_name(file_item)
+        # Every scan gets rule_set.needs_stat: files whose rule path never reads
+        # size or mtime are not stat-ed at all (dedup groups by size - it stats everything).
+        # Streaming: classify and move files while the scanner is still running.
+        # Clean mode needs the whole tree afterwards, so it keeps the scan path.
+        source_dir = None
+        decisions = None
+        if request.streaming and not request.clean_mode and not dedup:
+            self._logger.info('Streaming : True')
+            files = self._file_system.stream(
+                path=request.source_dir,
+                recursive=request.recursive,
+                ignore_patterns=request.ignore_patterns,
+                needs_stat=request.rule_set.needs_stat,
+            )
+        elif request.columnar and not request.clean_mode and not dedup:
+            # Columnar: the scan keeps only flat column buffers, FileItems are
+            # short-lived views made one at a time
+            self._logger.info('Columnar  : True')
+            table = self._file_system.scan_table(
+                path=request.source_dir,
+                recursive=request.recursive,
+                ignore_patterns=request.ignore_patterns,
+                needs_stat=request.rule_set.needs_stat,
+            )
+            files = table.views()
+            # Feature-only rules classify the whole table in one columnar pass
+            if request.rule_set.feature_only:
+                decisions = request.rule_set.classify_columns(table.suffix_ids, table.suffixes, table.sizes)
+        else:
+            # Scan source root directory with file_system
+            source_dir = self._file_system.scan(
+                path=request.source_dir,
+                recursive=request.recursive,
+                ignore_patterns=request.ignore_patterns,
+                needs_stat=None if dedup else request.rule_set.needs_stat,
+            )
+            # Running directory root walk files method to yield all files one by one
+            # For optimizing and economy memory resources
+            files = source_dir.walk_files()
 
-                # If folder name in ignore list or rule is to ignore those like folders
-                if folder_name is None:
-                    self._logger.debug(f'Skipped: {file_item.name}')
-                    result.add_skipped(file_item.path)
-                    continue
+        # Content rules: read headers ahead, only for files whose rule path reaches one
+        if self._sniffer is not None and request.rule_set.reads_content:
+            rule_set = request.rule_set
+            files = self._sniffer.prefetch(files, lambda file_item: rule_set.needs_content(file_item.suffix))
 
-                # Build destination path: dest_dir/folder_name
-                base = request.dest_dir if request.dest_dir is not None else request.source_dir
-                dest_path = base / folder_name / file_item.name
-
-                # Create Directory object so file_system.move() can update the tree
-                new_parent = Directory(dest_path.parent)
-
-                # move() handles dry_run internally - no physical move if dry_run=True
-                # move() also handles mkdir and name collision resolution
-                self._file_system.move(
-                    file_item=file_item,
-                    destination=dest_path,
-                    new_parent=new_parent,
-                    dry_run=request.dry_run,
-                )
-
-                # In dry_run we still record as moved - user wants to see what WOULD happen.
-                # OrganizeResult.dry_run=True already signals this was a simulation.
-                prefix = '[DRY RUN] ' if request.dry_run else ''
-                self._logger.info(f'{prefix}Moved: {file_item.name} -> {dest_path}')
-                result.add_moved(file_item.path, dest_path)
-
-            except RuleNotFoundError as exc:
-                # other_behavior == 'raise' and no rule matched
-                self._logger.warning(f'No rule matched: {file_item.name} - {exc}')
-                result.add_error(file_item.path, str(exc))
-
-            except Exception as exc:
-                # One bad file must not stop the whole run
-                self._logger.error(f'Failed: {file_item.path} - {exc}')
-                result.add_error(file_item.path, str(exc))
+        # Duplicate path -> kept copy (its path is updated when the copy is moved)
+        duplicates: Dict[Path, FileItem] = {}
+        if dedup:
+            scanned = list(files)
+            # Classified up front: a file the rules skip is never a duplicate
+            # (nor a kept copy) - the policy only applies to files that would move
+            decisions = [self._classify(file_item, request) for file_item in scanned]
+            candidates = [
+                file_item
+                for file_item, decision in zip(scanned, decisions)
+                if decision is not None and not isinstance(decision, Exception)
+            ]
+            by_path = {file_item.path: file_item for file_item in candidates}
+            duplicates = {path: by_path[kept] for path, kept in self._finder.find(candidates).items()}  # type: ignore
+            self._logger.info(f'Duplicates: {len(duplicates)}')
+            files = iter(scanned)
+
+        # Final paths of files moved in this run. A recursive streaming scan may still
+        # reach a destination folder inside the source - those files must not be moved
+        # twice. Only then is the set kept (it grows with the run); a destination
+        # outside the source is never listed, and tree and table scans finish before
+        # the first move.
+        dest_base = request.dest_dir if request.dest_dir is not None else request.source_dir
+        track_moved = (
+            request.streaming
+            and source_dir is None
+            and not request.dry_run
+            and request.recursive
+            and (dest_base == request.source_dir or request.source_dir in dest_base.parents)
+        )
+        moved_paths: Set[Path] = set()
+
+        # Parallel moves: classification, logging and result recording stay on this
+        # thread; workers only run file_system.move(), which coordinates names per
+        # destination folder. At most window moves are in flight.
+        pool = None
+        pending: Deque[PendingMove] = deque()
+        window = request.jobs * _MOVES_PER_JOB
+        # Destination folders with moves in this run (streaming: see below)
+        dest_dirs: Set[Path] = set()
+        # (planning does no I/O worth a pool, and keeps the plan in scan order)
+        if request.jobs > 1 and self._plan is None:
+            pool = ThreadPoolExecutor(max_workers=request.jobs, thread_name_prefix='mover')
+        try:
+            for index, file_item in enumerate(files):
+                # A streamed file in one of our destination folders may be a move
+                # still in flight - collect those first so moved_paths is complete
+                if pending and track_moved and file_item.path.parent in dest_dirs:
+                    self._collect_moves(pending, 0, request, result, moved_paths, track_moved)
+                if file_item.path in moved_paths:
+                    continue
+                kept = duplicates.get(file_item.path)
+                if kept is not None:
+                    # The kept copy comes first in scan order - it is already organized
+                    # (or being moved: wait, so kept.path is its final location)
+                    self._collect_moves(pending, 0, request, result, moved_paths, track_moved)
+                    self._handle_duplicate(file_item, kept.path, request, result)
+                    continue
+                decision = decisions[index] if decisions is not None else _UNDECIDED
+                if pool is None:
+                    moved = self._organize_file(file_item, request, result, decision=decision)
+                    if moved and track_moved:
+                        moved_paths.add(file_item.path)
+                    continue
+                dest_path = self._plan_file(file_item, request, result, decision=decision)
+                if dest_path is None:
+                    continue
+                # Read the source path before the worker can update it
+                source_path = file_item.path
+                # Destination nodes are looked up here - workers only attach files to them
+                new_parent = self._dest_node(dest_path.parent, request)
+                future = pool.submit(self._move_file, file_item, dest_path, new_parent, request)
+                pending.append((future, file_item, source_path, dest_path))
+                dest_dirs.add(dest_path.parent)
+                self._collect_moves(pending, window, request, result, moved_paths, track_moved)
+            self._collect_moves(pending, 0, request, result, moved_paths, track_moved)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
 
         if request.clean_mode:
             self._logger.info('Clean mode: removing empty directories')
-            for directory in source_dir.walk_dirs():
+            for directory in source_dir.walk_dirs():  # type: ignore
                 if not list(directory.walk_files()):
                     try:
                         self._file_system.rmdir(directory, dry_run=request.dry_run)
@@ -129,12 +270,254 @@ class OrganizeFilesUseCase:
                     except Exception as exc:
                         self._logger.warning(f'Could not remove dir: {directory.path} - {exc}')
 
+        if self._plan is not None:
+            self._plan_repo.save(self._plan)  # type: ignore
+            self._logger.info(f'Plan saved: {len(self._plan)} moves')
+
         # Showing Summary of actions
         self._logger.info(
-            f'Done.  Moved: {len(result.moved)} |',
-            f'Skipped: {len(result.skipped)} | ',
-            f'Removed: {len(result.removed)} | ',
-            f'Errors: {len(result.errors)}',
+            f'Done.  Moved: {len(result.moved)} | '
+            f'Skipped: {len(result.skipped)} | '
+            f'Removed: {len(result.removed)} | '
+            f'Duplicates: {len(result.duplicates)} | '
+            f'Errors: {len(result.errors)}'
         )
 
         return result
+
+    def _build_request(self, config: AppConfig, rule_set: RuleSet) -> OrganizeRequest:
+        """Assemble the immutable OrganizeRequest from loaded config and rules."""
+        return OrganizeRequest(
+            source_dir=config.source_dir,  # type: ignore
+            dest_dir=config.dest_dir,
+            rule_set=rule_set,
+            # The plan phase never changes anything
+            dry_run=(config.dry_run or False) or self._plan_repo is not None,
+            recursive=config.recursive or False,
+            clean_mode=config.clean_mode or False,
+            streaming=config.streaming or False,
+            columnar=config.columnar or False,
+            dedup=config.dedup,
+            jobs=config.jobs or 1,
+            ignore_patterns=config.ignore_patterns or [],
+        )
+
+    def _organize_file(
+        self,
+        file_item: FileItem,
+        request: OrganizeRequest,
+        result: OrganizeResult,
+        skip_organized: bool = False,
+        decision: Any = _UNDECIDED,
+    ) -> bool:
+        """
+        Classify one file and move it into its folder.
+        Records the outcome in result and returns True if the file was moved.
+        One bad file must not stop the whole run, so errors are recorded, not raised.
+
+        skip_organized: leave a file alone (unrecorded) if it already sits in
+        its destination folder - used by watch mode, where our own moves come
+        back as events.
+        decision: folder (or classification error) already computed by a batch
+        classification (RuleSet.classify_columns, the dedup stage); by default
+        the RuleSet is asked here.
+        """
+        dest_path = self._plan_file(file_item, request, result, skip_organized, decision)
+        if dest_path is None:
+            return False
+        source_path = file_item.path
+        try:
+            dest_path = self._move_file(file_item, dest_path, self._dest_node(dest_path.parent, request), request)
+        except Exception as exc:
+            return self._record_move(file_item, source_path, dest_path, request, result, exc)
+        return self._record_move(file_item, source_path, dest_path, request, result)
+
+    def _plan_file(
+        self,
+        file_item: FileItem,
+        request: OrganizeRequest,
+        result: OrganizeResult,
+        skip_organized: bool = False,
+        decision: Any = _UNDECIDED,
+    ) -> Optional[Path]:
+        """
+        Classify one file and return its destination path, or None if it is not
+        moved - skipped, a duplicate or an error, already recorded in result.
+        """
+        try:
+            # Asking RuleSetter for folder name (unless a batch already did)
+            if decision is _UNDECIDED:
+                folder_name = request.rule_set.get_folder_name(file_item)
+            elif isinstance(decision, Exception):
+                raise decision
+            else:
+                folder_name = decision
+
+            # If folder name in ignore list or rule is to ignore those like folders
+            if folder_name is None:
+                self._logger.debug(f'Skipped: {file_item.name}')
+                result.add_skipped(file_item.path)
+                return None
+
+            # Build destination path: dest_dir/folder_name
+            base = request.dest_dir if request.dest_dir is not None else request.source_dir
+            dest_path = base / folder_name / file_item.name
+            source_path = file_item.path
+            if skip_organized and dest_path.parent == source_path.parent:
+                self._logger.debug(f'Already organized: {file_item.name}')
+                return None
+
+            # Same name already at the destination - with dedup, an identical file is a duplicate.
+            # An organized file in a recursive run without dest_dir is its own destination:
+            # never compare it with itself.
+            if (
+                request.dedup is not None
+                and self._finder is not None
+                and dest_path != source_path
+                and self._file_system.exists(dest_path)
+                and self._finder.same_content(source_path, dest_path)
+            ):
+                self._handle_duplicate(file_item, dest_path, request, result)
+                return None
+            return dest_path
+
+        except RuleNotFoundError as exc:
+            # other_behavior == 'raise' and no rule matched
+            self._logger.warning(f'No rule matched: {file_item.name} - {exc}')
+            result.add_error(file_item.path, str(exc))
+
+        except Exception as exc:
+            # One bad file must not stop the whole run
+            self._logger.error(f'Failed: {file_item.path} - {exc}')
+            result.add_error(file_item.path, str(exc))
+
+        return None
+
+    @staticmethod
+    def _classify(file_item: FileItem, request: OrganizeRequest) -> Any:
+        """Folder name of one file, or the error raised while classifying it (recorded later by _plan_file)."""
+        try:
+            return request.rule_set.get_folder_name(file_item)
+        except Exception as exc:
+            return exc
+
+    def _move_file(
+        self, file_item: FileItem, dest_path: Path, new_parent: Directory, request: OrganizeRequest
+    ) -> Path:
+        """
+        Move one file - the only step that runs on a worker thread with jobs > 1.
+        new_parent is the shared destination node, so file_system.move() can update the tree.
+        In the plan phase the final path is only reserved and added to the plan.
+        Returns the path to report: the reserved one in the plan phase, else dest_path.
+        """
+        if self._plan is not None:
+            final_path = self._file_system.reserve_name(dest_path)
+            self._plan.add(file_item.path, final_path)
+            return final_path
+
+        # move() handles dry_run internally - no physical move if dry_run=True
+        # move() also handles mkdir and name collision resolution
+        self._file_system.move(
+            file_item=file_item,
+            destination=dest_path,
+            new_parent=new_parent,
+            dry_run=request.dry_run,
+        )
+        return dest_path
+
+    def _dest_node(self, folder: Path, request: OrganizeRequest) -> Directory:
+        """
+        The Directory node of destination folder, created once per run.
+        Nodes hang off one root for the destination base, so files moved in
+        this run form a real tree (destination_tree) instead of one detached
+        Directory per file. Nodes are created on this thread only; a new node
+        is empty, so attaching it changes no size counter. Counter updates from
+        workers' moves and from lazy stats here are serialized by Directory.
+        """
+        node = self._dest_nodes.get(folder)
+        if node is not None:
+            return node
+        base = request.dest_dir if request.dest_dir is not None else request.source_dir
+        if folder == base or base not in folder.parents:
+            node = Directory(folder)
+            if folder == base:
+                self._dest_root = node
+        else:
+            node = Directory(folder, self._dest_node(folder.parent, request))
+        self._dest_nodes[folder] = node
+        return node
+
+    def _record_move(
+        self,
+        file_item: FileItem,
+        source_path: Path,
+        dest_path: Path,
+        request: OrganizeRequest,
+        result: OrganizeResult,
+        error: Optional[BaseException] = None,
+    ) -> bool:
+        """Log and record the outcome of one move; returns True if the file was moved."""
+        if error is not None:
+            # One bad file must not stop the whole run
+            self._logger.error(f'Failed: {source_path} - {error}')
+            result.add_error(source_path, str(error))
+            return False
+
+        # In dry_run we still record as moved - user wants to see what WOULD happen.
+        # OrganizeResult.dry_run=True already signals this was a simulation.
+        prefix = '[DRY RUN] ' if request.dry_run else ''
+        self._logger.info(f'{prefix}Moved: {file_item.name} -> {dest_path}')
+        result.add_moved(source_path, dest_path)
+        return True
+
+    def _collect_moves(
+        self,
+        pending: Deque[PendingMove],
+        keep: int,
+        request: OrganizeRequest,
+        result: OrganizeResult,
+        moved_paths: Set[Path],
+        track_moved: bool,
+    ) -> None:
+        """
+        Wait for the oldest pending moves, in submission order, until at most
+        keep are left, and record their outcomes.
+        """
+        while len(pending) > keep:
+            future, file_item, source_path, dest_path = pending.popleft()
+            error = future.exception()
+            moved = self._record_move(file_item, source_path, dest_path, request, result, error)
+            if moved and track_moved:
+                moved_paths.add(file_item.path)
+
+    def _handle_duplicate(
+        self,
+        file_item: FileItem,
+        original: Path,
+        request: OrganizeRequest,
+        result: OrganizeResult,
+    ) -> None:
+        """
+        Apply the dedup policy to a file whose content already exists at original:
+            skip     - leave it where it is
+            delete   - delete it
+            hardlink - leave it where it is, as a hard link to original (one copy on disk)
+            move     - move it to <dest>/Duplicates/
+        Records the outcome in result; errors are recorded, not raised.
+        """
+        source_path = file_item.path
+        prefix = '[DRY RUN] ' if request.dry_run else ''
+        try:
+            if request.dedup == 'delete':
+                self._file_system.remove(file_item, dry_run=request.dry_run)
+            elif request.dedup == 'hardlink':
+                self._file_system.replace_with_link(file_item, original, dry_run=request.dry_run)
+            elif request.dedup == 'move':
+                base = request.dest_dir if request.dest_dir is not None else request.source_dir
+                dest_path = base / 'Duplicates' / file_item.name
+                self._move_file(file_item, dest_path, self._dest_node(dest_path.parent, request), request)
+            self._logger.info(f'{prefix}Duplicate ({request.dedup}): {source_path} = {original}')
+            result.add_duplicate(source_path, original)
+        except Exception as exc:
+            self._logger.error(f'Failed: {source_path} - {exc}')
+            result.add_error(source_path, str(exc))
@@ -0,0 +1,89 @@
+from typing import Optional
+
+from ..ports import ConfigRepository, DuplicateFinder, RuleRepository, FileSystem, FileWatcher, Logger
+from ..dto import OrganizeResult
+from ...domain import Directory, FileItem
+from .organize_files import OrganizeFilesUseCase
+
+
+class WatchFilesUseCase(OrganizeFilesUseCase):
+    """
+    Long-running variant of OrganizeFilesUseCase.
+
+    Instead of scanning the source once, it organizes only the files the
+    FileWatcher reports as new. Config, rules and logger are loaded once and
+    reused for every event, so each new file costs one classification and one move.
+    Runs until the watcher stops or the user interrupts (Ctrl+C).
+    """
+
+    def __init__(
+        self,
+        config_repo: ConfigRepository,
+        rule_repo: RuleRepository,
+        file_system: FileSystem,
+        logger: Logger,
+        watcher: FileWatcher,
+        finder: Optional[DuplicateFinder] = None,
+    ) -> None:
+        super().__init__(config_repo, rule_repo, file_system, logger, finder=finder)
+        self._watcher = watcher
+
+    def execute(self) -> OrganizeResult:
+        """
+        Watch the source directory and organize files as they arrive.
+
+        Steps:
+            1. Load config and rules from repositories (once)
+            2. For every new file reported by the watcher:
+               get folder from RuleSet -> mkdir -> move
+            3. On stop/Ctrl+C return OrganizeResult with everything done so far
+        """
+        config = self._config_repo.load_config()
+        rule_set = self._rule_repo.load_rules()
+        request = self._build_request(config, rule_set)
+
+        result = OrganizeResult(
+            dry_run=request.dry_run,
+            clean_mode=False,
+            recursive=request.recursive,
+        )
+
+        self._logger.info('Watching for new files (Ctrl+C to stop)')
+        self._logger.info(f'Source    : {request.source_dir}')
+        self._logger.info(f'Dest      : {request.dest_dir}')
+        self._logger.info(f'Dry run   : {request.dry_run}')
+        self._logger.info(f'Recursive : {request.recursive}')
+
+        events = self._watcher.watch(
+            path=request.source_dir,
+            recursive=request.recursive,
+            ignore_patterns=request.ignore_patterns,
+        )
+        # One detached Directory per source folder, shared by all its events
+        parents = {}
+        try:
+            for path in events:
+                if not self._file_system.is_file(path):
+                    # Gone again before we got to it (temp files, our own moves)
+                    continue
+                parent = parents.get(path.parent)
+                if parent is None:
+                    parent = parents[path.parent] = Directory(path.parent)
+                file_item = FileItem(path, parent)
+                # Our own moves into watched folders come back as events - skip those
+                self._organize_file(file_item, request, result, skip_organized=True)
+                # Detach it from wherever it is now (source folder or shared destination
+                # node), so nodes do not grow and a later file may reuse the name
+                if file_item.parent is not None:
+                    file_item.parent.del_child(file_item)
+        except KeyboardInterrupt:
+            self._logger.info('Watch interrupted')
+        finally:
+            self._watcher.stop()
+
+        self._logger.info(
+            f'Stopped.  Moved: {len(result.moved)} | '
+            f'Skipped: {len(result.skipped)} | '
+            f'Errors: {len(result.errors)}'
+        )
+        return result
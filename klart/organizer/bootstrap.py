@@ -37,12 +37,13 @@ Rule: a field from layer replaces the same field from lower
 layer only if the higher value is not None
 """
 
+import os
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, List
 
 # Application layer - config data class and port interface only
-from .application import AppConfig, OrganizeFilesUseCase, OrganizeResult
+from .application import AppConfig, ApplyPlanUseCase, OrganizeFilesUseCase, OrganizeResult, WatchFilesUseCase
 
 # Infrastructure layer - concrete adapters that implement the ports
 from .infrastructure import (
@@ -50,10 +51,16 @@ from .infrastructure import (
     JsonConfigRepository,
     InMemoryRuleRepository,
     JsonRuleRepository,
+    JsonPlanRepository,
     InMemoryStyleRepository,
     JsonStyleRepository,
     LoguruLogger,
     OSFileSystem,
+    InotifyWatcher,
+    PollingWatcher,
+    ScanIndex,
+    ThreadedContentSniffer,
+    HashingDuplicateFinder,
 )
 
 # Excpetions
@@ -65,6 +72,11 @@ _DEFAULT_CONFIG_PATH: Path = Path(__file__).parent / 'data' / 'config.json'
 _DEFAULT_RULES_PATH: Path = Path(__file__).parent / 'data' / 'rules.json'
 _DEFAULT_STYLES_PATH: Path = Path(__file__).parent / 'data' / 'styles.json'
 
+# Per-user cache for the persistent scan index (honours XDG_CACHE_HOME)
+_DEFAULT_SCAN_INDEX_PATH: Path = (
+    Path(os.environ.get('XDG_CACHE_HOME') or '~/.cache').expanduser() / 'klart' / 'scan_index.json'
+)
+
 # class ConfigOverrides
 
 
@@ -100,15 +112,28 @@ class ConfigOverrides:
         rules_file: Optional[Union[Path, str]] = None,
         styles_file: Optional[Union[Path, str]] = None,
         log_file: Optional[Union[Path, str]] = None,
+        # Plan/apply mode: write a move plan instead of moving, or apply a saved one
+        plan_out: Optional[Union[Path, str]] = None,
+        apply_plan: Optional[Union[Path, str]] = None,
         # Config overrides
         rules_cfg: Optional[Dict[str, Any]] = None,
         styles_cfg: Optional[Dict[str, Any]] = None,
         # Ignore patterns
         ignore_patterns: Optional[List[str]] = None,
+        # Duplicate handling policy
+        dedup: Optional[str] = None,
+        # Scanner tuning
+        scan_workers: Optional[int] = None,
+        scan_index: Optional[bool] = None,
+        # Parallel moves
+        jobs: Optional[int] = None,
         # Booleans
         dry_run: Optional[bool] = None,
         recursive: Optional[bool] = None,
         clean_mode: Optional[bool] = None,
+        streaming: Optional[bool] = None,
+        watch: Optional[bool] = None,
+        columnar: Optional[bool] = None,
         rules_combine: Optional[bool] = None,
         styles_combine: Optional[bool] = None,
         # Logging level overrides
@@ -123,12 +148,21 @@ class ConfigOverrides:
         self.rules_file = rules_file
         self.styles_file = styles_file
         self.log_file = log_file
+        self.plan_out = plan_out
+        self.apply_plan = apply_plan
         self.rules_cfg = rules_cfg
         self.styles_cfg = styles_cfg
         self.ignore_patterns = ignore_patterns
+        self.dedup = dedup
+        self.scan_workers = scan_workers
+        self.jobs = jobs
+        self.scan_index = scan_index
         self.dry_run = dry_run
         self.recursive = recursive
         self.clean_mode = clean_mode
+        self.streaming = streaming
+        self.watch = watch
+        self.columnar = columnar
         self.rules_combine = rules_combine
         self.styles_combine = styles_combine
         self.console_level = console_level
@@ -239,11 +273,19 @@ def _build_config(overrides: ConfigOverrides) -> AppConfig:
 
     # Ignore patterns
     ignore_patterns = overrides.ignore_patterns if overrides.ignore_patterns is not None else base.ignore_patterns
+    # Numbers: `is not None` as well, keeps the check uniform with booleans
+    scan_workers = overrides.scan_workers if overrides.scan_workers is not None else base.scan_workers
+    jobs = overrides.jobs if overrides.jobs is not None else base.jobs
+    dedup = overrides.dedup if overrides.dedup is not None else base.dedup
     # Booleans: MUST use `is not None` - False is a valid explicit override
     # `False or base.dry_run` would incorrectly discard an explicit False
     dry_run = overrides.dry_run if overrides.dry_run is not None else base.dry_run
     recursive = overrides.recursive if overrides.recursive is not None else base.recursive
+    scan_index = overrides.scan_index if overrides.scan_index is not None else base.scan_index
     clean_mode = overrides.clean_mode if overrides.clean_mode is not None else base.clean_mode
+    streaming = overrides.streaming if overrides.streaming is not None else base.streaming
+    watch = overrides.watch if overrides.watch is not None else base.watch
+    columnar = overrides.columnar if overrides.columnar is not None else base.columnar
     rules_combine = overrides.rules_combine if overrides.rules_combine is not None else base.rules_combine
     styles_combine = overrides.styles_combine if overrides.styles_combine is not None else base.styles_combine
 
@@ -256,8 +298,8 @@ def _build_config(overrides: ConfigOverrides) -> AppConfig:
         file_level=overrides.file_level,
     )
 
-    # Validation
-    if source_dir is None:
+    # Validation (applying a plan takes its paths from the plan)
+    if source_dir is None and overrides.apply_plan is None:
         raise ConfigValidationError(
             'source_dir is required but was not found in any config layer.\n'
             'Provide it via:\n'
@@ -267,6 +309,13 @@ def _build_config(overrides: ConfigOverrides) -> AppConfig:
             '  • GUI source directory widget'
         )
 
+    # A plan holds moves only - deleting or linking duplicates could not be applied later
+    if overrides.plan_out is not None and dedup in ('delete', 'hardlink'):
+        raise ConfigValidationError(
+            f'dedup policy {dedup!r} cannot be planned: --plan-out records moves only.\n'
+            'Use --dedup skip or --dedup move with --plan-out.'
+        )
+
     # Retruning completely builded(merged/overrided) config AppConfig
     return AppConfig(
         source_dir=source_dir,
@@ -274,7 +323,14 @@ def _build_config(overrides: ConfigOverrides) -> AppConfig:
         dry_run=dry_run,
         recursive=recursive,
         clean_mode=clean_mode,
+        streaming=streaming,
+        watch=watch,
+        columnar=columnar,
+        dedup=dedup,
         ignore_patterns=ignore_patterns,
+        scan_workers=scan_workers,
+        jobs=jobs,
+        scan_index=scan_index,
         rules_file=rules_file,
         rules_cfg=rules_cfg,
         rules_combine=rules_combine,
@@ -302,7 +358,10 @@ def bootstrap(overrides: ConfigOverrides) -> OrganizeResult:
         4. Pick rstyles adapters    --> StyleRepository(InMemoryRepository)
         5. Build Styleset + Logger  --> Logger(right now only LoguruLogger)
         6. Build FileSystem adapter --> FileSystem(right now only OSFileSystem)
-        7. Run use case
+        7. Run use case             --> one-shot organize, or watch mode
+                                        (FileWatcher: inotify, polling fallback)
+                                        (ContentSniffer: threaded header reads)
+                                        or plan/apply mode (JsonPlanRepository)
     """
 
     # 1. Final Merged config
@@ -362,15 +421,52 @@ def bootstrap(overrides: ConfigOverrides) -> OrganizeResult:
     logger = LoguruLogger(logging_cfg, style_set)
 
     # 6. FileSystem adapter
-    file_system = OSFileSystem()
+    scan_index = ScanIndex(_DEFAULT_SCAN_INDEX_PATH) if config.scan_index else None
+    file_system = OSFileSystem(scan_workers=config.scan_workers or 1, scan_index=scan_index)
+
+    # Duplicate detection only when a dedup policy is set
+    finder = HashingDuplicateFinder() if config.dedup else None
 
     # 7. Run Use Case
-    use_case = OrganizeFilesUseCase(
-        file_system=file_system,
-        rule_repo=rule_repo,
-        config_repo=config_repo,
-        logger=logger,
-    )
+    # Plan/apply mode takes precedence over watch mode
+    if overrides.apply_plan is not None:
+        use_case = ApplyPlanUseCase(
+            config_repo=config_repo,
+            plan_repo=JsonPlanRepository(_resolve(overrides.apply_plan)),  # type: ignore
+            file_system=file_system,
+            logger=logger,
+        )
+    elif overrides.plan_out is not None:
+        use_case = OrganizeFilesUseCase(
+            file_system=file_system,
+            rule_repo=rule_repo,
+            config_repo=config_repo,
+            logger=logger,
+            sniffer=ThreadedContentSniffer(),
+            finder=finder,
+            plan_repo=JsonPlanRepository(_resolve(overrides.plan_out)),  # type: ignore
+        )
+    elif config.watch:
+        # inotify on Linux, otherwise fall back to polling the source tree
+        watcher = InotifyWatcher() if InotifyWatcher.available() else PollingWatcher()
+        use_case = WatchFilesUseCase(
+            file_system=file_system,
+            rule_repo=rule_repo,
+            config_repo=config_repo,
+            logger=logger,
+            watcher=watcher,
+            finder=finder,
+        )
+    else:
+        use_case = OrganizeFilesUseCase(
+            file_system=file_system,
+            rule_repo=rule_repo,
+            config_repo=config_repo,
+            logger=logger,
+            # Only used when some rule looks at file content
+            sniffer=ThreadedContentSniffer(),
+            finder=finder,
+        )
 
     result = use_case.execute()
 
@@ -1,18 +1,29 @@
-from .entities import FileItem, Directory
+from .entities import FileItem, Directory, FileTable
 from .rules import (
     Rule,
     ExtensionRule,
     SizeRule,
+    NameRule,
+    DateRule,
+    ContentRule,
     CompositeRule,
     RuleSet,
+    SizeIndex,
+    NamePatternMatcher,
 )
 
 __all__ = [
     'FileItem',
     'Directory',
+    'FileTable',
     'Rule',
     'ExtensionRule',
     'SizeRule',
+    'NameRule',
+    'DateRule',
+    'ContentRule',
     'CompositeRule',
     'RuleSet',
+    'SizeIndex',
+    'NamePatternMatcher',
 ]
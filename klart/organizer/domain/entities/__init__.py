@@ -1,4 +1,5 @@
 from .directory import Directory
 from .file_item import FileItem
+from .file_table import FileTable
 
-__all__ = ['Directory', 'FileItem']
+__all__ = ['Directory', 'FileItem', 'FileTable']
@@ -1,19 +1,33 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Union, Optional, Generator, Dict
+from threading import Lock
+from typing import List, Union, Optional, Generator, Dict, Iterator, Tuple
 
 # File model
 from .file_item import FileItem
 
+# Size counters are shared by every ancestor: one delta at a time, tree-wide
+_SIZE_LOCK = Lock()
+
 
 class Directory:
     """
     Represents a directory in the file system.
     Can contain files (FileItem) and subdirectories (Directory).
     Maintains a tree structure via parent/child references.
+    Children are kept in an insertion-ordered dict keyed by name,
+    so lookups, adds and removals are O(1).
+
+    Subtree size is kept up to date incrementally: every add, remove or
+    stat fetch pushes a delta to all ancestors, so a change costs O(depth).
+    Deltas are applied under one lock for all trees, so a lazy stat on one
+    thread and a move on another never lose a counter update. Changes to the
+    children themselves are not locked - callers moving files on several
+    threads serialize them (OSFileSystem does).
     """
 
-    __slots__ = ('_path', '_children', '_parent', '_size_cache')
+    __slots__ = ('_path', '_children', '_parent', '_size_total', '_size_pending', '_size_missing', '_size_batch')
 
     def __init__(self, path: Union[Path, str], parent: Optional[Directory] = None):
         """
@@ -26,9 +40,13 @@ class Directory:
         if not isinstance(path, Path):
             path = Path(path)
         object.__setattr__(self, '_path', path)
-        object.__setattr__(self, '_children', [])
+        object.__setattr__(self, '_children', {})  # name -> FileItem | Directory
         object.__setattr__(self, '_parent', parent)
-        object.__setattr__(self, '_size_cache', None)  # lazy cache for total size
+        # Subtree size counters: known bytes, files not stat-ed yet, files whose stat failed
+        object.__setattr__(self, '_size_total', 0)
+        object.__setattr__(self, '_size_pending', 0)
+        object.__setattr__(self, '_size_missing', 0)
+        object.__setattr__(self, '_size_batch', None)  # delta held back by batch()
         if parent:
             parent.add_child(self)
 
@@ -50,7 +68,7 @@ class Directory:
     @property
     def children(self) -> List[Union[FileItem, Directory]]:
         """Return a copy of children list to prevent external mutation."""
-        return self._children.copy()
+        return list(self._children.values())
 
     def remove_from_parent(self) -> None:
         """
@@ -62,49 +80,58 @@ class Directory:
             object.__setattr__(self, '_parent', None)
 
     def add_child(self, child: Union[FileItem, Directory]) -> None:
-        """Add a child (file or subdirectory) to this directory."""
-        self._children.append(child)
-        # Invalidate size cache because total size may have changed
-        object.__setattr__(self, '_size_cache', None)
+        """
+        Add a child (file or subdirectory) to this directory.
+        Adding the same object again is a no-op. Another child with that name
+        is stale (e.g. its file was removed on disk and the name reused) - it
+        is replaced and detached.
+        """
+        existing = self._children.get(child.name)
+        if existing is child:
+            return
+        if existing is not None:
+            self.del_child(existing)
+            object.__setattr__(existing, '_parent', None)
+        self._children[child.name] = child
+        self._propagate_size(*child._size_state())
 
     def del_child(self, child: Union[FileItem, Directory]) -> bool:
         """
         Remove a child from the children list.
         Returns True if the child was found and removed, False otherwise.
         """
-        for i, c in enumerate(self._children):
-            if c is child:
-                del self._children[i]
-                object.__setattr__(self, '_size_cache', None)
-                return True
-        return False
+        if self._children.get(child.name) is not child:
+            return False
+        del self._children[child.name]
+        size_bytes, pending, missing = child._size_state()
+        self._propagate_size(-size_bytes, -pending, -missing)
+        return True
 
     def get_child(self, name: str) -> Optional[Union[FileItem, Directory]]:
         """
         Find a direct child by its name (either file name or directory name).
         Returns None if not found.
         """
-        for child in self._children:
-            if child.name == name:
-                return child
-        return None
+        return self._children.get(name)
 
     def find(self, name: str, recursive: bool = False) -> Optional[Union[FileItem, Directory]]:
         """
         Find a file or directory by name. If recursive=False, search only direct children.
-        If recursive=True, search recursively.
+        If recursive=True, search the whole tree (pre-order, explicit stack).
         Returns the first matching entity or None.
         """
         if not recursive:
             return self.get_child(name)
-        # Recursive search
-        for child in self._children:
+        stack = [iter(self._children.values())]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
             if child.name == name:
                 return child
             if isinstance(child, Directory):
-                result = child.find(name, recursive=True)
-                if result is not None:
-                    return result
+                stack.append(iter(child._children.values()))
         return None
 
     def find_all(self, name: str) -> Dict[Directory, Union[FileItem, Directory]]:
@@ -113,11 +140,17 @@ class Directory:
         Returns a dictionary mapping parent directory to the found entity.
         """
         results = {}
-        for child in self._children:
+        stack = [(self, iter(self._children.values()))]
+        while stack:
+            directory, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                continue
             if child.name == name:
-                results[self] = child
+                results[directory] = child
             if isinstance(child, Directory):
-                results.update(child.find_all(name))
+                stack.append((child, iter(child._children.values())))
         return results
 
     def is_empty(self) -> bool:
@@ -126,50 +159,107 @@ class Directory:
 
     def walk_files(self) -> Generator[FileItem, None, None]:
         """
-        Recursively yield all FileItem objects in this directory tree.
+        Yield all FileItem objects in this directory tree (pre-order).
+        Uses an explicit stack, so tree depth is not limited by the recursion limit.
         """
-        # Using copy of childrens list to not raise MUTATION DURING ITERATION
-        for child in self._children.copy():
-            if isinstance(child, FileItem):
+        # Each directory is snapshotted once when entered - callers move files
+        # out of their parent while the walk is suspended
+        stack = [iter(tuple(self._children.values()))]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            elif isinstance(child, FileItem):
                 yield child
-            elif isinstance(child, Directory):
-                yield from child.walk_files()
+            else:
+                stack.append(iter(tuple(child._children.values())))
 
     def walk_dirs(self) -> Generator[Directory, None, None]:
         """
-        Recursively yield all Directory objetcs in this directory tree.
+        Yield all Directory objects in this directory tree (self excluded).
         Deepest directories come first (post-order) - safe deletion
         """
-        for child in self._children.copy():
-            if isinstance(child, Directory):
-                yield from child.walk_dirs()
-                yield child
+        stack = [(self, iter(self._subdirs()))]
+        while stack:
+            directory, subdirs = stack[-1]
+            child = next(subdirs, None)
+            if child is not None:
+                stack.append((child, iter(child._subdirs())))
+                continue
+            stack.pop()
+            if directory is not self:
+                yield directory
+
+    def _subdirs(self) -> tuple:
+        """Snapshot of the direct subdirectories (they may be removed during walk_dirs)."""
+        return tuple(c for c in self._children.values() if isinstance(c, Directory))
 
     @property
     def size(self) -> Optional[int]:
         """
         Total size of all files in this directory and its subdirectories (bytes).
-        Cached after first calculation; cache is invalidated when children change.
+        Kept up to date on every change; files not stat-ed yet are fetched first.
         Returns None if any file size is unavailable.
         """
-        if self._size_cache is None:
-            total = 0
-            for child in self._children:
+        if self._size_pending:
+            self._fetch_pending_sizes()
+        if self._size_missing:
+            # If one file size is unavailable, total size is unknown
+            return None
+        return self._size_total
+
+    @contextmanager
+    def batch(self) -> Iterator[Directory]:
+        """
+        Hold back size propagation to ancestors while many children are added
+        or removed here, then push the summed delta up once on exit.
+        Used by the scanner: O(children + depth) per directory instead of O(children * depth).
+        """
+        if self._size_batch is not None:
+            yield self
+            return
+        object.__setattr__(self, '_size_batch', [0, 0, 0])
+        try:
+            yield self
+        finally:
+            size_bytes, pending, missing = self._size_batch
+            object.__setattr__(self, '_size_batch', None)
+            if self._parent is not None:
+                self._parent._propagate_size(size_bytes, pending, missing)
+
+    def _size_state(self) -> Tuple[int, int, int]:
+        """This subtree's share of its ancestors' size counters: (bytes, pending, missing)."""
+        return self._size_total, self._size_pending, self._size_missing
+
+    def _propagate_size(self, size_bytes: int, pending: int, missing: int) -> None:
+        """Apply a size delta to this directory and every ancestor (stops at an open batch())."""
+        if not (size_bytes or pending or missing):
+            return
+        node: Optional[Directory] = self
+        with _SIZE_LOCK:
+            while node is not None:
+                object.__setattr__(node, '_size_total', node._size_total + size_bytes)
+                object.__setattr__(node, '_size_pending', node._size_pending + pending)
+                object.__setattr__(node, '_size_missing', node._size_missing + missing)
+                batch = node._size_batch
+                if batch is not None:
+                    batch[0] += size_bytes
+                    batch[1] += pending
+                    batch[2] += missing
+                    return
+                node = node._parent
+
+    def _fetch_pending_sizes(self) -> None:
+        """Stat every file in the subtree that was never stat-ed, skipping complete subtrees."""
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            for child in tuple(directory._children.values()):
                 if isinstance(child, FileItem):
-                    child_size = child.size
-                    if child_size is None:
-                        # If one file size is unavailable, total size is unknown
-                        object.__setattr__(self, '_size_cache', None)
-                        return None
-                    total += child_size
-                elif isinstance(child, Directory):
-                    child_size = child.size
-                    if child_size is None:
-                        object.__setattr__(self, '_size_cache', None)
-                        return None
-                    total += child_size
-            object.__setattr__(self, '_size_cache', total)
-        return self._size_cache
+                    if not child._stat_fetched:
+                        child._fetch_stat()
+                elif child._size_pending:
+                    stack.append(child)
 
     def __repr__(self) -> str:
         return f'Directory(name={self.name}, children={len(self._children)})'
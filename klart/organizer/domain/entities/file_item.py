@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Optional, Union, TYPE_CHECKING
+from typing import Optional, Tuple, Union, TYPE_CHECKING
 
 # type checking for file model to handle cycle error
 if TYPE_CHECKING:
@@ -12,13 +12,39 @@ class FileItem:
     """
     Represents a single file in the file system.
     Contains only file metadata and a reference to its parent directory.
-    Size is fetched lazily from the filesystem when first accessed.
+    Stat data (size, mtime, ctime, inode) can be handed over by the scanner;
+    otherwise it is fetched lazily from the filesystem when first accessed.
+    The same goes for the first HEADER_SIZE bytes of content (header), which a
+    prefetcher can hand over with provide_header().
     This class is intentionally kept free of business logic related to sorting or moving.
     """
 
-    __slots__ = ('_path', '_name', '_parent', '_stem', '_suffix', '_size', '_size_fetched')
-
-    def __init__(self, path: Union[Path, str], parent: Directory):
+    __slots__ = (
+        '_path',
+        '_name',
+        '_parent',
+        '_stem',
+        '_suffix',
+        '_size',
+        '_mtime',
+        '_ctime',
+        '_inode',
+        '_stat_fetched',
+        '_header',
+    )
+
+    # Bytes of content read for type detection (magic numbers)
+    HEADER_SIZE = 64
+
+    def __init__(
+        self,
+        path: Union[Path, str],
+        parent: Directory,
+        size: Optional[int] = None,
+        mtime: Optional[float] = None,
+        inode: Optional[int] = None,
+        ctime: Optional[float] = None,
+    ):
         """
         Initialize a FileItem.
 
@@ -26,13 +52,23 @@ class FileItem:
             path: Absolute or relative path to the file.
             parent: The Directory object that contains this file.
                    The parent must already have this file as a child.
+            size: File size already known by the caller (e.g. from os.scandir).
+            mtime: Modification time already known by the caller.
+            inode: Inode number already known by the caller.
+            ctime: Status change (Unix) / creation (Windows) time already known by the caller.
+                   If size is given, the stat data is treated as fetched
+                   and no extra stat() call is made later.
         """
         # Use object.__setattr__ to bypass any potential __setattr__ override
         # and to keep immutability of most attributes.
         object.__setattr__(self, '_path', path)
         object.__setattr__(self, '_parent', parent)
-        object.__setattr__(self, '_size', None)
-        object.__setattr__(self, '_size_fetched', False)
+        object.__setattr__(self, '_size', size)
+        object.__setattr__(self, '_mtime', mtime)
+        object.__setattr__(self, '_inode', inode)
+        object.__setattr__(self, '_ctime', ctime)
+        object.__setattr__(self, '_stat_fetched', size is not None)
+        object.__setattr__(self, '_header', None)
         self._post_init()
         # Automatically register with parent directory
         parent.add_child(self)
@@ -51,6 +87,13 @@ class FileItem:
         if self._name != expected_name:
             object.__setattr__(self, '_name', expected_name)
 
+    @staticmethod
+    def suffix_of(name: str) -> str:
+        """Suffix of a file name by the same rule as Path.suffix, without building a Path."""
+        # '.bashrc' and 'name.' have no suffix
+        dot = name.rfind('.')
+        return name[dot:] if 0 < dot < len(name) - 1 else ''
+
     @property
     def path(self) -> Path:
         """Full path of the file."""
@@ -76,20 +119,89 @@ class FileItem:
         """File extension including the dot."""
         return self._suffix
 
+    def _size_state(self) -> Tuple[int, int, int]:
+        """
+        This file's share of its ancestors' size counters: (bytes, pending, missing).
+        pending - stat not fetched yet, missing - stat failed (size unknown).
+        """
+        if not self._stat_fetched:
+            return 0, 1, 0
+        if self._size is None:
+            return 0, 0, 1
+        return self._size, 0, 0
+
+    def _fetch_stat(self) -> None:
+        """
+        Load size, mtime, ctime and inode with a single stat() call.
+        The size change is pushed to every ancestor directory (safe next to moves
+        on other threads - Directory serializes counter updates).
+        """
+        old_bytes, old_pending, old_missing = self._size_state()
+        try:
+            stat = self._path.stat()
+            object.__setattr__(self, '_size', stat.st_size)
+            object.__setattr__(self, '_mtime', stat.st_mtime)
+            object.__setattr__(self, '_ctime', stat.st_ctime)
+            object.__setattr__(self, '_inode', stat.st_ino)
+        except OSError:
+            object.__setattr__(self, '_size', None)
+            object.__setattr__(self, '_mtime', None)
+            object.__setattr__(self, '_ctime', None)
+            object.__setattr__(self, '_inode', None)
+        object.__setattr__(self, '_stat_fetched', True)
+        if self._parent is not None:
+            new_bytes, new_pending, new_missing = self._size_state()
+            self._parent._propagate_size(new_bytes - old_bytes, new_pending - old_pending, new_missing - old_missing)
+
     @property
     def size(self) -> Optional[int]:
         """
-        File size in bytes. Fetched lazily from the filesystem on first access.
+        File size in bytes. Taken from scan data or fetched lazily on first access.
         Returns None if the file cannot be accessed (e.g., permission denied).
         """
-        if not self._size_fetched:
+        if not self._stat_fetched:
+            self._fetch_stat()
+        return self._size
+
+    @property
+    def mtime(self) -> Optional[float]:
+        """Last modification time (seconds since epoch), or None if unavailable."""
+        if not self._stat_fetched:
+            self._fetch_stat()
+        return self._mtime
+
+    @property
+    def ctime(self) -> Optional[float]:
+        """Status change time on Unix, creation time on Windows (st_ctime), or None if unavailable."""
+        if not self._stat_fetched:
+            self._fetch_stat()
+        return self._ctime
+
+    @property
+    def inode(self) -> Optional[int]:
+        """Inode number of the file, or None if unavailable."""
+        if not self._stat_fetched:
+            self._fetch_stat()
+        return self._inode
+
+    @property
+    def header(self) -> bytes:
+        """
+        First HEADER_SIZE bytes of the file (fewer for small files), read on
+        first access unless handed over. Empty if the file cannot be read.
+        """
+        if self._header is None:
             try:
-                stat = self._path.stat()
-                object.__setattr__(self, '_size', stat.st_size)
+                with open(self._path, 'rb') as file:
+                    header = file.read(self.HEADER_SIZE)
             except OSError:
-                object.__setattr__(self, '_size', None)
-            object.__setattr__(self, '_size_fetched', True)
-        return self._size
+                header = b''
+            object.__setattr__(self, '_header', header)
+        return self._header  # type: ignore
+
+    def provide_header(self, header: bytes) -> None:
+        """Hand over a header read elsewhere (e.g. by a prefetcher), so header does no I/O."""
+        object.__setattr__(self, '_header', bytes(header[: self.HEADER_SIZE]))
 
     def update_location(self, new_path: Path, new_parent: Directory) -> None:
         """
@@ -100,6 +212,9 @@ class FileItem:
         Args:
             new_path: The new absolute path after the move.
             new_parent: The new parent Directory object.
+
+        A stale child of new_parent with the same name (its file is gone, the
+        name was reused) is replaced.
         """
         # Remove from old parent
         if self._parent:
@@ -111,11 +226,14 @@ class FileItem:
         object.__setattr__(self, '_name', new_path.name)
         object.__setattr__(self, '_stem', new_path.stem)
         object.__setattr__(self, '_suffix', new_path.suffix)
+        # Invalidate stat cache (file may have changed) before the new parent counts it
+        object.__setattr__(self, '_size', None)
+        object.__setattr__(self, '_mtime', None)
+        object.__setattr__(self, '_ctime', None)
+        object.__setattr__(self, '_inode', None)
+        object.__setattr__(self, '_stat_fetched', False)
         # Add to new parent
         new_parent.add_child(self)
-        # Invalidate size cache (file may have changed)
-        object.__setattr__(self, '_size', None)
-        object.__setattr__(self, '_size_fetched', False)
 
     def __repr__(self) -> str:
         return f'FileItem(name={self.name})'
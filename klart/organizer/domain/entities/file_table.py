@@ -0,0 +1,181 @@
+from __future__ import annotations
+import math
+import os
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+# File models
+from .directory import Directory
+from .file_item import FileItem
+
+
+class FileTable:
+    """
+    Compact, column-oriented list of scanned files.
+
+    Instead of one FileItem (Path, name, stem, suffix, parent...) per file,
+    every attribute lives in its own flat buffer:
+        dir_ids   - index into the interned directory list
+        names     - one bytes blob + end offsets (fs-encoded, no per-file str)
+        suffixes  - code into the interned suffix list
+        sizes     - bytes, -1 if unknown
+        mtimes    - seconds since epoch, NaN if unknown
+        ctimes    - st_ctime, NaN if unknown
+    That is ~40 bytes per file plus the encoded name. FileItem views are
+    created on demand by view()/views() and can be dropped right after use.
+    """
+
+    __slots__ = (
+        '_dirs',
+        '_dir_codes',
+        '_suffixes',
+        '_suffix_codes',
+        '_dir_ids',
+        '_names',
+        '_name_ends',
+        '_suffix_ids',
+        '_sizes',
+        '_mtimes',
+        '_ctimes',
+    )
+
+    def __init__(self) -> None:
+        # Interned directories and suffixes: id -> value and value -> id
+        self._dirs: List[Path] = []
+        self._dir_codes: Dict[Path, int] = {}
+        self._suffixes: List[str] = []
+        self._suffix_codes: Dict[str, int] = {}
+        # One entry per file
+        self._dir_ids = array('I')
+        self._names = bytearray()
+        self._name_ends = array('Q')
+        self._suffix_ids = array('I')
+        self._sizes = array('q')
+        self._mtimes = array('d')
+        self._ctimes = array('d')
+
+    @classmethod
+    def from_files(cls, files: Iterable[FileItem]) -> FileTable:
+        """Build a table from existing FileItems (e.g. Directory.walk_files())."""
+        table = cls()
+        for file_item in files:
+            dir_id = table.add_dir(file_item.path.parent)
+            table.append(dir_id, file_item.name, file_item.size, file_item.mtime, file_item.ctime)
+        return table
+
+    def add_dir(self, path: Union[Path, str]) -> int:
+        """Intern a directory path and return its id (same path -> same id)."""
+        if not isinstance(path, Path):
+            path = Path(path)
+        dir_id = self._dir_codes.get(path)
+        if dir_id is None:
+            dir_id = self._dir_codes[path] = len(self._dirs)
+            self._dirs.append(path)
+        return dir_id
+
+    def append(
+        self,
+        dir_id: int,
+        name: str,
+        size: Optional[int] = None,
+        mtime: Optional[float] = None,
+        ctime: Optional[float] = None,
+    ) -> None:
+        """Add one file of the directory dir_id (from add_dir())."""
+        suffix = FileItem.suffix_of(name)
+        suffix_id = self._suffix_codes.get(suffix)
+        if suffix_id is None:
+            suffix_id = self._suffix_codes[suffix] = len(self._suffixes)
+            self._suffixes.append(suffix)
+        self._dir_ids.append(dir_id)
+        self._names += os.fsencode(name)
+        self._name_ends.append(len(self._names))
+        self._suffix_ids.append(suffix_id)
+        self._sizes.append(-1 if size is None else size)
+        self._mtimes.append(math.nan if mtime is None else mtime)
+        self._ctimes.append(math.nan if ctime is None else ctime)
+
+    def __len__(self) -> int:
+        return len(self._dir_ids)
+
+    # ── Column access ────────────────────────────────────────────────────────
+
+    def name(self, index: int) -> str:
+        """File name of row index."""
+        start = self._name_ends[index - 1] if index else 0
+        return os.fsdecode(bytes(self._names[start : self._name_ends[index]]))
+
+    def dir_path(self, index: int) -> Path:
+        """Parent directory path of row index."""
+        return self._dirs[self._dir_ids[index]]
+
+    def path(self, index: int) -> Path:
+        """Full path of row index."""
+        return self.dir_path(index) / self.name(index)
+
+    def suffix(self, index: int) -> str:
+        """Extension of row index, including the dot."""
+        return self._suffixes[self._suffix_ids[index]]
+
+    def size(self, index: int) -> Optional[int]:
+        """Size of row index in bytes, or None if the scan had no stat data."""
+        size = self._sizes[index]
+        return None if size < 0 else size
+
+    def mtime(self, index: int) -> Optional[float]:
+        """Modification time of row index, or None if the scan had no stat data."""
+        mtime = self._mtimes[index]
+        return None if math.isnan(mtime) else mtime
+
+    def ctime(self, index: int) -> Optional[float]:
+        """Status change / creation time of row index, or None if the scan had no stat data."""
+        ctime = self._ctimes[index]
+        return None if math.isnan(ctime) else ctime
+
+    @property
+    def suffixes(self) -> List[str]:
+        """Interned suffixes; suffix_ids holds an index into this list per row."""
+        return list(self._suffixes)
+
+    @property
+    def suffix_ids(self) -> array:
+        """Suffix code per row (read-only by convention)."""
+        return self._suffix_ids
+
+    @property
+    def sizes(self) -> array:
+        """Size per row, -1 when unknown (read-only by convention)."""
+        return self._sizes
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-file buffers (interned dirs/suffixes excluded)."""
+        columns = (self._dir_ids, self._name_ends, self._suffix_ids, self._sizes, self._mtimes, self._ctimes)
+        return len(self._names) + sum(column.itemsize * len(column) for column in columns)
+
+    # ── FileItem views ───────────────────────────────────────────────────────
+
+    def view(self, index: int, parent: Optional[Directory] = None) -> FileItem:
+        """
+        Materialize row index as a FileItem (the table keeps no inode - the view reports None).
+        Without parent a detached Directory is created for it, so the view
+        does not keep any other row alive.
+        """
+        if parent is None:
+            parent = Directory(self.dir_path(index))
+        return FileItem(
+            parent.path / self.name(index),
+            parent,
+            size=self.size(index),
+            mtime=self.mtime(index),
+            ctime=self.ctime(index),
+        )
+
+    def views(self) -> Iterator[FileItem]:
+        """Yield a FileItem view for every row, in table order."""
+        for index in range(len(self._dir_ids)):
+            yield self.view(index)
+
+    def __repr__(self) -> str:
+        return f'FileTable(files={len(self)}, dirs={len(self._dirs)})'
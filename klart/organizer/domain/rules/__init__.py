@@ -1,13 +1,23 @@
 from .base import Rule
 from .extension import ExtensionRule
 from .size import SizeRule
+from .name import NameRule
+from .date import DateRule
+from .content import ContentRule
 from .composite import CompositeRule
 from .setter import RuleSet
+from .size_index import SizeIndex
+from .name_matcher import NamePatternMatcher
 
 __all__ = [
     'Rule',
     'ExtensionRule',
     'SizeRule',
+    'NameRule',
+    'DateRule',
+    'ContentRule',
     'CompositeRule',
     'RuleSet',
+    'SizeIndex',
+    'NamePatternMatcher',
 ]
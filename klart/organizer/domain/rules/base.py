@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import FrozenSet, List, Optional, Tuple
 
 # Model of File that need get for matching and getting target segments
 from ..entities import FileItem
@@ -25,6 +25,64 @@ class Rule(ABC):
         """Check if the file matches this rule."""
         pass
 
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        """
+        Match and compute target segments in one pass.
+        Returns the segments if the file matches, otherwise None.
+        The default combines match() and target_segments(); rules override it
+        to avoid doing the same checks twice.
+        """
+        if self.match(file_item):
+            return self.target_segments(file_item)
+        return None
+
+    def requires(self) -> FrozenSet[str]:
+        """
+        FileItem attributes this rule reads ('name', 'suffix', 'size', 'mtime', 'ctime', 'header').
+        Lets RuleSet skip stat() calls and header reads nobody needs. The default assumes all of them.
+        """
+        return frozenset({'name', 'suffix', 'size', 'mtime', 'ctime', 'header'})
+
+    def always_matches(self, suffix: str) -> bool:
+        """
+        True if every file with this (lowercased) suffix matches, whatever its
+        other attributes - rules after it in priority order are then never reached.
+        """
+        return False
+
+    def suffixes(self) -> Optional[FrozenSet[str]]:
+        """
+        Lowercased suffixes this rule can possibly match, or None if it may match
+        any suffix. Used by RuleSet to dispatch files on their suffix;
+        rules that do not look at the suffix keep this default.
+        """
+        return None
+
+    def name_patterns(self) -> Optional[Tuple[str, ...]]:
+        """
+        Glob patterns (lowercased) of which the file name must match at least one
+        for this rule to match, or None (the default) if the rule is not limited
+        by name. Used by NamePatternMatcher.
+        """
+        return None
+
+    def size_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        Inclusive (min, max) size range outside of which this rule never matches;
+        max None means unbounded. A bounded rule never matches an unknown size.
+        None (the default) if the rule is not limited by size at all. Used by SizeIndex.
+        """
+        return None
+
+    def size_cuts(self) -> Optional[FrozenSet[int]]:
+        """
+        Sizes at which this rule's outcome can change: the rule decides the same
+        way for all sizes in [cut_i, cut_i+1). Empty if size does not matter.
+        None if the outcome depends on anything besides suffix and size -
+        the default, so unknown rules are never served from the RuleSet cache.
+        """
+        return None
+
     @abstractmethod
     def target_segments(self, file_item: FileItem) -> List[str]:
         """
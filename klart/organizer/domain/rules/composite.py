@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import FrozenSet, List, Optional, Sequence, Tuple, Union
 
 # Project modules: abstract of rules and file item to type getting filed
 from ..entities import FileItem
 from .base import Rule
+from .size_index import SizeIndex
 
 
 class CompositeRule(Rule):
@@ -10,9 +11,11 @@ class CompositeRule(Rule):
     Combines multiple rules with AND/OR logic.
     For AND: all sub‑rules must match; target segments are concatenated in order.
     For OR: the first matching sub‑rule determines the target segments.
+    An OR of size-bounded sub-rules (e.g. size tiers) looks its candidates up
+    in a SizeIndex instead of trying every range.
     """
 
-    __slots__ = ('rules', 'operator')
+    __slots__ = ('rules', 'operator', '_size_index')
 
     def __init__(self, rules: List[Rule], operator: str = 'AND', priority: Optional[int] = 100):
         """
@@ -25,6 +28,8 @@ class CompositeRule(Rule):
         if self.operator not in ('AND', 'OR'):
             raise ValueError('CompositeRule operator must be \'AND\' or \'OR\'')
         self._priority = priority if priority is not None else 100
+        # Built on first OR evaluation; False when an index would not help
+        self._size_index: Union[SizeIndex, bool, None] = None
 
     @property
     def priority(self) -> int:
@@ -36,6 +41,101 @@ class CompositeRule(Rule):
         else:  # OR
             return any(rule.match(file_item) for rule in self.rules)
 
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        """
+        One pass over the sub-rules - no match() followed by target_segments().
+        AND: None as soon as one sub-rule fails, else all segments concatenated.
+        OR: segments of the first sub-rule that matches, else None.
+        """
+        if self.operator == 'AND':
+            segments: List[str] = []
+            for rule in self.rules:
+                rule_segments = rule.evaluate(file_item)
+                if rule_segments is None:
+                    return None
+                segments.extend(rule_segments)
+            return segments
+        for rule in self._or_candidates(file_item):
+            rule_segments = rule.evaluate(file_item)
+            if rule_segments is not None:
+                return rule_segments
+        return None
+
+    def _or_candidates(self, file_item: FileItem) -> Sequence[Rule]:
+        """
+        Sub-rules worth trying for OR. Only when every sub-rule is size-bounded -
+        size is needed anyway then, so reading it up front costs no extra stat().
+        """
+        if self._size_index is None:
+            all_bounded = len(self.rules) > 1 and all(rule.size_bounds() is not None for rule in self.rules)
+            self._size_index = SizeIndex(self.rules) if all_bounded else False
+        if self._size_index is False:
+            return self.rules
+        return self._size_index.lookup(file_item.size)  # type: ignore
+
+    def size_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        """
+        For AND: intersection of the bounded sub-rules' ranges (possibly empty: min > max).
+        For OR: the hull of all ranges - None if one sub-rule is not size-bounded.
+        """
+        spans = [rule.size_bounds() for rule in self.rules]
+        if self.operator == 'AND':
+            bounded = [span for span in spans if span is not None]
+            if not bounded:
+                return None
+            low = max(span[0] for span in bounded)
+            highs = [span[1] for span in bounded if span[1] is not None]
+            return (low, min(highs) if highs else None)
+        if not spans or any(span is None for span in spans):
+            return None
+        low = min(span[0] for span in spans)  # type: ignore
+        highs = [span[1] for span in spans]  # type: ignore
+        return (low, None if None in highs else max(highs))  # type: ignore
+
+    def name_patterns(self) -> Optional[Tuple[str, ...]]:
+        """
+        For AND: the patterns of the first name-limited sub-rule (every sub-rule must match).
+        For OR: all sub-rules' patterns - None if one sub-rule is not name-limited.
+        """
+        sub_patterns = [rule.name_patterns() for rule in self.rules]
+        if self.operator == 'AND':
+            return next((p for p in sub_patterns if p is not None), None)
+        if not sub_patterns or any(p is None for p in sub_patterns):
+            return None
+        return tuple(pattern for patterns in sub_patterns for pattern in patterns)  # type: ignore
+
+    def requires(self) -> FrozenSet[str]:
+        # Conservative: any sub-rule may be evaluated
+        return frozenset().union(*(rule.requires() for rule in self.rules))
+
+    def always_matches(self, suffix: str) -> bool:
+        if self.operator == 'AND':
+            return all(rule.always_matches(suffix) for rule in self.rules)
+        return any(rule.always_matches(suffix) for rule in self.rules)
+
+    def size_cuts(self) -> Optional[FrozenSet[int]]:
+        """Union of the sub-rules' cuts; None if one sub-rule is not cacheable."""
+        cuts: FrozenSet[int] = frozenset()
+        for rule in self.rules:
+            rule_cuts = rule.size_cuts()
+            if rule_cuts is None:
+                return None
+            cuts |= rule_cuts
+        return cuts
+
+    def suffixes(self) -> Optional[FrozenSet[str]]:
+        """
+        For AND: only suffixes every suffix-bound sub-rule accepts (intersection).
+        For OR: any suffix a sub-rule accepts (union) - None if one sub-rule is suffix-agnostic.
+        """
+        sub_suffixes = [rule.suffixes() for rule in self.rules]
+        if self.operator == 'AND':
+            bound = [s for s in sub_suffixes if s is not None]
+            return frozenset.intersection(*bound) if bound else None
+        if any(s is None for s in sub_suffixes):
+            return None
+        return frozenset().union(*sub_suffixes)
+
     def target_segments(self, file_item: FileItem) -> List[str]:
         """
         For AND: collect segments from all sub‑rules (they all matched).
@@ -0,0 +1,128 @@
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Project modules: abstract of rules and file item to type getting filed
+from ..entities import FileItem
+from .base import Rule
+
+# Built-in signatures: (type, category, ((offset, magic), ...)).
+# All parts must be present; the first matching entry wins, so more specific
+# entries (ftyp brands, RIFF forms) come before generic ones.
+# Every signature fits in FileItem.HEADER_SIZE bytes.
+SIGNATURES: Tuple[Tuple[str, str, Tuple[Tuple[int, bytes], ...]], ...] = (
+    # Images
+    ('jpeg', 'image', ((0, b'\xff\xd8\xff'),)),
+    ('png', 'image', ((0, b'\x89PNG\r\n\x1a\n'),)),
+    ('gif', 'image', ((0, b'GIF87a'),)),
+    ('gif', 'image', ((0, b'GIF89a'),)),
+    ('webp', 'image', ((0, b'RIFF'), (8, b'WEBP'))),
+    ('bmp', 'image', ((0, b'BM'),)),
+    ('tiff', 'image', ((0, b'II*\x00'),)),
+    ('tiff', 'image', ((0, b'MM\x00*'),)),
+    ('ico', 'image', ((0, b'\x00\x00\x01\x00'),)),
+    ('psd', 'image', ((0, b'8BPS'),)),
+    ('heic', 'image', ((4, b'ftypheic'),)),
+    ('heic', 'image', ((4, b'ftypheix'),)),
+    ('heic', 'image', ((4, b'ftypmif1'),)),
+    ('avif', 'image', ((4, b'ftypavif'),)),
+    # Video
+    ('mov', 'video', ((4, b'ftypqt  '),)),
+    ('mp4', 'video', ((4, b'ftyp'),)),
+    ('avi', 'video', ((0, b'RIFF'), (8, b'AVI '))),
+    ('mkv', 'video', ((0, b'\x1a\x45\xdf\xa3'),)),
+    ('flv', 'video', ((0, b'FLV\x01'),)),
+    # Audio
+    ('wav', 'audio', ((0, b'RIFF'), (8, b'WAVE'))),
+    ('mp3', 'audio', ((0, b'ID3'),)),
+    ('mp3', 'audio', ((0, b'\xff\xfb'),)),
+    ('mp3', 'audio', ((0, b'\xff\xf3'),)),
+    ('mp3', 'audio', ((0, b'\xff\xf2'),)),
+    ('flac', 'audio', ((0, b'fLaC'),)),
+    ('ogg', 'audio', ((0, b'OggS'),)),
+    ('midi', 'audio', ((0, b'MThd'),)),
+    # Documents
+    ('pdf', 'document', ((0, b'%PDF-'),)),
+    ('rtf', 'document', ((0, b'{\\rtf'),)),
+    ('ole', 'document', ((0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),)),
+    ('sqlite', 'document', ((0, b'SQLite format 3\x00'),)),
+    # Archives (docx/xlsx/jar are zip containers and detect as zip)
+    ('zip', 'archive', ((0, b'PK\x03\x04'),)),
+    ('zip', 'archive', ((0, b'PK\x05\x06'),)),
+    ('gzip', 'archive', ((0, b'\x1f\x8b'),)),
+    ('bzip2', 'archive', ((0, b'BZh'),)),
+    ('xz', 'archive', ((0, b'\xfd7zXZ\x00'),)),
+    ('zstd', 'archive', ((0, b'\x28\xb5\x2f\xfd'),)),
+    ('7z', 'archive', ((0, b"7z\xbc\xaf'\x1c"),)),
+    ('rar', 'archive', ((0, b'Rar!\x1a\x07'),)),
+    # Executables
+    ('elf', 'executable', ((0, b'\x7fELF'),)),
+    ('exe', 'executable', ((0, b'MZ'),)),
+    ('macho', 'executable', ((0, b'\xcf\xfa\xed\xfe'),)),
+    ('macho', 'executable', ((0, b'\xce\xfa\xed\xfe'),)),
+    ('wasm', 'executable', ((0, b'\x00asm'),)),
+)
+
+# type -> category
+CATEGORIES: Dict[str, str] = {kind: category for kind, category, _ in SIGNATURES}
+
+# First header byte -> signatures that can match it, in table order (entries
+# without an offset-0 part go into every list), so sniff() tries only a few
+_BY_FIRST_BYTE: Tuple[Tuple[Tuple[str, Tuple[Tuple[int, bytes], ...]], ...], ...] = tuple(
+    tuple((kind, parts) for kind, _, parts in SIGNATURES if parts[0][0] != 0 or parts[0][1][0] == first)
+    for first in range(256)
+)
+
+
+def sniff(header: bytes) -> Optional[str]:
+    """Detect the file type from its first bytes; None if no signature matches."""
+    if not header:
+        return None
+    for kind, parts in _BY_FIRST_BYTE[header[0]]:
+        if all(header.startswith(magic, offset) for offset, magic in parts):
+            return kind
+    return None
+
+
+class ContentRule(Rule):
+    """
+    Matches files by their content type, detected from the first bytes
+    (FileItem.header) against the built-in SIGNATURES table, and returns a fixed
+    folder segment. Types are names like 'jpeg' or 'pdf', or whole categories
+    ('image', 'video', 'audio', 'document', 'archive', 'executable').
+    Catches extension-less and mislabelled files that an ExtensionRule misses.
+    """
+
+    __slots__ = ('types', 'folder', '_type_set')
+
+    def __init__(self, types: List[str], folder: str, priority: Optional[int] = 0):
+        """
+        Args:
+            types: List of content types and/or categories.
+            folder: Target folder name.
+        """
+        known = set(CATEGORIES) | set(CATEGORIES.values())
+        self.types = [kind.lower() for kind in types]
+        unknown = [kind for kind in self.types if kind not in known]
+        if not self.types or unknown:
+            raise ValueError(f'ContentRule unknown content types: {unknown or types}')
+        # Categories are expanded, so matching is one set lookup
+        self._type_set: FrozenSet[str] = frozenset(
+            kind for kind, category in CATEGORIES.items() if kind in self.types or category in self.types
+        )
+        self.folder = folder
+        self._priority = priority if priority is not None else 0
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    def match(self, file_item: FileItem) -> bool:
+        return sniff(file_item.header) in self._type_set
+
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        return [self.folder] if sniff(file_item.header) in self._type_set else None
+
+    def requires(self) -> FrozenSet[str]:
+        return frozenset({'header'})
+
+    def target_segments(self, file_item: FileItem) -> List[str]:
+        return [self.folder]
@@ -0,0 +1,99 @@
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Project modules: abstract of rules and file item to type getting filed
+from ..entities import FileItem
+from .base import Rule
+
+_SECONDS_PER_DAY = 86400
+
+
+class DateRule(Rule):
+    """
+    Matches files by timestamp (mtime or ctime) and returns folder segments
+    rendered from a template such as 'Photos/{year}/{month}' - placeholders
+    {year}, {month} and {day} (zero-padded). With older_than_days only files at
+    least that many days old match, e.g. for an 'Archive' folder.
+
+    The timestamp comes from the stat data the scanner already collected.
+    Rendered segments are cached per (year, month, day): files from the same
+    day share one list, so a large tree costs one format() per distinct day.
+    """
+
+    __slots__ = ('folder', 'field', 'older_than_days', '_templates', '_segments')
+
+    def __init__(
+        self,
+        folder: str,
+        field: str = 'mtime',
+        older_than_days: Optional[float] = None,
+        priority: Optional[int] = 0,
+    ):
+        """
+        Args:
+            folder: Target folder template; '/' separates segments.
+            field: Timestamp to use - 'mtime' (modification) or 'ctime'.
+            older_than_days: Only match files whose timestamp is at least this many days old.
+        """
+        if field not in ('mtime', 'ctime'):
+            raise ValueError('DateRule field must be \'mtime\' or \'ctime\'')
+        if older_than_days is not None and older_than_days < 0:
+            raise ValueError('DateRule older_than_days must be >= 0')
+        self._templates = [segment for segment in folder.split('/') if segment]
+        if not self._templates:
+            raise ValueError('DateRule requires a folder')
+        try:
+            for template in self._templates:
+                template.format(year='0000', month='00', day='00')
+        except (KeyError, IndexError, ValueError, AttributeError, TypeError) as exc:
+            # '{week}', '{0}', '{year:%}', '{year.x}', '{year[x]}' ... fail here, not on the first file
+            raise ValueError(f'DateRule folder has an invalid placeholder: {folder!r} ({exc})') from exc
+        self.folder = folder
+        self.field = field
+        self.older_than_days = older_than_days
+        self._priority = priority if priority is not None else 0
+        # (year, month, day) -> rendered segments
+        self._segments: Dict[Tuple[int, int, int], List[str]] = {}
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    def _timestamp(self, file_item: FileItem) -> Optional[float]:
+        return file_item.mtime if self.field == 'mtime' else file_item.ctime
+
+    def _match_time(self, timestamp: Optional[float]) -> bool:
+        if timestamp is None:
+            return False
+        if self.older_than_days is not None:
+            return time.time() - timestamp >= self.older_than_days * _SECONDS_PER_DAY
+        return True
+
+    def _render(self, timestamp: float) -> List[str]:
+        """Segments for the local date of timestamp, formatted once per day."""
+        local = time.localtime(timestamp)
+        key = (local.tm_year, local.tm_mon, local.tm_mday)
+        segments = self._segments.get(key)
+        if segments is None:
+            year, month, day = f'{key[0]:04d}', f'{key[1]:02d}', f'{key[2]:02d}'
+            segments = self._segments[key] = [
+                template.format(year=year, month=month, day=day) for template in self._templates
+            ]
+        # A copy - callers (CompositeRule) may extend the list
+        return list(segments)
+
+    def match(self, file_item: FileItem) -> bool:
+        return self._match_time(self._timestamp(file_item))
+
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        timestamp = self._timestamp(file_item)
+        return self._render(timestamp) if self._match_time(timestamp) else None  # type: ignore
+
+    def requires(self) -> FrozenSet[str]:
+        return frozenset({self.field})
+
+    def target_segments(self, file_item: FileItem) -> List[str]:
+        timestamp = self._timestamp(file_item)
+        if timestamp is None:
+            return []
+        return self._render(timestamp)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 
 # Project modules: abstract of rules and file item to type getting filed
 from ..entities import FileItem
@@ -8,7 +8,7 @@ from .base import Rule
 class ExtensionRule(Rule):
     """Matches files by extension and returns a fixed folder segment."""
 
-    __slots__ = ('extensions', 'folder')
+    __slots__ = ('extensions', 'folder', '_suffix_set')
 
     def __init__(self, extensions: List[str], folder: str, priority: Optional[int] = 0):
         """
@@ -17,6 +17,7 @@ class ExtensionRule(Rule):
             folder: Target folder name.
         """
         self.extensions = [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions]
+        self._suffix_set = frozenset(self.extensions)
         self.folder = folder
         self._priority = priority if priority is not None else 0
 
@@ -25,7 +26,22 @@ class ExtensionRule(Rule):
         return self._priority
 
     def match(self, file_item: FileItem) -> bool:
-        return file_item.suffix.lower() in self.extensions
+        return file_item.suffix.lower() in self._suffix_set
+
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        return [self.folder] if file_item.suffix.lower() in self._suffix_set else None
+
+    def size_cuts(self) -> Optional[FrozenSet[int]]:
+        return frozenset()
+
+    def requires(self) -> FrozenSet[str]:
+        return frozenset({'suffix'})
+
+    def always_matches(self, suffix: str) -> bool:
+        return suffix in self._suffix_set
+
+    def suffixes(self) -> Optional[FrozenSet[str]]:
+        return self._suffix_set
 
     def target_segments(self, file_item: FileItem) -> List[str]:
         return [self.folder]
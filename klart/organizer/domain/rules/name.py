@@ -0,0 +1,72 @@
+import fnmatch
+import re
+from typing import FrozenSet, List, Optional, Tuple
+
+# Project modules: abstract of rules and file item to type getting filed
+from ..entities import FileItem
+from .base import Rule
+
+
+class NameRule(Rule):
+    """
+    Matches files by name with fnmatch-style patterns ('IMG_*', 'Screenshot*',
+    'invoice-*.pdf'), case-insensitively, and returns a fixed folder segment.
+    Inside a RuleSet all name patterns are matched together by a NamePatternMatcher.
+    """
+
+    __slots__ = ('patterns', 'folder', '_regex', '_suffix_set')
+
+    def __init__(self, patterns: List[str], folder: str, priority: Optional[int] = 0):
+        """
+        Args:
+            patterns: List of glob patterns matched against the whole file name.
+            folder: Target folder name.
+        """
+        if not patterns:
+            raise ValueError('NameRule requires at least one pattern')
+        self.patterns = [pattern.lower() for pattern in patterns]
+        self._regex = re.compile('|'.join(fnmatch.translate(pattern) for pattern in self.patterns))
+        self._suffix_set = self._pattern_suffixes(self.patterns)
+        self.folder = folder
+        self._priority = priority if priority is not None else 0
+
+    @staticmethod
+    def _pattern_suffixes(patterns: List[str]) -> Optional[FrozenSet[str]]:
+        """
+        Suffixes the patterns can match, when every pattern ends in a literal
+        extension ('*.pdf' -> '.pdf'); otherwise None (any suffix).
+        """
+        suffixes = set()
+        for pattern in patterns:
+            dot = pattern.rfind('.')
+            tail = pattern[dot + 1 :]
+            if dot < 0 or not tail or any(char in tail for char in '*?[]'):
+                return None
+            suffixes.add(pattern[dot:])
+            # '*.pdf' also matches '.pdf' itself, which has no suffix (like '.bashrc')
+            if not pattern[:dot].strip('*'):
+                suffixes.add('')
+        return frozenset(suffixes)
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    def match(self, file_item: FileItem) -> bool:
+        return self._regex.match(file_item.name.lower()) is not None
+
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        return [self.folder] if self._regex.match(file_item.name.lower()) is not None else None
+
+    def requires(self) -> FrozenSet[str]:
+        return frozenset({'name'})
+
+    def name_patterns(self) -> Optional[Tuple[str, ...]]:
+        return tuple(self.patterns)
+
+    def suffixes(self) -> Optional[FrozenSet[str]]:
+        return self._suffix_set
+
+    def target_segments(self, file_item: FileItem) -> List[str]:
+        return [self.folder]
+
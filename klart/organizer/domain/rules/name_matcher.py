@@ -0,0 +1,102 @@
+import fnmatch
+import re
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple
+
+# Project modules: abstract of rules
+from .base import Rule
+
+# Characters that start a wildcard in fnmatch patterns
+_WILDCARDS = '*?['
+
+
+def literal_prefix(pattern: str) -> str:
+    """Leading part of a glob pattern that contains no wildcard."""
+    for i, char in enumerate(pattern):
+        if char in _WILDCARDS:
+            return pattern[:i]
+    return pattern
+
+
+class _TrieNode:
+    """One character step of the literal-prefix trie."""
+
+    __slots__ = ('children', 'regex', 'groups')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        # Combined regex of the patterns whose literal prefix ends here, and
+        # for each of its capture groups the position of the rule it reports
+        self.regex: Optional[Pattern[str]] = None
+        self.groups: Tuple[int, ...] = ()
+
+
+class NamePatternMatcher:
+    """
+    Matches a file name against the name_patterns() of many rules at once.
+
+    Patterns are fnmatch-style globs, matched case-insensitively. They are
+    stored in a trie keyed on their literal prefix ('IMG_' of 'IMG_*.jpg'), so
+    walking the name once finds the only patterns that can match it. All the
+    patterns sharing a trie node are compiled into one regex of zero-width
+    lookaheads, (?:(?=p1)())?(?:(?=p2)())?..., whose capture groups report every
+    pattern that matched in a single match() call.
+
+    Per-file cost depends on the name length and on how many patterns share
+    its prefix - not on the total number of patterns.
+    """
+
+    __slots__ = ('_rules', '_root', '_unpatterned')
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self._rules: Tuple[Rule, ...] = tuple(rules)
+        # Rules not limited by name are candidates for every file
+        self._unpatterned: Tuple[int, ...] = tuple(
+            position for position, rule in enumerate(self._rules) if rule.name_patterns() is None
+        )
+
+        by_node: Dict[int, Tuple[_TrieNode, List[Tuple[str, int]]]] = {}
+        self._root = _TrieNode()
+        for position, rule in enumerate(self._rules):
+            for pattern in rule.name_patterns() or ():
+                pattern = pattern.lower()
+                node = self._root
+                for char in literal_prefix(pattern):
+                    node = node.children.setdefault(char, _TrieNode())
+                by_node.setdefault(id(node), (node, []))[1].append((pattern, position))
+
+        for node, entries in by_node.values():
+            parts = [f'(?:(?={fnmatch.translate(pattern)})())?' for pattern, _ in entries]
+            node.regex = re.compile(''.join(parts))
+            node.groups = tuple(position for _, position in entries)
+
+    @property
+    def patterned(self) -> bool:
+        """True if at least one rule has name patterns (otherwise the matcher filters nothing)."""
+        return len(self._unpatterned) < len(self._rules)
+
+    def matches(self, name: str) -> List[int]:
+        """Positions (in the rules given to the constructor) of the rules with a pattern matching name."""
+        name = name.lower()
+        hits: List[int] = []
+        node: Optional[_TrieNode] = self._root
+        depth = 0
+        while node is not None:
+            if node.regex is not None:
+                groups = node.regex.match(name).groups()  # type: ignore
+                hits.extend(position for position, group in zip(node.groups, groups) if group is not None)
+            if depth == len(name):
+                break
+            node = node.children.get(name[depth])
+            depth += 1
+        return hits
+
+    def lookup(self, name: str) -> Tuple[Rule, ...]:
+        """Rules that can match a file with this name, in input order."""
+        hits = self.matches(name)
+        if not hits:
+            return tuple(self._rules[position] for position in self._unpatterned)
+        positions = sorted(set(hits).union(self._unpatterned))
+        return tuple(self._rules[position] for position in positions)
+
+    def __repr__(self) -> str:
+        return f'NamePatternMatcher(rules={len(self._rules)}, unpatterned={len(self._unpatterned)})'
@@ -1,20 +1,77 @@
-from typing import Optional, Any, Dict
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Optional, Any, Dict, FrozenSet, Iterable, List, Sequence, Tuple, Union
 
 # Project modules
 from ..entities import FileItem
+from .base import Rule
+from .name_matcher import NamePatternMatcher
+from .size_index import SizeIndex
 from ...exceptions import RuleNotFoundError, UnknownBehaviorType
 
+# Optional: vectorized size-interval lookup for classify_columns()
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Classification outcome "no rule matched" (None already means "ignored")
+_NO_RULE = object()
+# Cache lookup miss
+_MISSING = object()
+# FileItem attributes that come from stat() - header too: header caches are keyed on stat identity
+_STAT_ATTRIBUTES = frozenset({'size', 'mtime', 'ctime', 'header'})
+
+# One batch classification result: folder, None (skip) or the error for other_behavior='raise'
+Decision = Union[Optional[str], RuleNotFoundError]
+
+
+class _FeatureProbe:
+    """
+    Stand-in for a FileItem that carries only the features feature-only rules
+    (suffix and size) look at. Used to classify columnar rows without views.
+    """
+
+    __slots__ = ('name', 'suffix', 'size')
+
+    def __init__(self, suffix: str, size: Optional[int]) -> None:
+        self.name = f'*{suffix}'
+        self.suffix = suffix
+        self.size = size
+
 
 class RuleSet:
     """
     Container for all rules, plus global settings about how to handle unmapped files.
     This class encapsulates the logic of applying rules to a file item.
     It does not know anything about JSON or external sources – pure business logic.
+
+    Decisions are memoized in a bounded LRU cache keyed by (lowercased suffix,
+    size interval), when every rule depends only on suffix and size. The size
+    intervals come from the rules' size_cuts() and the ignore thresholds.
     """
 
-    __slots__ = ('rules', 'other_behavior', 'ignore_extensions', 'ignore_size_more_than', 'ignore_size_less_than')
+    __slots__ = (
+        'rules',
+        'other_behavior',
+        'ignore_extensions',
+        'ignore_size_more_than',
+        'ignore_size_less_than',
+        '_ignore_suffixes',
+        '_dispatch',
+        '_agnostic',
+        '_size_cuts',
+        '_cache',
+        '_cache_size',
+        '_required',
+        '_size_indexes',
+        '_name_matchers',
+        '_reads_content',
+        'cache_hits',
+        'cache_misses',
+    )
 
-    def __init__(self, rules_cfg: Dict[str, Any]):
+    def __init__(self, rules_cfg: Dict[str, Any], cache_size: int = 4096):
         """
         Rules Cfg Args:
             rules: List of Rule objects, Sorted by priority level.
@@ -25,6 +82,9 @@ class RuleSet:
             ignore_extensions: List of extensions to always ignore (skipped even if a rule matches)
             ignore_size_more_than: Ignore file that size more than (skipped even if rule matches)
             ignore_size_less_than: Ignore file that size less than (skipped even if rule matches).
+
+        Args:
+            cache_size: Max number of memoized (suffix, size interval) decisions; 0 disables the cache.
         """
         self.rules = sorted(rules_cfg.pop('rules'), key=lambda r: r.priority, reverse=True)
         self.other_behavior = rules_cfg.pop('other_behavior')
@@ -44,6 +104,102 @@ class RuleSet:
         # Assigment values
         self.ignore_size_more_than = more
         self.ignore_size_less_than = less
+        if cache_size < 0:
+            raise ValueError('cache_size must be >= 0')
+        self._cache_size = cache_size
+        self.compile()
+
+    def compile(self) -> None:
+        """
+        Build the suffix dispatch table from self.rules.
+
+        Every lowercased suffix some rule names maps to the rules that can match
+        it, in priority order; all other suffixes only need the suffix-agnostic
+        rules. A file is then tested against its candidates only, so the cost no
+        longer grows with the total number of rules.
+        Also collects the size cut points for the classification cache and clears it.
+        Called on init - call again after changing rules or ignore settings.
+        """
+        rule_suffixes = [(rule, rule.suffixes()) for rule in self.rules]
+        known = frozenset().union(*(s for _, s in rule_suffixes if s is not None))
+        self._dispatch: Dict[str, Tuple[Rule, ...]] = {
+            suffix: tuple(rule for rule, s in rule_suffixes if s is None or suffix in s) for suffix in known
+        }
+        self._agnostic: Tuple[Rule, ...] = tuple(rule for rule, s in rule_suffixes if s is None)
+        self._ignore_suffixes: FrozenSet[str] = frozenset(self.ignore_extensions)
+
+        # Size cut points; None when some rule looks at more than suffix and size
+        cuts: Optional[FrozenSet[int]] = frozenset()
+        for rule in self.rules:
+            rule_cuts = rule.size_cuts()
+            if rule_cuts is None:
+                cuts = None
+                break
+            cuts |= rule_cuts
+        if cuts is not None:
+            # size >= more is ignored, size <= less is ignored
+            if self.ignore_size_more_than is not None:
+                cuts |= {self.ignore_size_more_than}
+            if self.ignore_size_less_than is not None:
+                cuts |= {self.ignore_size_less_than + 1}
+        self._size_cuts: Optional[Tuple[int, ...]] = tuple(sorted(cuts)) if cuts is not None else None
+        self._reads_content = any('header' in rule.requires() for rule in self.rules)
+        self._cache: OrderedDict = OrderedDict()
+        # lowercased suffix -> attributes its rule path reads (filled lazily)
+        self._required: Dict[str, FrozenSet[str]] = {}
+        # dispatch key (suffix, or None for the agnostic list) -> SizeIndex over its candidates
+        self._size_indexes: Dict[Optional[str], Optional[SizeIndex]] = {}
+        # dispatch key -> NamePatternMatcher over its candidates' name patterns
+        self._name_matchers: Dict[Optional[str], Optional[NamePatternMatcher]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def feature_only(self) -> bool:
+        """True if every decision depends only on suffix and size (cacheable, columnar-capable)."""
+        return self._size_cuts is not None
+
+    @property
+    def reads_content(self) -> bool:
+        """True if some rule looks at file content (FileItem.header)."""
+        return self._reads_content
+
+    def candidates(self, suffix: str) -> Tuple[Rule, ...]:
+        """Rules that can match a file with this suffix, highest priority first."""
+        return self._dispatch.get(suffix.lower(), self._agnostic)
+
+    def required_attributes(self, suffix: str) -> FrozenSet[str]:
+        """
+        FileItem attributes needed to classify a file with this suffix.
+
+        Walks the candidates in priority order and stops at the first rule that
+        matches every file with this suffix - rules after it are never reached.
+        Size ignore thresholds add 'size'; an ignored suffix needs nothing else.
+        """
+        suffix = suffix.lower()
+        required = self._required.get(suffix)
+        if required is None:
+            attributes = {'suffix'}
+            if suffix not in self._ignore_suffixes:
+                if self.ignore_size_more_than is not None or self.ignore_size_less_than is not None:
+                    attributes.add('size')
+                for rule in self._dispatch.get(suffix, self._agnostic):
+                    attributes |= rule.requires()
+                    if rule.always_matches(suffix):
+                        break
+            required = self._required[suffix] = frozenset(attributes)
+        return required
+
+    def needs_stat(self, suffix: str) -> bool:
+        """True if classifying a file with this suffix reads stat data (size, mtime, ctime - or header)."""
+        return not self.required_attributes(suffix).isdisjoint(_STAT_ATTRIBUTES)
+
+    def needs_content(self, suffix: str) -> bool:
+        """
+        True if a file with this suffix can reach a rule that reads its header -
+        only those files are worth sniffing ahead of classification.
+        """
+        return self._reads_content and 'header' in self.required_attributes(suffix)
 
     def get_folder_name(self, target: FileItem) -> Optional[str]:
         """
@@ -55,28 +211,170 @@ class RuleSet:
             - raises RuleNotFoundError if other_behavior == "raise" and no rule matches
         """
         file_item = target
+        suffix = file_item.suffix.lower()
         # 1. Check ignore by extension
-        if file_item.suffix.lower() in self.ignore_extensions:
+        if suffix in self._ignore_suffixes:
+            return None
+
+        cuts = self._size_cuts
+        if cuts is None or not self._cache_size:
+            folder = self._classify(file_item, suffix)
+        else:
+            # Same suffix and same size interval -> same decision.
+            # Suffixes whose rule path never reads size share one key - and no stat()
+            size = file_item.size if cuts and self.needs_stat(suffix) else 0
+            key = (suffix, None if size is None else bisect_right(cuts, size))
+            folder = self._cache.get(key, _MISSING)
+            if folder is _MISSING:
+                self.cache_misses += 1
+                folder = self._classify(file_item, suffix)
+                self._cache[key] = folder
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            else:
+                self.cache_hits += 1
+                self._cache.move_to_end(key)
+
+        if folder is _NO_RULE:
+            return self._handle_no_rule(file_item.name)
+        return folder  # type: ignore
+
+    def classify_batch(self, files: Iterable[FileItem]) -> List[Decision]:
+        """
+        Classify many files at once. Result i is the folder name for file i,
+        None if it is skipped, or a RuleNotFoundError (not raised) when
+        other_behavior is 'raise' - so one unmatched file does not abort the batch.
+        """
+        decisions: List[Decision] = []
+        for file_item in files:
+            try:
+                decisions.append(self.get_folder_name(file_item))
+            except RuleNotFoundError as exc:
+                decisions.append(exc)
+        return decisions
+
+    def classify_columns(
+        self, suffix_ids: Sequence[int], suffixes: Sequence[str], sizes: Sequence[int]
+    ) -> List[Decision]:
+        """
+        Classify rows of a columnar scan (see FileTable) without creating FileItems.
+
+        Args:
+            suffix_ids: Per row, an index into suffixes.
+            suffixes: Interned suffixes.
+            sizes: Per row size in bytes, negative if unknown.
+
+        Every row is reduced to (suffix id, size interval) - the size intervals
+        (SizeRule ranges and ignore thresholds) are found with one vectorized
+        searchsorted when NumPy is installed, bisect otherwise - and the rule chain
+        runs once per distinct pair. Results are the same as classify_batch().
+        Raises ValueError if some rule needs more than suffix and size (see feature_only).
+        """
+        cuts = self._size_cuts
+        if cuts is None:
+            raise ValueError('classify_columns needs rules that depend only on suffix and size')
+        unknown = len(cuts) + 1  # interval id for rows without a size
+        memo: Dict[Tuple[int, int], Decision] = {}
+
+        def decide(suffix_id: int, interval: int) -> Decision:
+            key = (suffix_id, interval)
+            decision = memo.get(key, _MISSING)
+            if decision is _MISSING:
+                # Any size inside the interval decides the same way - take its lower bound
+                size = None if interval == unknown else (cuts[interval - 1] if interval else 0)
+                decision = memo[key] = self._decide_features(suffixes[suffix_id].lower(), size)
+            return decision  # type: ignore
+
+        if _np is not None and len(sizes):
+            size_arr = _np.asarray(sizes, dtype=_np.int64)
+            intervals = _np.searchsorted(_np.asarray(cuts, dtype=_np.int64), size_arr, side='right')
+            intervals[size_arr < 0] = unknown
+            keys = _np.asarray(suffix_ids, dtype=_np.int64) * (unknown + 1) + intervals
+            unique_keys, inverse = _np.unique(keys, return_inverse=True)
+            unique_decisions = [decide(*divmod(int(key), unknown + 1)) for key in unique_keys]
+            return [unique_decisions[i] for i in inverse.tolist()]
+
+        return [
+            decide(suffix_id, bisect_right(cuts, size) if size >= 0 else unknown)
+            for suffix_id, size in zip(suffix_ids, sizes)
+        ]
+
+    def _decide_features(self, suffix: str, size: Optional[int]) -> Decision:
+        """get_folder_name() for a (lowercased suffix, size) pair instead of a file."""
+        if suffix in self._ignore_suffixes:
             return None
+        folder = self._classify(_FeatureProbe(suffix, size), suffix)  # type: ignore
+        if folder is not _NO_RULE:
+            return folder
+        try:
+            return self._handle_no_rule(f'*{suffix}')
+        except RuleNotFoundError as exc:
+            return exc
 
-        # 2. Check ignore by size if its not None
-        if file_item.size is not None:
-            if self.ignore_size_more_than is not None and file_item.size >= self.ignore_size_more_than:
+    def _classify(self, file_item: FileItem, suffix: str) -> Any:
+        """Full rule chain: folder name, None if ignored by size, or _NO_RULE."""
+        # 2. Check ignore by size if its not None (size is only read - stat-ed - if there are thresholds)
+        more, less = self.ignore_size_more_than, self.ignore_size_less_than
+        size = file_item.size if more is not None or less is not None else None
+        if size is not None:
+            if more is not None and size >= more:
                 return None
-            if self.ignore_size_less_than is not None and file_item.size <= self.ignore_size_less_than:
+            if less is not None and size <= less:
                 return None
 
-        # 2. Find a matching rule
-        for rule in self.rules:
-            if rule.match(file_item):
-                segments = rule.target_segments(file_item)
+        # 3. Find a matching rule among the candidates for this suffix (one evaluate() pass each)
+        candidates = self._dispatch.get(suffix, self._agnostic)
+        matcher = self._name_matcher(suffix)
+        if matcher is not None:
+            # Drop name-limited candidates none of whose patterns match - one pass over the name.
+            # The few rules left check their own size bounds in evaluate()
+            candidates = matcher.lookup(file_item.name)
+        else:
+            index = self._size_index(suffix)
+            if index is not None:
+                # Drop size-bounded candidates whose range misses this file - one bisect
+                candidates = index.lookup(file_item.size)
+        for rule in candidates:
+            segments = rule.evaluate(file_item)
+            if segments is not None:
                 return '/'.join(segments)
+        return _NO_RULE
+
+    def _size_index(self, suffix: str) -> Optional[SizeIndex]:
+        """
+        SizeIndex over the candidates of suffix, built on first use. None when no
+        candidate is size-bounded, or when the rule path does not need size at all
+        (the index would force a stat() that classification can do without).
+        """
+        key = suffix if suffix in self._dispatch else None
+        if key not in self._size_indexes:
+            index = None
+            if self.needs_stat(suffix):
+                index = SizeIndex(self._dispatch.get(suffix, self._agnostic))
+                if not index.bounded:
+                    index = None
+            self._size_indexes[key] = index
+        return self._size_indexes[key]
+
+    def _name_matcher(self, suffix: str) -> Optional[NamePatternMatcher]:
+        """
+        NamePatternMatcher over the candidates of suffix, built on first use;
+        None if no candidate has name patterns.
+        """
+        key = suffix if suffix in self._dispatch else None
+        if key not in self._name_matchers:
+            matcher: Optional[NamePatternMatcher] = NamePatternMatcher(self._dispatch.get(suffix, self._agnostic))
+            if not matcher.patterned:  # type: ignore
+                matcher = None
+            self._name_matchers[key] = matcher
+        return self._name_matchers[key]
 
-        # 3. No rule matched – handle according to other_behavior
+    def _handle_no_rule(self, name: str) -> Optional[str]:
+        """No rule matched – handle according to other_behavior."""
         if self.other_behavior == 'use_other':
             return 'Other'
         elif self.other_behavior == 'raise':
-            raise RuleNotFoundError(f'No rule found for file: {file_item.name}')
+            raise RuleNotFoundError(f'No rule found for file: {name}')
         elif self.other_behavior == 'ignore':
             return None
         else:
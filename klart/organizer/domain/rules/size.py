@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import FrozenSet, Optional, List, Tuple
 
 # Project modules: abstract of rules and file item to type getting filed
 from ..entities import FileItem
@@ -37,7 +37,27 @@ class SizeRule(Rule):
         return self._priority
 
     def match(self, file_item: FileItem) -> bool:
-        size = file_item.size
+        return self._match_size(file_item.size)
+
+    def evaluate(self, file_item: FileItem) -> Optional[List[str]]:
+        return [self.folder] if self._match_size(file_item.size) else None
+
+    def requires(self) -> FrozenSet[str]:
+        return frozenset({'size'})
+
+    def size_bounds(self) -> Optional[Tuple[int, Optional[int]]]:
+        return (self.min_size or 0, self.max_size)
+
+    def size_cuts(self) -> Optional[FrozenSet[int]]:
+        # min <= size <= max  ->  outcome flips at min and at max + 1
+        cuts = set()
+        if self.min_size is not None:
+            cuts.add(self.min_size)
+        if self.max_size is not None:
+            cuts.add(self.max_size + 1)
+        return frozenset(cuts)
+
+    def _match_size(self, size: Optional[int]) -> bool:
         if size is None:
             return False
         if self.min_size is not None and size < self.min_size:
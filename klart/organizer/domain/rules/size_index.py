@@ -0,0 +1,89 @@
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+# Project modules: abstract of rules
+from .base import Rule
+
+
+class SizeIndex:
+    """
+    Interval index over rules' size_bounds().
+
+    All range ends (min and max + 1) are kept as one sorted list of boundaries;
+    between two neighbouring boundaries every rule either fully covers the sizes
+    or not at all. Each rule's run of segments is stored in a segment tree, in
+    the O(log n) nodes that exactly cover it - O(rules * log boundaries) memory
+    and build time, even when many ranges overlap (a table of the matching rules
+    per segment would grow as boundaries * rules).
+    lookup(size) is one bisect plus one leaf-to-root walk, and the m rules found
+    are put back in input order - O(log n + m log m) instead of testing every range.
+
+    Rules without size bounds (size_bounds() is None) are part of every segment,
+    so lookup() returns all rules that can match a file of that size, in the
+    order they were given (RuleSet and CompositeRule pass priority order).
+    """
+
+    __slots__ = ('_rules', '_boundaries', '_leaves', '_nodes', '_unsized')
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self._rules: Tuple[Rule, ...] = tuple(rules)
+        spans = [rule.size_bounds() for rule in self._rules]
+        points = set()
+        for span in spans:
+            if span is not None:
+                low, high = span
+                points.add(low)
+                if high is not None:
+                    points.add(high + 1)
+        self._boundaries: List[int] = sorted(points)
+        position = {point: k for k, point in enumerate(self._boundaries)}
+
+        # Segment k holds sizes in [boundaries[k-1], boundaries[k]).
+        # Node i has children 2i and 2i+1; leaf k is node leaves + k.
+        # Every node lists the input positions of the rules covering all its leaves.
+        self._leaves = len(self._boundaries) + 1
+        self._nodes: List[List[int]] = [[] for _ in range(2 * self._leaves)]
+        for index, span in enumerate(spans):
+            if span is None:
+                first, end = 0, self._leaves
+            else:
+                low, high = span
+                first = position[low] + 1
+                end = self._leaves if high is None else position[high + 1] + 1
+            self._add(index, first, end)
+        # Bounded rules never match a file whose size is unknown
+        self._unsized: Tuple[Rule, ...] = tuple(rule for rule, span in zip(self._rules, spans) if span is None)
+
+    def _add(self, index: int, first: int, end: int) -> None:
+        """Record rule index in the nodes that exactly cover segments [first, end)."""
+        first += self._leaves
+        end += self._leaves
+        while first < end:
+            if first & 1:
+                self._nodes[first].append(index)
+                first += 1
+            if end & 1:
+                end -= 1
+                self._nodes[end].append(index)
+            first >>= 1
+            end >>= 1
+
+    @property
+    def bounded(self) -> bool:
+        """True if at least one rule has size bounds (otherwise the index filters nothing)."""
+        return bool(self._boundaries)
+
+    def lookup(self, size: Optional[int]) -> Tuple[Rule, ...]:
+        """Rules that can match a file of this size (None = unknown size), in input order."""
+        if size is None:
+            return self._unsized
+        node = self._leaves + bisect_right(self._boundaries, size)
+        found: List[int] = []
+        while node:
+            found.extend(self._nodes[node])
+            node >>= 1
+        found.sort()
+        return tuple(self._rules[index] for index in found)
+
+    def __repr__(self) -> str:
+        return f'SizeIndex(boundaries={len(self._boundaries)}, segments={self._leaves})'
@@ -46,6 +46,13 @@ from .style import (
     UnknownStyleType,
 )
 
+# Move plan Errors
+from .plan import (
+    PlanError,
+    PlanFileNotFoundError,
+    PlanFormatError,
+)
+
 # Logging Errors
 from .logging import (
     LoggingError,
@@ -82,6 +89,9 @@ __all__ = [
     'StyleFileNotFoundError',
     'StyleNotFoundError',
     'UnknownStyleType',
+    'PlanError',
+    'PlanFileNotFoundError',
+    'PlanFormatError',
     'LoggingError',
     'LogFileNotDefinedError',
 ]
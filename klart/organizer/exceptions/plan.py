@@ -0,0 +1,20 @@
+from .base import InfrastructureError
+
+
+# ----- Move plan errors -----
+class PlanError(InfrastructureError):
+    """Base class for move plan saving/loading errors."""
+
+    pass
+
+
+class PlanFileNotFoundError(PlanError):
+    """Raised when a move plan file is not found."""
+
+    pass
+
+
+class PlanFormatError(PlanError):
+    """Raised when a move plan file has invalid format (e.g., unknown version)."""
+
+    pass
@@ -1,7 +1,9 @@
-from .file_system import OSFileSystem
+from .file_system import OSFileSystem, ScanIndex, ThreadedContentSniffer, HashingDuplicateFinder, MoveEngine
 from .config import JsonConfigRepository, InMemoryConfigRepository
 from .rules import JsonRuleRepository, InMemoryRuleRepository
+from .plans import JsonPlanRepository
 from .logging import LoguruLogger
+from .watcher import InotifyWatcher, PollingWatcher
 from .styles import (
     JsonStyleRepository,
     InMemoryStyleRepository,
@@ -16,10 +18,15 @@ from .styles import (
 
 __all__ = [
     'OSFileSystem',
+    'ScanIndex',
+    'ThreadedContentSniffer',
+    'HashingDuplicateFinder',
+    'MoveEngine',
     'JsonConfigRepository',
     'InMemoryConfigRepository',
     'InMemoryRuleRepository',
     'JsonRuleRepository',
+    'JsonPlanRepository',
     'JsonStyleRepository',
     'InMemoryStyleRepository',
     'LevelStyle',
@@ -30,4 +37,6 @@ __all__ = [
     'CriticalStyle',
     'StyleSet',
     'LoguruLogger',
+    'InotifyWatcher',
+    'PollingWatcher',
 ]
@@ -18,7 +18,8 @@ class JsonConfigRepository(ConfigRepository):
         source_dir (str), dest_dir (str)
 
     Optional fields:
-        dry_run, recursive, ignore_patterns, logging
+        dry_run, recursive, streaming, columnar, dedup, watch, ignore_patterns, scan_workers, jobs, scan_index,
+        logging
 
     Rules block — data['rules']:
         rules_cfg  (dict):  inline rules config
@@ -71,6 +72,22 @@ class JsonConfigRepository(ConfigRepository):
         if not isinstance(recursive, bool):
             raise ConfigValidationError('recursive must be a boolean')
 
+        streaming = data.get('streaming', False)
+        if not isinstance(streaming, bool):
+            raise ConfigValidationError('streaming must be a boolean')
+
+        columnar = data.get('columnar', False)
+        if not isinstance(columnar, bool):
+            raise ConfigValidationError('columnar must be a boolean')
+
+        dedup = data.get('dedup')
+        if dedup is not None and dedup not in AppConfig.DEDUP_POLICIES:
+            raise ConfigValidationError(f'dedup must be null or one of {list(AppConfig.DEDUP_POLICIES)}')
+
+        watch = data.get('watch', False)
+        if not isinstance(watch, bool):
+            raise ConfigValidationError('watch must be a boolean')
+
         ignore_patterns = data.get('ignore_patterns')
         if ignore_patterns is not None:
             if not isinstance(ignore_patterns, list):
@@ -79,6 +96,20 @@ class JsonConfigRepository(ConfigRepository):
                 if not isinstance(pat, str):
                     raise ConfigValidationError('each ignore pattern must be a string')
 
+        scan_workers = data.get('scan_workers')
+        if scan_workers is not None:
+            if isinstance(scan_workers, bool) or not isinstance(scan_workers, int) or scan_workers < 1:
+                raise ConfigValidationError('scan_workers must be a positive integer')
+
+        jobs = data.get('jobs')
+        if jobs is not None:
+            if isinstance(jobs, bool) or not isinstance(jobs, int) or jobs < 1:
+                raise ConfigValidationError('jobs must be a positive integer')
+
+        scan_index = data.get('scan_index', False)
+        if not isinstance(scan_index, bool):
+            raise ConfigValidationError('scan_index must be a boolean')
+
         # Logging config fields
         logging_cfg = data.get('logging')
         if logging_cfg is not None and not isinstance(logging_cfg, dict):
@@ -125,7 +156,14 @@ class JsonConfigRepository(ConfigRepository):
             dest_dir=dest_dir,
             dry_run=dry_run,
             recursive=recursive,
+            streaming=streaming,
+            watch=watch,
+            columnar=columnar,
+            dedup=dedup,
             ignore_patterns=ignore_patterns,
+            scan_workers=scan_workers,
+            jobs=jobs,
+            scan_index=scan_index,
             rules_file=rules_file,
             rules_cfg=rules_cfg,
             rules_combine=rules_combine,
@@ -1,3 +1,17 @@
 from .os_file_system import OSFileSystem
+from .ignore_matcher import IgnoreMatcher
+from .scan_index import ScanIndex
+from .content_sniffer import ThreadedContentSniffer
+from .duplicate_finder import HashingDuplicateFinder
+from .move_engine import MoveEngine
+from .name_index import NameIndex
 
-__all__ = ['OSFileSystem']
+__all__ = [
+    'OSFileSystem',
+    'IgnoreMatcher',
+    'ScanIndex',
+    'ThreadedContentSniffer',
+    'HashingDuplicateFinder',
+    'MoveEngine',
+    'NameIndex',
+]
@@ -0,0 +1,101 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple
+
+# Project modules
+from ...application import ContentSniffer
+from ...domain import FileItem
+
+# Header cache key: (inode, mtime, size) - changes whenever the file is replaced or rewritten
+HeaderKey = Tuple[int, float, int]
+
+
+class ThreadedContentSniffer(ContentSniffer):
+    """
+    ContentSniffer that reads headers on a thread pool, up to window files
+    ahead of the consumer.
+
+    While the use case classifies and moves file n, the headers of the next
+    files are already being read, so the small reads overlap each other and the
+    rest of the run instead of stalling it one by one.
+    Headers are kept in a bounded LRU cache keyed by (inode, mtime, size), so a
+    file seen again (watch mode, hard links, repeated runs in one process) is
+    not read twice.
+    """
+
+    __slots__ = ('_workers', '_window', '_cache', '_cache_size')
+
+    def __init__(self, workers: int = 8, window: int = 256, cache_size: int = 65536) -> None:
+        """
+        Args:
+            workers: Threads reading headers.
+            window: Max files read ahead of the one being yielded.
+            cache_size: Max headers kept in the cache; 0 disables it.
+        """
+        if workers < 1:
+            raise ValueError('workers must be >= 1')
+        if window < 1:
+            raise ValueError('window must be >= 1')
+        if cache_size < 0:
+            raise ValueError('cache_size must be >= 0')
+        self._workers = workers
+        self._window = window
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+
+    def prefetch(self, files: Iterable[FileItem], wanted: Callable[[FileItem], bool]) -> Iterator[FileItem]:
+        # (file, cache key, pending read) in yield order
+        queue: Deque[Tuple[FileItem, Optional[HeaderKey], Optional[Future]]] = deque()
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='sniffer') as pool:
+            for file_item in files:
+                key = None
+                future = None
+                if wanted(file_item):
+                    key = self._key(file_item)
+                    header = self._cache_get(key)
+                    if header is not None:
+                        file_item.provide_header(header)
+                    else:
+                        future = pool.submit(self._read_header, file_item.path)
+                queue.append((file_item, key, future))
+                if len(queue) > self._window:
+                    yield self._finish(*queue.popleft())
+            while queue:
+                yield self._finish(*queue.popleft())
+
+    def _finish(self, file_item: FileItem, key: Optional[HeaderKey], future: Optional[Future]) -> FileItem:
+        """Hand the read header to the file (on the consumer's thread) and cache it."""
+        if future is not None:
+            header = future.result()
+            file_item.provide_header(header)
+            if key is not None and self._cache_size:
+                self._cache[key] = header
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return file_item
+
+    def _cache_get(self, key: Optional[HeaderKey]) -> Optional[bytes]:
+        if key is None:
+            return None
+        header = self._cache.get(key)
+        if header is not None:
+            self._cache.move_to_end(key)
+        return header
+
+    @staticmethod
+    def _key(file_item: FileItem) -> Optional[HeaderKey]:
+        """Cache key from the file's stat data (from the scan); None without an inode (e.g. FileTable views)."""
+        inode, mtime, size = file_item.inode, file_item.mtime, file_item.size
+        if inode is None or mtime is None or size is None:
+            return None
+        return inode, mtime, size
+
+    @staticmethod
+    def _read_header(path: Path) -> bytes:
+        """Read the first FileItem.HEADER_SIZE bytes; empty if the file cannot be read. Runs on a worker."""
+        try:
+            with open(path, 'rb') as file:
+                return file.read(FileItem.HEADER_SIZE)
+        except OSError:
+            return b''
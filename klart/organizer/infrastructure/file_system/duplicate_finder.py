@@ -0,0 +1,165 @@
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+# Project modules
+from ...application import DuplicateFinder
+from ...domain import FileItem
+
+# Chunk size for the full hash when a file cannot be memory-mapped
+_READ_CHUNK = 1024 * 1024
+
+
+class HashingDuplicateFinder(DuplicateFinder):
+    """
+    DuplicateFinder that narrows candidates down in three rounds, each one
+    more expensive than the one before:
+
+        1. group by size (from the scan - no reads); a file without a same-size
+           peer is unique and is never opened (hard links to one file are
+           one file, stat-ed only within a group)
+        2. hash the first and last block of the remaining files
+           (the whole file when it is no longer than two blocks)
+        3. fully hash only the files still colliding, through mmap
+
+    Rounds 2 and 3 run on a thread pool - hashlib releases the GIL while
+    hashing, so reads and hashing of different files overlap.
+    Empty files are never reported as duplicates.
+    """
+
+    __slots__ = ('_workers', '_block_size')
+
+    def __init__(self, workers: int = 4, block_size: int = 64 * 1024) -> None:
+        """
+        Args:
+            workers: Threads reading and hashing files.
+            block_size: Bytes read from the start and from the end in round 2.
+        """
+        if workers < 1:
+            raise ValueError('workers must be >= 1')
+        if block_size < 1:
+            raise ValueError('block_size must be >= 1')
+        self._workers = workers
+        self._block_size = block_size
+
+    def find(self, files: Sequence[FileItem]) -> Dict[Path, Path]:
+        by_size: Dict[int, List[Path]] = {}
+        for file_item in files:
+            size = file_item.size
+            if size:
+                by_size.setdefault(size, []).append(file_item.path)
+        groups = {size: self._distinct(paths) for size, paths in by_size.items() if len(paths) > 1}
+        groups = {size: paths for size, paths in groups.items() if len(paths) > 1}
+        if not groups:
+            return {}
+
+        duplicates: Dict[Path, Path] = {}
+        with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='dedup') as pool:
+            # Round 2: first + last block
+            jobs = [(size, path) for size, paths in groups.items() for path in paths]
+            partials = pool.map(lambda job: self._partial_hash(job[1], job[0]), jobs)
+            by_partial: Dict[tuple, List[Path]] = {}
+            for (size, path), digest in zip(jobs, partials):
+                if digest is not None:
+                    by_partial.setdefault((size, digest), []).append(path)
+
+            # Round 3: full content, only where the partial hash was not the whole file
+            full_jobs: List[Path] = []
+            full_keys: List[tuple] = []
+            for (size, digest), paths in by_partial.items():
+                if len(paths) < 2:
+                    continue
+                if size <= 2 * self._block_size:
+                    self._record(paths, duplicates)
+                    continue
+                full_jobs.extend(paths)
+                full_keys.extend([(size, digest)] * len(paths))
+            by_full: Dict[tuple, List[Path]] = {}
+            for key, path, digest in zip(full_keys, full_jobs, pool.map(self._full_hash, full_jobs)):
+                if digest is not None:
+                    by_full.setdefault((key, digest), []).append(path)
+            for paths in by_full.values():
+                if len(paths) > 1:
+                    self._record(paths, duplicates)
+        return duplicates
+
+    def same_content(self, first: Path, second: Path) -> bool:
+        try:
+            first_stat = os.stat(first)
+            second_stat = os.stat(second)
+        except OSError:
+            return False
+        if (first_stat.st_dev, first_stat.st_ino) == (second_stat.st_dev, second_stat.st_ino):
+            # Same file (or hard links to it) - not a second copy of the content
+            return False
+        size = first_stat.st_size
+        if size != second_stat.st_size or size == 0:
+            return False
+        first_partial = self._partial_hash(first, size)
+        if first_partial is None or first_partial != self._partial_hash(second, size):
+            return False
+        if size <= 2 * self._block_size:
+            return True
+        first_full = self._full_hash(first)
+        return first_full is not None and first_full == self._full_hash(second)
+
+    @staticmethod
+    def _distinct(paths: List[Path]) -> List[Path]:
+        """
+        Paths of one size group minus repeated hard links: a second link to the
+        same (st_dev, st_ino) is the same file, not a copy (see same_content()).
+        """
+        seen = set()
+        distinct = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            key = (stat.st_dev, stat.st_ino)
+            if key not in seen:
+                seen.add(key)
+                distinct.append(path)
+        return distinct
+
+    @staticmethod
+    def _record(paths: List[Path], duplicates: Dict[Path, Path]) -> None:
+        """The first path of a group of identical files is kept, the others point to it."""
+        for path in paths[1:]:
+            duplicates[path] = paths[0]
+
+    def _partial_hash(self, path: Path, size: int) -> Optional[bytes]:
+        """Hash of the first and last block (whole file if it fits in two); None if unreadable."""
+        block = self._block_size
+        try:
+            with open(path, 'rb') as file:
+                if size <= 2 * block:
+                    data = file.read()
+                else:
+                    data = file.read(block)
+                    file.seek(size - block)
+                    data += file.read(block)
+        except OSError:
+            return None
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    @staticmethod
+    def _full_hash(path: Path) -> Optional[bytes]:
+        """Hash of the whole file, read through mmap; None if unreadable."""
+        digest = hashlib.blake2b()
+        try:
+            with open(path, 'rb') as file:
+                try:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        digest.update(mapped)
+                except (ValueError, OSError):
+                    # Not mappable (special file system, file shrank to 0) - plain reads
+                    file.seek(0)
+                    for chunk in iter(lambda: file.read(_READ_CHUNK), b''):
+                        digest.update(chunk)
+        except OSError:
+            return None
+        return digest.digest()
@@ -0,0 +1,96 @@
+import re
+from fnmatch import translate
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+# Characters that make a pattern a glob instead of a literal name
+_GLOB_CHARS = frozenset('*?[')
+
+
+class IgnoreMatcher:
+    """
+    All ignore patterns of one run compiled into a single matcher.
+
+    Patterns are sorted once into buckets, cheapest first:
+        literal names   'node_modules', '.DS_Store'  -> set lookup
+        suffix globs    '*.log', '*.tar.gz'          -> one str.endswith(tuple)
+        other globs     'IMG_????.jpg', '*~*'        -> one combined regex
+        path globs      'build/*.o'                  -> Path.match (rare)
+
+    A trailing slash marks a directory-only pattern ('node_modules/', '.git/'):
+    it never matches files, and a matched directory is skipped by the scanner
+    as a whole, so nothing inside it is listed or checked.
+    """
+
+    __slots__ = ('_file', '_dir', '_empty')
+
+    def __init__(self, patterns: Optional[Iterable[str]] = None) -> None:
+        """
+        Args:
+            patterns: Glob patterns, same syntax as Path.match(). Patterns without
+                a slash are matched against the entry name only.
+        """
+        file_patterns: List[str] = []
+        dir_patterns: List[str] = []
+        for pattern in patterns or []:
+            if not pattern:
+                continue
+            if pattern.endswith('/'):
+                dir_patterns.append(pattern.rstrip('/'))
+            else:
+                # Regular patterns apply to files and directories alike
+                file_patterns.append(pattern)
+                dir_patterns.append(pattern)
+
+        self._file = _CompiledPatterns(file_patterns)
+        self._dir = _CompiledPatterns(dir_patterns)
+        self._empty = not file_patterns and not dir_patterns
+
+    def is_ignored(self, name: str, path: Path, is_dir: bool) -> bool:
+        """Return True if the entry (file or directory) matches an ignore pattern."""
+        if self._empty:
+            return False
+        if is_dir:
+            return self._dir.match(name, path)
+        return self._file.match(name, path)
+
+
+class _CompiledPatterns:
+    """One bucketed set of patterns; see IgnoreMatcher."""
+
+    __slots__ = ('_names', '_suffixes', '_regex', '_path_patterns')
+
+    def __init__(self, patterns: List[str]) -> None:
+        names = set()
+        suffixes: List[str] = []
+        globs: List[str] = []
+        path_patterns: List[str] = []
+
+        for pattern in patterns:
+            if '/' in pattern:
+                path_patterns.append(pattern)
+            elif not _GLOB_CHARS.intersection(pattern):
+                names.add(pattern)
+            elif pattern.startswith('*') and not _GLOB_CHARS.intersection(pattern[1:]):
+                suffixes.append(pattern[1:])
+            else:
+                globs.append(pattern)
+
+        self._names = frozenset(names)
+        self._suffixes: Tuple[str, ...] = tuple(suffixes)
+        self._regex: Optional[Pattern[str]] = None
+        if globs:
+            self._regex = re.compile('|'.join(f'(?:{translate(glob)})' for glob in globs))
+        self._path_patterns = tuple(path_patterns)
+
+    def match(self, name: str, path: Path) -> bool:
+        if name in self._names:
+            return True
+        if self._suffixes and name.endswith(self._suffixes):
+            return True
+        if self._regex is not None and self._regex.match(name):
+            return True
+        for pattern in self._path_patterns:
+            if path.match(pattern):
+                return True
+        return False
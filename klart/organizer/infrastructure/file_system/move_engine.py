@@ -0,0 +1,138 @@
+import errno
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Tuple
+
+# Copies up to count bytes from src_fd at offset to the same offset in dst_fd; returns bytes copied (0 at EOF)
+Copier = Callable[[int, int, int, int], int]
+
+# errno values meaning "this copy primitive does not work for these files" - try the next one
+_UNSUPPORTED = frozenset(
+    code
+    for code in (
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+        getattr(errno, 'ENOTSOCK', errno.EINVAL),
+        getattr(errno, 'ENODATA', errno.EINVAL),
+    )
+)
+
+
+class MoveEngine:
+    """
+    Moves one file to a destination path that is known to be free.
+
+    Same file system: a single os.rename() - no copy, no metadata calls.
+    Across file systems (rename fails with EXDEV): the data is copied in the
+    kernel with os.copy_file_range(), or os.sendfile() where that is not
+    available, chunk_size bytes per call, so it never passes through Python
+    buffers. Then permissions and timestamps are copied and the source is
+    unlinked. Plain read/write is only the last resort, where neither works.
+    A failed copy removes the partial destination and keeps the source.
+    """
+
+    __slots__ = ('_chunk_size',)
+
+    def __init__(self, chunk_size: int = 8 * 1024 * 1024) -> None:
+        """
+        Args:
+            chunk_size: Bytes per kernel copy call in a cross-device move.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be >= 1')
+        self._chunk_size = chunk_size
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    def move(self, source: Path, destination: Path) -> None:
+        """Move source to destination; raises OSError like os.rename() does."""
+        try:
+            os.rename(source, destination)
+            return
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+        self._move_across(source, destination)
+
+    def _move_across(self, source: Path, destination: Path) -> None:
+        """Cross-device move: copy data and metadata, then unlink the source."""
+        if os.path.islink(source):
+            # Like shutil.move: the link itself is moved, not the file it points to
+            os.symlink(os.readlink(source), destination)
+            os.unlink(source)
+            return
+        try:
+            self._copy(source, destination)
+            shutil.copystat(source, destination)
+        except BaseException:
+            try:
+                os.unlink(destination)
+            except OSError:
+                pass
+            raise
+        os.unlink(source)
+
+    def _copy(self, source: Path, destination: Path) -> None:
+        """Copy the file data, trying each copy primitive until one works."""
+        src_fd = os.open(source, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            dst_fd = os.open(
+                destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600
+            )
+            try:
+                size = os.fstat(src_fd).st_size
+                offset = 0
+                for copier in self._copiers():
+                    # Not every primitive takes offsets - positions must match for the next one
+                    os.lseek(src_fd, offset, os.SEEK_SET)
+                    os.lseek(dst_fd, offset, os.SEEK_SET)
+                    try:
+                        while True:
+                            copied = copier(src_fd, dst_fd, offset, self._chunk_size)
+                            if copied == 0:
+                                break
+                            offset += copied
+                    except OSError as exc:
+                        if exc.errno not in _UNSUPPORTED:
+                            raise
+                        continue
+                    # 0 before the end: some file systems report it instead of an error
+                    if offset >= size:
+                        return
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    @staticmethod
+    def _copiers() -> Tuple[Copier, ...]:
+        """Copy primitives this platform has, fastest first."""
+        copiers: Tuple[Copier, ...] = ()
+        if hasattr(os, 'copy_file_range'):
+            copiers += (MoveEngine._copy_file_range,)
+        if hasattr(os, 'sendfile'):
+            copiers += (MoveEngine._sendfile,)
+        return copiers + (MoveEngine._read_write,)
+
+    @staticmethod
+    def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+        return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+    @staticmethod
+    def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+        return os.sendfile(dst_fd, src_fd, offset, count)
+
+    @staticmethod
+    def _read_write(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+        # Works from the file positions (os.pread/pwrite are not on every platform)
+        data = os.read(src_fd, count)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        return len(data)
@@ -0,0 +1,94 @@
+import os
+import re
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Set, Tuple
+
+# 'report_(3)' -> ('report', '3'); trailing counters of a conflict-resolved stem
+_COUNTER = re.compile(r'^(.*)_\((\d+)\)$')
+_COUNTERS = re.compile(r'(_\(\d+\))+$')
+
+
+def split_name(name: str) -> Tuple[str, str]:
+    """(stem, suffix) of a file name, same rules as Path.stem / Path.suffix."""
+    i = name.rfind('.')
+    if 0 < i < len(name) - 1:
+        return name[:i], name[i:]
+    return name, ''
+
+
+class NameIndex:
+    """
+    Names reserved in one destination directory by moves still in flight, and
+    the highest `_(n)` counter used for every (stem, suffix), so a name
+    conflict is resolved without listing the directory again.
+
+    The directory is listed once, on its first conflict - until then a free name
+    costs one lexists() as before. The disk stays the source of truth: a name is
+    free when nothing exists there and no move in flight (parallel jobs) holds it,
+    so a file created by another program is never overwritten, and a name whose
+    file was removed is handed out again. A name is held from reserve() until
+    release(), so only moves in flight are kept in memory. Thread-safe.
+    """
+
+    __slots__ = ('_path', '_reserved', '_counters', '_listed', '_lock')
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._reserved: Set[str] = set()
+        # (stem, suffix) -> highest n of a 'stem_(n)suffix' seen taken
+        self._counters: Dict[Tuple[str, str], int] = {}
+        self._listed = False
+        self._lock = Lock()
+
+    def reserve(self, name: str) -> str:
+        """
+        Return name if it is free in the directory, else the next free
+        'stem_(n)suffix' (existing counters on the stem are replaced), and hold it
+        until release().
+        """
+        with self._lock:
+            if not self._taken(name):
+                self._reserved.add(name)
+                return name
+            self._list()
+            stem, suffix = split_name(name)
+            stem = _COUNTERS.sub('', stem)
+            n = self._counters.get((stem, suffix), 0)
+            while True:
+                n += 1
+                candidate = f'{stem}_({n}){suffix}'
+                if not self._taken(candidate):
+                    break
+            self._reserved.add(candidate)
+            self._note(candidate)
+            return candidate
+
+    def release(self, name: str) -> None:
+        """The move that reserved name is done - it now exists on disk, or was never used."""
+        with self._lock:
+            self._reserved.discard(name)
+
+    def _taken(self, name: str) -> bool:
+        return name in self._reserved or os.path.lexists(self._path / name)
+
+    def _list(self) -> None:
+        """Record the counters of every entry of the directory, once."""
+        if self._listed:
+            return
+        self._listed = True
+        try:
+            with os.scandir(self._path) as iterator:
+                for entry in iterator:
+                    self._note(entry.name)
+        except FileNotFoundError:
+            pass
+
+    def _note(self, name: str) -> None:
+        stem, suffix = split_name(name)
+        match = _COUNTER.match(stem)
+        if match:
+            key = (match.group(1), suffix)
+            n = int(match.group(2))
+            if n > self._counters.get(key, 0):
+                self._counters[key] = n
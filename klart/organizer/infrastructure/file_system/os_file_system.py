@@ -1,11 +1,17 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-import re
-from shutil import move as shutil_move
-from typing import List, Optional
+from queue import Full, Queue
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 # Project modules
+from .ignore_matcher import IgnoreMatcher
+from .move_engine import MoveEngine
+from .name_index import NameIndex
+from .scan_index import Entry, ScanIndex, Stat
 from ...application import FileSystem
-from ...domain import Directory, FileItem
+from ...domain import Directory, FileItem, FileTable
 from ...exceptions import (
     SourceFileNotFoundError,
     PermissionDeniedError,
@@ -14,55 +20,392 @@ from ...exceptions import (
 )
 
 
+# How many files one stat task handles in a parallel scan
+_STAT_CHUNK_SIZE = 256
+
+# Marks the end of a stream() producer queue
+_STREAM_END = object()
+
+# Called with a file suffix - False means the scan may skip stat() for that file
+StatFilter = Callable[[str], bool]
+
+
 class OSFileSystem(FileSystem):
     """
-    Real file system adapter using pathlib and shutil.
+    Real file system adapter using os.scandir, pathlib and shutil.
     All I/O exceptions are caught and wrapped into custom exceptions.
+
+    move() may be called from several threads at once: conflict-resolved names
+    are claimed per destination directory, and in-memory tree updates are serialized.
     """
 
-    def scan(self, path: Path, recursive: bool = False, ignore_patterns: Optional[List[str]] = None) -> Directory:
+    def __init__(
+        self,
+        scan_workers: int = 1,
+        stream_buffer: int = 1024,
+        scan_index: Optional[ScanIndex] = None,
+        move_engine: Optional[MoveEngine] = None,
+    ) -> None:
+        """
+        Args:
+            scan_workers: Number of threads used for recursive scans.
+                1 keeps the plain sequential walk; more than 1 lists sibling
+                subdirectories and stats their files concurrently.
+            stream_buffer: Max number of scanned files stream() keeps queued
+                ahead of the consumer before the scanner blocks.
+            scan_index: Persistent listing cache; directories whose mtime did not
+                change since the last run are rebuilt from it instead of listed.
+            move_engine: Performs the moves (rename, or a kernel copy across
+                devices); a default MoveEngine if not given.
+        """
+        if scan_workers < 1:
+            raise ValueError('scan_workers must be >= 1')
+        if stream_buffer < 1:
+            raise ValueError('stream_buffer must be >= 1')
+        self._scan_workers = scan_workers
+        self._stream_buffer = stream_buffer
+        self._index = scan_index
+        self._mover = move_engine if move_engine is not None else MoveEngine()
+        # Destination directories known to exist - created (mkdir) once, not once per move
+        self._known_dirs: Set[Path] = set()
+        # Destination directory -> its taken names and `_(n)` counters (built lazily)
+        self._name_indexes: Dict[Path, NameIndex] = {}
+        self._indexes_guard = Lock()
+        # Directory/FileItem trees are not thread-safe - one update at a time
+        self._tree_lock = Lock()
+
+    def scan(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[StatFilter] = None,
+    ) -> Directory:
         """
         Scan a directory and build an in‑memory tree.
         """
         try:
+            if self._index is not None:
+                self._index.load(path, ignore_patterns)
             root = Directory(path)
-            self._scan_directory(root, recursive, ignore_patterns or [])
+            if recursive and self._scan_workers > 1:
+                self._scan_parallel(root, IgnoreMatcher(ignore_patterns), needs_stat)
+            else:
+                self._scan_directory(root, recursive, IgnoreMatcher(ignore_patterns), needs_stat)
+            if self._index is not None:
+                self._index.save(path, recursive)
             return root
         except PermissionError as exc:
             raise PermissionDeniedError(f'Permission denied while scanning {path}: {exc}') from exc
         except OSError as exc:
             raise FileSystemError(f'OS error while scanning {path}: {exc}') from exc
 
-    def _scan_directory(self, directory: Directory, recursive: bool, ignore_patterns: List[str]) -> None:
+    def scan_table(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[StatFilter] = None,
+    ) -> FileTable:
+        """
+        Scan a directory straight into a FileTable - no Directory or FileItem
+        objects are created, only column rows (see FileTable).
+        """
+        try:
+            if self._index is not None:
+                self._index.load(path, ignore_patterns)
+            ignore = IgnoreMatcher(ignore_patterns)
+            table = FileTable()
+            stack = [path]
+            while stack:
+                dir_path = stack.pop()
+                entries = self._list_directory(dir_path, ignore, True, needs_stat)
+                dir_id = table.add_dir(dir_path)
+                sub_paths = []
+                for child_path, is_dir, stat in entries:
+                    if is_dir:
+                        if recursive:
+                            sub_paths.append(child_path)
+                    elif stat is None:
+                        table.append(dir_id, child_path.name)
+                    else:
+                        table.append(dir_id, child_path.name, stat[0], stat[1], stat[3])
+                # Reversed so subdirectories are visited in listing order
+                stack.extend(reversed(sub_paths))
+            if self._index is not None:
+                self._index.save(path, recursive)
+            return table
+        except PermissionError as exc:
+            raise PermissionDeniedError(f'Permission denied while scanning {path}: {exc}') from exc
+        except OSError as exc:
+            raise FileSystemError(f'OS error while scanning {path}: {exc}') from exc
+
+    def stream(
+        self,
+        path: Path,
+        recursive: bool = False,
+        ignore_patterns: Optional[List[str]] = None,
+        needs_stat: Optional[StatFilter] = None,
+    ) -> Iterator[FileItem]:
+        """
+        Yield files while the scan is still running.
+
+        A producer thread lists directories and puts FileItems into a bounded queue;
+        when the consumer falls behind the queue fills up and the producer waits
+        (backpressure). Every listed directory gets its own detached Directory,
+        so files that were consumed can be garbage collected.
+        """
+        if self._index is not None:
+            self._index.load(path, ignore_patterns)
+        queue: Queue = Queue(maxsize=self._stream_buffer)
+        stop = Event()
+        producer = Thread(
+            target=self._produce,
+            args=(path, recursive, IgnoreMatcher(ignore_patterns), needs_stat, queue, stop),
+            name='klart-scan',
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while True:
+                item = queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Consumer finished or gave up early - let the producer exit
+            stop.set()
+            producer.join()
+
+    def _produce(
+        self,
+        path: Path,
+        recursive: bool,
+        ignore: IgnoreMatcher,
+        needs_stat: Optional[StatFilter],
+        queue: Queue,
+        stop: Event,
+    ) -> None:
+        """stream() producer: depth-first walk that feeds FileItems into the queue."""
+        try:
+            stack = [path]
+            while stack and not stop.is_set():
+                dir_path = stack.pop()
+                entries = self._list_directory(dir_path, ignore, True, needs_stat)
+                directory = Directory(dir_path)
+                sub_paths = []
+                for child_path, is_dir, stat in entries:
+                    if is_dir:
+                        if recursive:
+                            sub_paths.append(child_path)
+                    elif not self._put(queue, self._make_file_item(child_path, directory, stat), stop):
+                        return
+                # Reversed so subdirectories are visited in listing order
+                stack.extend(reversed(sub_paths))
+            # Only a complete walk may prune the index
+            if self._index is not None and not stack:
+                self._index.save(path, recursive)
+        except PermissionError as exc:
+            self._put(queue, PermissionDeniedError(f'Permission denied while scanning {path}: {exc}'), stop)
+        except OSError as exc:
+            self._put(queue, FileSystemError(f'OS error while scanning {path}: {exc}'), stop)
+        except Exception as exc:
+            self._put(queue, exc, stop)
+        finally:
+            self._put(queue, _STREAM_END, stop)
+
+    def _put(self, queue: Queue, item: object, stop: Event) -> bool:
+        """Blocking put that gives up once the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _scan_directory(
+        self, directory: Directory, recursive: bool, ignore: IgnoreMatcher, needs_stat: Optional[StatFilter]
+    ) -> None:
         """
         Recursively populate a directory with its children.
         """
+        entries = self._list_directory(directory.path, ignore, True, needs_stat)
+        for sub_dir in self._populate(directory, entries):
+            if recursive:
+                self._scan_directory(sub_dir, recursive, ignore, needs_stat)
+
+    def _scan_parallel(self, root: Directory, ignore: IgnoreMatcher, needs_stat: Optional[StatFilter]) -> None:
+        """
+        Recursively populate the tree using a bounded pool of worker threads.
+
+        Workers only do I/O: listing a directory, or stat-ing a chunk of its files.
+        The tree itself is built on the calling thread, one directory at a time
+        and in listing order, so the result is the same tree the sequential walk builds.
+        """
+        # future -> (directory, its entries, chunk indexes) - indexes are None for a listing
+        pending: Dict[Future, Tuple[Directory, Optional[List[Entry]], Optional[List[int]]]] = {}
+        # directory -> number of stat chunks still running for it
+        chunks_left: Dict[Directory, int] = {}
+
+        with ThreadPoolExecutor(max_workers=self._scan_workers) as executor:
+
+            def submit_listing(directory: Directory) -> None:
+                future = executor.submit(self._list_directory, directory.path, ignore, False, needs_stat)
+                pending[future] = (directory, None, None)
+
+            def populate(directory: Directory, entries: List[Entry]) -> None:
+                for sub_dir in self._populate(directory, entries):
+                    submit_listing(sub_dir)
+
+            submit_listing(root)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, entries, chunk = pending.pop(future)
+
+                    if chunk is None:
+                        # Listing finished: fan its files out to stat workers
+                        entries = future.result()
+                        # Entries that came from the scan index already carry stat data
+                        file_indexes = [
+                            i
+                            for i, (path, is_dir, stat) in enumerate(entries)
+                            if not is_dir and stat is None and self._wants_stat(path.name, needs_stat)
+                        ]
+                        if not file_indexes:
+                            self._record(directory.path, entries)
+                            populate(directory, entries)
+                            continue
+                        chunks = [
+                            file_indexes[i : i + _STAT_CHUNK_SIZE]
+                            for i in range(0, len(file_indexes), _STAT_CHUNK_SIZE)
+                        ]
+                        chunks_left[directory] = len(chunks)
+                        for indexes in chunks:
+                            paths = [entries[i][0] for i in indexes]
+                            stat_future = executor.submit(self._stat_paths, paths)
+                            pending[stat_future] = (directory, entries, indexes)
+                        continue
+
+                    # Stat chunk finished: store results, populate once all chunks are in
+                    for index, stat in zip(chunk, future.result()):
+                        path, is_dir, _ = entries[index]
+                        entries[index] = (path, is_dir, stat)
+                    chunks_left[directory] -= 1
+                    if chunks_left[directory] == 0:
+                        del chunks_left[directory]
+                        self._record(directory.path, entries)
+                        populate(directory, entries)
+
+    def _list_directory(
+        self, path: Path, ignore: IgnoreMatcher, stat_files: bool, needs_stat: Optional[StatFilter] = None
+    ) -> List[Entry]:
+        """
+        List one directory with os.scandir and return (path, is_dir, stat) entries.
+
+        The entry type comes from the directory listing itself, so no extra
+        stat() is needed to tell files from directories. If stat_files is True
+        the DirEntry stat result of every file needs_stat accepts is fetched here as well.
+        With a scan index an unchanged directory is returned from the index.
+        Touches no tree objects - safe to run on a worker thread.
+        """
+        entries: List[Entry] = []
         try:
-            for child_path in directory.path.iterdir():
-                if self._is_ignored(child_path, ignore_patterns):
-                    continue
-
-                if child_path.is_file():
-                    # FileItem constructor automatically registers with parent
-                    FileItem(child_path, directory)
-                elif child_path.is_dir():
-                    sub_dir = Directory(child_path, directory)
-                    if recursive:
-                        self._scan_directory(sub_dir, recursive, ignore_patterns)
+            if self._index is not None:
+                cached = self._index.get(path)
+                if cached is not None:
+                    if stat_files:
+                        # The index may come from a run that skipped stat for some files
+                        return self._fill_stats(cached, needs_stat)
+                    return cached
+
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    child_path = Path(entry.path)
+                    is_dir = entry.is_dir()
+                    if ignore.is_ignored(entry.name, child_path, is_dir):
+                        # An ignored directory is pruned - its subtree is never listed
+                        continue
+
+                    if is_dir:
+                        entries.append((child_path, True, None))
+                    elif entry.is_file():
+                        stat = None
+                        if stat_files and self._wants_stat(entry.name, needs_stat):
+                            try:
+                                result = entry.stat()
+                                stat = (result.st_size, result.st_mtime, result.st_ino, result.st_ctime)
+                            except OSError:
+                                stat = None
+                        entries.append((child_path, False, stat))
         except PermissionError:
             # Skip directories we cannot read – not an error
-            pass
+            return []
         except OSError as exc:
-            raise FileSystemError(f'Error while iterating {directory.path}: {exc}') from exc
-
-    def _is_ignored(self, path: Path, patterns: List[str]) -> bool:
-        """Return True if the path matches any ignore pattern."""
-        if not patterns:
-            return False
-        for pattern in patterns:
-            if path.match(pattern) or path.name == pattern:
-                return True
-        return False
+            raise FileSystemError(f'Error while iterating {path}: {exc}') from exc
+        if stat_files:
+            self._record(path, entries)
+        return entries
+
+    @staticmethod
+    def _wants_stat(name: str, needs_stat: Optional[StatFilter]) -> bool:
+        """Whether the scan should stat the file called name."""
+        return needs_stat is None or needs_stat(FileItem.suffix_of(name))
+
+    def _fill_stats(self, entries: List[Entry], needs_stat: Optional[StatFilter]) -> List[Entry]:
+        """Stat the files of cached entries that have no stat data but are wanted now."""
+        missing = [
+            i
+            for i, (path, is_dir, stat) in enumerate(entries)
+            if not is_dir and stat is None and self._wants_stat(path.name, needs_stat)
+        ]
+        for index, stat in zip(missing, self._stat_paths([entries[i][0] for i in missing])):
+            entries[index] = (entries[index][0], False, stat)
+        return entries
+
+    def _record(self, path: Path, entries: List[Entry]) -> None:
+        """Store a fresh listing in the scan index (if one is used)."""
+        if self._index is not None:
+            self._index.put(path, entries)
+
+    def _stat_paths(self, paths: List[Path]) -> List[Optional[Stat]]:
+        """Stat a chunk of files. Failed stats become None (FileItem falls back to lazy stat)."""
+        stats: List[Optional[Stat]] = []
+        for path in paths:
+            try:
+                result = os.stat(path)
+                stats.append((result.st_size, result.st_mtime, result.st_ino, result.st_ctime))
+            except OSError:
+                stats.append(None)
+        return stats
+
+    def _populate(self, directory: Directory, entries: List[Entry]) -> List[Directory]:
+        """
+        Attach listed entries to directory in listing order.
+        Returns the created subdirectories so the caller can descend into them.
+        """
+        sub_dirs = []
+        # Sizes of the whole listing reach the ancestors in one step
+        with directory.batch():
+            for path, is_dir, stat in entries:
+                if is_dir:
+                    sub_dirs.append(Directory(path, directory))
+                else:
+                    self._make_file_item(path, directory, stat)
+        return sub_dirs
+
+    def _make_file_item(self, path: Path, directory: Directory, stat: Optional[Stat]) -> FileItem:
+        """
+        Create a FileItem, handing over scanned stat data when there is some.
+        FileItem constructor automatically registers with parent.
+        """
+        if stat is None:
+            return FileItem(path, directory)
+        size, mtime, inode, ctime = stat
+        return FileItem(path, directory, size=size, mtime=mtime, inode=inode, ctime=ctime)
 
     def move(self, file_item: FileItem, destination: Path, new_parent: Directory, dry_run: bool) -> None:
         """
@@ -74,10 +417,27 @@ class OSFileSystem(FileSystem):
                 raise SourceFileNotFoundError(f'Source file does not exist: {file_item.path}')
 
             if not dry_run:
-                destination.parent.mkdir(parents=True, exist_ok=True)
-                final_dest = self._resolve_conflict(destination)
-                shutil_move(str(file_item.path), str(final_dest))
-                file_item.update_location(final_dest, new_parent)
+                parent = destination.parent
+                self._ensure_dir(parent)
+                # The name stays reserved until the move is done, so a concurrent
+                # move to the same directory resolves to a different name
+                names = self._name_index(parent)
+                final_dest = parent / names.reserve(destination.name)
+                try:
+                    try:
+                        self._mover.move(file_item.path, final_dest)
+                    except FileNotFoundError:
+                        # The folder was removed since we created it - forget it, retry once
+                        if parent.is_dir():
+                            raise
+                        self._known_dirs.discard(parent)
+                        self._ensure_dir(parent)
+                        self._mover.move(file_item.path, final_dest)
+                finally:
+                    # Moved: the file itself holds the name now. Failed: the name is free
+                    names.release(final_dest.name)
+                with self._tree_lock:
+                    file_item.update_location(final_dest, new_parent)
             else:
                 # In dry run, we may still want to update the tree to simulate the move.
                 # But for consistency, we'll keep the tree unchanged.
@@ -90,28 +450,71 @@ class OSFileSystem(FileSystem):
         except OSError as exc:
             raise FileSystemError(f'OS error while moving {file_item.path} -> {destination}: {exc}') from exc
 
-    def _resolve_conflict(self, path: Path) -> Path:
-        """
-        If a file already exists at the given path, generate a new unique name
-        by appending `_(n)` before the extension.
-        """
-        if not path.exists():
-            return path
+    def reserve_name(self, destination: Path) -> Path:
+        return destination.parent / self._name_index(destination.parent).reserve(destination.name)
 
-        stem = re.sub(r'(_\(\d+\))+$', '', path.stem)
-        suffix = path.suffix
-        parent = path.parent
+    def device(self, path: Path) -> Optional[int]:
+        for candidate in (path, *path.parents):
+            try:
+                return os.stat(candidate).st_dev
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return None
+        return None
 
-        pattern = re.compile(rf'^{re.escape(stem)}_\((\d+)\){re.escape(suffix)}$')
-        max_n = 0
-        for entry in parent.iterdir():
-            match = pattern.match(entry.name)
-            if match:
-                max_n = max(max_n, int(match.group(1)))
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p path unless a move in this process already made sure it exists."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
 
-        new_path = parent / f'{stem}_({max_n + 1}){suffix}'
+    def _name_index(self, path: Path) -> NameIndex:
+        """The name index of destination directory path (created on first use)."""
+        with self._indexes_guard:
+            index = self._name_indexes.get(path)
+            if index is None:
+                index = self._name_indexes[path] = NameIndex(path)
+            return index
+
+    def remove(self, file_item: FileItem, dry_run: bool) -> None:
+        """
+        Delete a file. If dry_run is True, nothing is deleted.
+        After successful removal, the file is detached from its parent.
+        """
+        try:
+            if not dry_run:
+                file_item.path.unlink()
+                if file_item.parent is not None:
+                    with self._tree_lock:
+                        file_item.parent.del_child(file_item)
+        except FileNotFoundError as exc:
+            raise SourceFileNotFoundError(f'Source file does not exist: {file_item.path}') from exc
+        except PermissionError as exc:
+            raise PermissionDeniedError(f'Permission denied removing {file_item.path}: {exc}') from exc
+        except OSError as exc:
+            raise FileSystemError(f'OS error removing {file_item.path}: {exc}') from exc
 
-        return new_path
+    def replace_with_link(self, file_item: FileItem, target: Path, dry_run: bool) -> None:
+        """
+        Replace a file by a hard link to target. The link is created under a
+        temporary name first and renamed over the file, so the file is never missing.
+        Fails if both are on different file systems. If dry_run is True, nothing changes.
+        """
+        if dry_run:
+            return
+        temp_path = file_item.path.with_name(f'.{file_item.name}.klart-link')
+        try:
+            os.link(target, temp_path)
+            os.replace(temp_path, file_item.path)
+        except OSError as exc:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            if isinstance(exc, PermissionError):
+                raise PermissionDeniedError(f'Permission denied linking {file_item.path} -> {target}: {exc}') from exc
+            raise FileSystemError(f'OS error linking {file_item.path} -> {target}: {exc}') from exc
 
     def mkdir(self, path: Path, parents: bool = True) -> None:
         try:
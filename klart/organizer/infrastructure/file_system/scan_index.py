@@ -0,0 +1,148 @@
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Union
+
+# Stat data kept per file: (size, mtime, inode, ctime)
+Stat = Tuple[int, float, int, float]
+# One listed directory entry: (path, is_dir, stat or None)
+Entry = Tuple[Path, bool, Optional[Stat]]
+
+# Bump when the on-disk layout changes - older files are then simply discarded
+_INDEX_VERSION = 3
+
+# A directory modified this recently may still change within the same mtime tick,
+# so its listing is not trusted on the next run (same idea as git's "racy" entries)
+_RACY_SECONDS = 2.0
+
+
+class ScanIndex:
+    """
+    On-disk cache of directory listings, keyed by directory mtime and inode.
+
+    For every scanned directory the index keeps (mtime_ns, inode, children).
+    On the next run a directory whose mtime and inode did not change is rebuilt
+    from the index instead of being listed and stat-ed again - one stat() of
+    the directory replaces a scandir() plus a stat() per file.
+
+    Adding, removing or renaming entries always bumps the directory mtime,
+    so listings stay correct. File sizes/mtimes are taken from the index too:
+    a file rewritten in place (same name) keeps its old size until its
+    directory changes.
+
+    Listings are kept per scan root, each with the ignore patterns it was
+    built with, so roots scanned with different patterns do not discard
+    each other's listings.
+
+    The index is only a cache: a missing, corrupt or unwritable file never fails a scan.
+    """
+
+    __slots__ = ('_file_path', '_roots', '_dirs', '_pending', '_seen', '_loaded', '_lock')
+
+    def __init__(self, file_path: Union[Path, str]) -> None:
+        """
+        Args:
+            file_path: JSON file the index is loaded from and saved to.
+        """
+        self._file_path = Path(file_path)
+        # root path -> {'ignore': [...], 'dirs': {...}} for every root in the file
+        self._roots: Dict[str, dict] = {}
+        # Listings of the root being scanned:
+        # dir path -> [mtime_ns, inode, [[name, is_dir, size, mtime, inode, ctime], ...]]
+        # (size/mtime/inode/ctime are null for a file that was not stat-ed)
+        self._dirs: Dict[str, list] = {}
+        # dir path -> (mtime_ns, inode) seen by get() and not yet stored by put()
+        self._pending: Dict[str, Tuple[int, int]] = {}
+        self._seen: set = set()
+        self._loaded = False
+        self._lock = Lock()
+
+    def load(self, root: Path, ignore_patterns: Optional[List[str]] = None) -> None:
+        """
+        Read the index file (once) and select the listings of root. Listings
+        are stored after ignore filtering, so the ones of root written with
+        other ignore patterns are discarded.
+        """
+        ignore = list(ignore_patterns or [])
+        if not self._loaded:
+            self._loaded = True
+            try:
+                with open(self._file_path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                if isinstance(data, dict) and data.get('version') == _INDEX_VERSION:
+                    self._roots = data.get('roots', {})
+            except (OSError, ValueError):
+                self._roots = {}
+        section = self._roots.get(str(root))
+        if section is None or section.get('ignore') != ignore:
+            section = self._roots[str(root)] = {'ignore': ignore, 'dirs': {}}
+        self._dirs = section['dirs']
+        self._seen = set()
+
+    def get(self, path: Path) -> Optional[List[Entry]]:
+        """
+        Return the cached entries of path if the directory is unchanged, else None.
+        A miss remembers the directory stat so a later put() stores it under that key.
+        Raises OSError if the directory itself cannot be stat-ed.
+        """
+        stat = os.stat(path)
+        key = str(path)
+        with self._lock:
+            self._seen.add(key)
+            record = self._dirs.get(key)
+            if record is not None and record[0] == stat.st_mtime_ns and record[1] == stat.st_ino:
+                return [
+                    (path / name, bool(is_dir), None if is_dir or size is None else (size, mtime, inode, ctime))
+                    for name, is_dir, size, mtime, inode, ctime in record[2]
+                ]
+            self._pending[key] = (stat.st_mtime_ns, stat.st_ino)
+        return None
+
+    def put(self, path: Path, entries: List[Entry]) -> None:
+        """
+        Store the listing of a directory that missed in get().
+        The directory stat was taken before listing, so a change made during
+        the listing makes the stored key stale and forces a rescan next time.
+        """
+        key = str(path)
+        with self._lock:
+            dir_key = self._pending.pop(key, None)
+            if dir_key is None:
+                return
+            if time.time() - dir_key[0] / 1e9 < _RACY_SECONDS:
+                self._dirs.pop(key, None)
+                return
+            children = []
+            for child_path, is_dir, stat in entries:
+                if is_dir:
+                    children.append([child_path.name, 1, 0, 0, 0, 0])
+                elif stat is None:
+                    # Not stat-ed (not needed, or failed) - FileItem fetches it lazily if asked
+                    children.append([child_path.name, 0, None, None, None, None])
+                else:
+                    children.append([child_path.name, 0, *stat])
+            self._dirs[key] = [dir_key[0], dir_key[1], children]
+
+    def save(self, root: Path, recursive: bool) -> None:
+        """
+        Write the index back to disk. After a recursive scan, directories under
+        root that it did not reach (deleted, or now ignored) are dropped first;
+        a non-recursive scan only saw root itself, so its subtree is kept.
+        """
+        prefix = str(root).rstrip(os.sep) + os.sep
+        with self._lock:
+            if recursive:
+                for key in [k for k in self._dirs if k.startswith(prefix) and k not in self._seen]:
+                    del self._dirs[key]
+            data = {'version': _INDEX_VERSION, 'roots': self._roots}
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._file_path.with_name(self._file_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, separators=(',', ':'))
+            os.replace(tmp_path, self._file_path)
+        except OSError:
+            # The index is only a cache - a failed write just means a full scan next time
+            pass
@@ -0,0 +1,3 @@
+from .json_plan_repo import JsonPlanRepository
+
+__all__ = ['JsonPlanRepository']
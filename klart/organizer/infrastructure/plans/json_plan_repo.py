@@ -0,0 +1,94 @@
+import json
+import os
+from pathlib import Path
+from typing import Union
+
+# Project modules
+from ...application import MovePlan, PlanRepository
+from ...exceptions import PlanError, PlanFileNotFoundError, PlanFormatError
+
+# Bump when the layout changes - older plans are then rejected, not misread
+_PLAN_VERSION = 1
+
+
+class JsonPlanRepository(PlanRepository):
+    """
+    Stores a MovePlan as a JSON file:
+
+        {"version": 1, "source_dir": "...", "dest_dir": "...", "moves": [
+        ["inbox/a.pdf", "Documents/a.pdf"],
+        ...
+        ]}
+
+    Sources are stored relative to source_dir and destinations relative to
+    dest_dir (absolute when outside them), one move per line - compact, and
+    easy to review, grep or diff before the plan is applied.
+    """
+
+    __slots__ = ('_file_path',)
+
+    def __init__(self, file_path: Union[Path, str]):
+        self._file_path = Path(file_path)
+
+    def save(self, plan: MovePlan) -> None:
+        header = (
+            f'{{"version": {_PLAN_VERSION}, '
+            f'"source_dir": {json.dumps(str(plan.source_dir), ensure_ascii=False)}, '
+            f'"dest_dir": {json.dumps(str(plan.dest_dir), ensure_ascii=False)}, '
+            '"moves": ['
+        )
+        lines = [
+            json.dumps(
+                [self._relative(move.source, plan.source_dir), self._relative(move.destination, plan.dest_dir)],
+                ensure_ascii=False,
+            )
+            for move in plan
+        ]
+        # One move per line, so large plans stay readable in a pager or diff
+        text = header + '\n' + ',\n'.join(lines) + ('\n' if lines else '') + ']}\n'
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._file_path.with_name(self._file_path.name + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(tmp_path, self._file_path)
+        except OSError as exc:
+            raise PlanError(f'Could not write plan file {self._file_path}: {exc}') from exc
+
+    def load(self) -> MovePlan:
+        if not self._file_path.exists():
+            raise PlanFileNotFoundError(f'Plan file not found: {self._file_path}')
+
+        try:
+            with open(self._file_path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (IOError, json.JSONDecodeError) as exc:
+            raise PlanFormatError(f'Invalid JSON in plan file: {exc}')
+
+        if not isinstance(data, dict):
+            raise PlanFormatError('Plan file must contain a dictionary')
+        if data.get('version') != _PLAN_VERSION:
+            raise PlanFormatError(f'Unsupported plan version: {data.get("version")!r}')
+
+        source_dir = data.get('source_dir')
+        dest_dir = data.get('dest_dir')
+        moves = data.get('moves')
+        if not isinstance(source_dir, str) or not isinstance(dest_dir, str):
+            raise PlanFormatError('\'source_dir\' and \'dest_dir\' must be strings')
+        if not isinstance(moves, list):
+            raise PlanFormatError('\'moves\' must be a list')
+
+        plan = MovePlan(Path(source_dir), Path(dest_dir))
+        for item in moves:
+            if not (isinstance(item, list) and len(item) == 2 and all(isinstance(part, str) for part in item)):
+                raise PlanFormatError(f'Each move must be a [source, destination] pair of strings: {item}')
+            # Joining with an absolute path yields that path, so both forms load the same way
+            plan.add(plan.source_dir / item[0], plan.dest_dir / item[1])
+        return plan
+
+    @staticmethod
+    def _relative(path: Path, base: Path) -> str:
+        try:
+            return str(path.relative_to(base))
+        except ValueError:
+            return str(path)
@@ -4,7 +4,7 @@ from typing import Dict, Any, Union
 
 # Project modules
 from ...application import RuleRepository
-from ...domain import Rule, ExtensionRule, SizeRule, CompositeRule, RuleSet
+from ...domain import Rule, ExtensionRule, SizeRule, NameRule, DateRule, ContentRule, CompositeRule, RuleSet
 from ...exceptions import (
     RuleFileNotFoundError,
     RuleFormatError,
@@ -87,6 +87,37 @@ class JsonRuleRepository(RuleRepository):
             if min_size is None and max_size is None:
                 raise RuleValidationError('Size rule must have \'min\' or \'max\'')
             return SizeRule(min_size, max_size, folder, priority)
+        elif rule_type == 'name':
+            patterns = item.get('patterns')
+            folder = item.get('folder')
+            if not patterns or not folder:
+                raise RuleValidationError(f'Name rule missing \'patterns\' or \'folder\': {item}')
+            if not isinstance(patterns, list):
+                raise RuleValidationError(f'Name rule \'patterns\' must be a list: {item}')
+            return NameRule(patterns, folder, priority)
+        elif rule_type == 'date':
+            folder = item.get('folder')
+            field = item.get('field', 'mtime')
+            older_than_days = item.get('older_than_days', None)
+            if not folder:
+                raise RuleValidationError(f'Date rule missing \'folder\' attribute: {item}')
+            if field not in ('mtime', 'ctime'):
+                raise RuleValidationError(f'Date rule \'field\' must be \'mtime\' or \'ctime\': {item}')
+            try:
+                return DateRule(folder, field, older_than_days, priority)
+            except ValueError as exc:
+                raise RuleValidationError(f'Invalid date rule {item}: {exc}') from exc
+        elif rule_type == 'content':
+            types = item.get('types')
+            folder = item.get('folder')
+            if not types or not folder:
+                raise RuleValidationError(f'Content rule missing \'types\' or \'folder\': {item}')
+            if not isinstance(types, list):
+                raise RuleValidationError(f'Content rule \'types\' must be a list: {item}')
+            try:
+                return ContentRule(types, folder, priority)
+            except ValueError as exc:
+                raise RuleValidationError(f'Invalid content rule {item}: {exc}') from exc
         elif rule_type == 'composite':
             operator = item.get('operator', 'AND')
             sub_rules_data = item.get('rules')
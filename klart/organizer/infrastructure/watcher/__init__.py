@@ -0,0 +1,4 @@
+from .inotify_watcher import InotifyWatcher
+from .polling_watcher import PollingWatcher
+
+__all__ = ['InotifyWatcher', 'PollingWatcher']
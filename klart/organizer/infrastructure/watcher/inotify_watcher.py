@@ -0,0 +1,186 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from pathlib import Path
+from threading import Event
+from typing import Dict, Iterator, List, Optional
+
+# Project modules
+from ...application import FileWatcher
+from ...exceptions import FileSystemError
+from ..file_system import IgnoreMatcher
+
+# inotify constants from <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Return libc with the inotify calls, or None when this platform has none."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not all(hasattr(libc, name) for name in ('inotify_init1', 'inotify_add_watch', 'inotify_rm_watch')):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+class InotifyWatcher(FileWatcher):
+    """
+    Linux FileWatcher built on inotify through ctypes - no extra dependencies.
+
+    Reports a file when it is closed after writing (IN_CLOSE_WRITE) or moved in
+    (IN_MOVED_TO), so half-written files are never handed out. In recursive mode
+    new subdirectories get their own watch, and files already inside a directory
+    that was moved in are reported too.
+    """
+
+    __slots__ = ('_stop', '_poll_timeout')
+
+    def __init__(self, poll_timeout: float = 0.5) -> None:
+        """
+        Args:
+            poll_timeout: Max seconds to block waiting for events before checking stop().
+        """
+        if _LIBC is None:
+            raise FileSystemError('inotify is not available on this platform')
+        self._stop = Event()
+        self._poll_timeout = poll_timeout
+
+    @staticmethod
+    def available() -> bool:
+        """True if inotify can be used here (Linux with a libc exposing it)."""
+        return _LIBC is not None
+
+    def watch(self, path: Path, recursive: bool = False, ignore_patterns: Optional[List[str]] = None) -> Iterator[Path]:
+        self._stop.clear()
+        ignore = IgnoreMatcher(ignore_patterns)
+        fd = _LIBC.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)  # type: ignore
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise FileSystemError(f'inotify_init1 failed: {os.strerror(errno)}')
+
+        # watch descriptor -> watched directory
+        watches: Dict[int, Path] = {}
+        try:
+            self._add_tree(fd, path, recursive, ignore, watches)
+            poller = select.poll()
+            poller.register(fd, select.POLLIN)
+
+            while not self._stop.is_set() and watches:
+                if not poller.poll(int(self._poll_timeout * 1000)):
+                    continue
+                try:
+                    data = os.read(fd, _READ_SIZE)
+                except BlockingIOError:
+                    continue
+                yield from self._handle_events(fd, data, recursive, ignore, watches)
+        finally:
+            os.close(fd)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _handle_events(
+        self, fd: int, data: bytes, recursive: bool, ignore: IgnoreMatcher, watches: Dict[int, Path]
+    ) -> Iterator[Path]:
+        """Decode one read() worth of inotify events and yield the new files."""
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped - report everything currently there, the use case sorts it out
+                for directory in list(watches.values()):
+                    yield from self._files_in(directory, False, ignore)
+                continue
+            if mask & (_IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF):
+                watches.pop(wd, None)
+                continue
+
+            directory = watches.get(wd)
+            if directory is None or not name:
+                continue
+            event_path = directory / name
+            is_dir = bool(mask & _IN_ISDIR)
+            if ignore.is_ignored(name, event_path, is_dir):
+                continue
+
+            if is_dir:
+                if recursive and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._add_tree(fd, event_path, True, ignore, watches)
+                    # Files may have landed before the watch existed
+                    yield from self._files_in(event_path, True, ignore)
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                yield event_path
+
+    def _add_tree(self, fd: int, path: Path, recursive: bool, ignore: IgnoreMatcher, watches: Dict[int, Path]) -> None:
+        """Add a watch for path and, in recursive mode, for every subdirectory."""
+        stack = [path]
+        while stack:
+            directory = stack.pop()
+            wd = _LIBC.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK)  # type: ignore
+            if wd < 0:
+                if directory == path and not watches:
+                    errno = ctypes.get_errno()
+                    raise FileSystemError(f'Cannot watch {directory}: {os.strerror(errno)}')
+                # Subdirectory vanished or is unreadable - skip it
+                continue
+            watches[wd] = directory
+            if not recursive:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            entry_path = Path(entry.path)
+                            if not ignore.is_ignored(entry.name, entry_path, True):
+                                stack.append(entry_path)
+            except OSError:
+                continue
+
+    def _files_in(self, path: Path, recursive: bool, ignore: IgnoreMatcher) -> Iterator[Path]:
+        """Yield the files currently inside path (used for moved-in dirs and overflows)."""
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        entry_path = Path(entry.path)
+                        is_dir = entry.is_dir()
+                        if ignore.is_ignored(entry.name, entry_path, is_dir):
+                            continue
+                        if is_dir:
+                            if recursive:
+                                stack.append(entry_path)
+                        elif entry.is_file():
+                            yield entry_path
+            except OSError:
+                continue
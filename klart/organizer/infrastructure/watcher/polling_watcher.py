@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+from threading import Event
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Project modules
+from ...application import FileWatcher
+from ..file_system import IgnoreMatcher
+
+
+class PollingWatcher(FileWatcher):
+    """
+    Portable FileWatcher fallback that lists the tree every poll_interval seconds.
+
+    A new file is reported once its size and mtime stayed the same for one
+    interval, so files that are still being written are not picked up half-done.
+    """
+
+    __slots__ = ('_poll_interval', '_stop')
+
+    def __init__(self, poll_interval: float = 1.0) -> None:
+        """
+        Args:
+            poll_interval: Seconds between two listings of the watched tree.
+        """
+        if poll_interval <= 0:
+            raise ValueError('poll_interval must be > 0')
+        self._poll_interval = poll_interval
+        self._stop = Event()
+
+    def watch(self, path: Path, recursive: bool = False, ignore_patterns: Optional[List[str]] = None) -> Iterator[Path]:
+        self._stop.clear()
+        ignore = IgnoreMatcher(ignore_patterns)
+        known = self._snapshot(path, recursive, ignore)
+        # new path -> (size, mtime) seen on the previous poll
+        pending: Dict[Path, Tuple[int, float]] = {}
+
+        while not self._stop.wait(self._poll_interval):
+            current = self._snapshot(path, recursive, ignore)
+            for file_path, signature in current.items():
+                if file_path in known:
+                    continue
+                if pending.get(file_path) == signature:
+                    # Unchanged for a whole interval - writing has finished
+                    del pending[file_path]
+                    known[file_path] = signature
+                    yield file_path
+                else:
+                    pending[file_path] = signature
+            # Forget files that disappeared (moved away by us or by the user)
+            known = {p: s for p, s in known.items() if p in current}
+            pending = {p: s for p, s in pending.items() if p in current}
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _snapshot(self, path: Path, recursive: bool, ignore: IgnoreMatcher) -> Dict[Path, Tuple[int, float]]:
+        """Map every file under path to its (size, mtime)."""
+        files: Dict[Path, Tuple[int, float]] = {}
+        stack = [path]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        entry_path = Path(entry.path)
+                        is_dir = entry.is_dir()
+                        if ignore.is_ignored(entry.name, entry_path, is_dir):
+                            continue
+                        if is_dir:
+                            if recursive:
+                                stack.append(entry_path)
+                        elif entry.is_file():
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue
+                            files[entry_path] = (stat.st_size, stat.st_mtime)
+            except OSError:
+                # Directory vanished or is unreadable - try again on the next poll
+                continue
+        return files
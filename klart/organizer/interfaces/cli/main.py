@@ -38,7 +38,10 @@ def build_parser() -> argparse.ArgumentParser:
             '  organizer ~/Downloads\n'
             '  organizer ~/Downloads --dest ~/Sorted --recursive\n'
             '  organizer ~/Downloads --dry-run\n'
+            '  organizer ~/inbox --watch\n'
             '  organizer ~/Downloads --rules-file my_rules.json --combine-rules\n'
+            '  organizer ~/Downloads --dest /mnt/archive --plan-out plan.json\n'
+            '  organizer --apply-plan plan.json --jobs 8\n'
             '\n'
             'Config priority (highest wins):\n'
             '  CLI args > --config file > built-in defaults'
@@ -77,6 +80,26 @@ def build_parser() -> argparse.ArgumentParser:
     # Ignore patterns
     parser.add_argument('--ignore', nargs='+', metavar='PATTERN', help='Ignore folders or files with this extension')
 
+    # Scanner tuning
+    parser.add_argument(
+        '--scan-workers',
+        type=int,
+        metavar='N',
+        help='Scan subdirectories with N parallel workers in recursive mode (default: 1)',
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        metavar='N',
+        help='Move up to N files in parallel - helps on network storage (default: 1)',
+    )
+    parser.add_argument(
+        '--scan-index',
+        action='store_true',
+        help='Reuse listings of unchanged directories from ~/.cache/klart (faster repeated runs)',
+    )
+
     # Modes
     parser.add_argument(
         '--recursive',
@@ -97,6 +120,46 @@ def build_parser() -> argparse.ArgumentParser:
         help='Remove empty directories after organizing',
     )
 
+    parser.add_argument(
+        '--watch',
+        '-w',
+        action='store_true',
+        help='Keep running and organize new files as they arrive (Ctrl+C to stop)',
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Move files while the scan is still running (not used with --clean)',
+    )
+    parser.add_argument(
+        '--columnar',
+        action='store_true',
+        help='Keep scan results in a compact table - for very large trees (not used with --clean)',
+    )
+
+    parser.add_argument(
+        '--dedup',
+        choices=['skip', 'delete', 'hardlink', 'move'],
+        help='Detect files with identical content and skip them, delete them, '
+        'replace them with hard links, or move them to Duplicates/',
+    )
+
+    # Plan/apply mode
+    plan_group = parser.add_mutually_exclusive_group()
+    plan_group.add_argument(
+        '--plan-out',
+        metavar='FILE',
+        help=(
+            'Classify and resolve final names, but only write the moves to FILE (nothing is moved). '
+            'Accepts --dedup skip|move only'
+        ),
+    )
+    plan_group.add_argument(
+        '--apply-plan',
+        metavar='FILE',
+        help='Execute the moves saved by --plan-out, without classifying again',
+    )
+
     # Rules
     parser.add_argument(
         '--rules',
@@ -186,7 +249,14 @@ def args_to_overrides(args: argparse.Namespace) -> ConfigOverrides:
         recursive=args.recursive or None,
         dry_run=args.dry_run or None,
         clean_mode=args.clean or None,
+        streaming=args.stream or None,
+        columnar=args.columnar or None,
+        dedup=args.dedup,
+        watch=args.watch or None,
         ignore_patterns=ignore_patterns,
+        scan_workers=args.scan_workers,
+        jobs=args.jobs,
+        scan_index=args.scan_index or None,
         rules_cfg=rules_cfg,
         rules_file=args.rules_file or None,
         rules_combine=args.combine_rules or None,
@@ -195,6 +265,8 @@ def args_to_overrides(args: argparse.Namespace) -> ConfigOverrides:
         styles_combine=args.combine_styles or None,
         console_level=args.console_level,
         log_file=args.log_file,
+        plan_out=args.plan_out,
+        apply_plan=args.apply_plan,
         file_level=args.file_level,
     )
 
@@ -257,10 +329,11 @@ def show_result(result: OrganizeResult) -> None:
         spaces = WIDTH - _visible_len(left) - _visible_len(right)
         return f'  {BOLD}│{RESET} {left}{" " * spaces}{right} {BOLD}│{RESET}'
 
-    print(summary_row('✔', GREEN, 'Moved  ', len(result.moved)))
-    print(summary_row('●', YELLOW, 'Skipped', len(result.skipped)))
-    print(summary_row('◆', DARKCYAN, 'Removed', len(result.removed)))
-    print(summary_row('✗', RED, 'Errors ', len(result.errors)))
+    print(summary_row('✔', GREEN, 'Moved     ', len(result.moved)))
+    print(summary_row('●', YELLOW, 'Skipped   ', len(result.skipped)))
+    print(summary_row('◆', DARKCYAN, 'Removed   ', len(result.removed)))
+    print(summary_row('≡', CYAN, 'Duplicates', len(result.duplicates)))
+    print(summary_row('✗', RED, 'Errors    ', len(result.errors)))
     print(divider())
 
     # Status of finished procces
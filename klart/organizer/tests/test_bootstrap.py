@@ -11,7 +11,7 @@ from typing import Optional
 
 from ..bootstrap import bootstrap, ConfigOverrides
 from ..application import OrganizeResult
-from ..exceptions import ConfigValidationError
+from ..exceptions import ConfigValidationError, PlanFormatError
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -158,6 +158,49 @@ def test_bootstrap_inline_rules_cfg(tmp_path):
     assert len(result.moved) == 1
 
 
+def test_bootstrap_streaming_moves_each_file_once(tmp_path):
+    """Streaming + recursive with dest inside source: moved files are not picked up again."""
+    source = tmp_path / 'source'
+    make_files(source, ['doc.txt', 'photo.jpg'])
+    make_files(source / 'nested', ['notes.txt'])
+
+    config_path = write_config(tmp_path / 'config.json', source, source)
+    rules_path = write_rules(tmp_path / 'rules.json')
+
+    result: OrganizeResult = bootstrap(
+        ConfigOverrides(
+            config_files=config_path,
+            rules_file=rules_path,
+            recursive=True,
+            streaming=True,
+        )
+    )
+
+    assert len(result.moved) == 3
+    assert sorted(p.name for p in (source / 'Docs').iterdir()) == ['doc.txt', 'notes.txt']
+    assert (source / 'Images' / 'photo.jpg').exists()
+
+
+@pytest.mark.parametrize('policy', ['delete', 'move'])
+def test_bootstrap_dedup_rerun_keeps_organized_files(tmp_path, policy):
+    """Recursive rerun without dest_dir: an organized file is its own destination, not a duplicate."""
+    source = tmp_path / 'source'
+    (source / 'Docs').mkdir(parents=True)
+    (source / 'Docs' / 'doc.txt').write_text('organized')
+    (source / 'Docs' / 'notes.txt').write_text('other')
+
+    config_path = write_config(tmp_path / 'config.json', source, source, extra={'dest_dir': None})
+    rules_path = write_rules(tmp_path / 'rules.json')
+
+    result: OrganizeResult = bootstrap(
+        ConfigOverrides(config_files=config_path, rules_file=rules_path, recursive=True, dedup=policy)
+    )
+
+    assert result.duplicates == []
+    assert sorted(p.read_text() for p in (source / 'Docs').iterdir()) == ['organized', 'other']
+    assert not (source / 'Duplicates').exists()
+
+
 def test_bootstrap_missing_source_dir_raises(tmp_path):
     """ConfigValidationError is raised when source_dir is None in all layers."""
     dest = tmp_path / 'dest'
@@ -196,3 +239,75 @@ def test_bootstrap_console_level_override(tmp_path):
         )
     )
     assert result is not None
+
+
+def test_bootstrap_plan_then_apply(tmp_path):
+    """plan_out only writes the plan; apply_plan moves files to the planned names."""
+    source = tmp_path / 'source'
+    dest = tmp_path / 'dest'
+    make_files(source, ['a.txt', 'photo.jpg'])
+    make_files(dest / 'Docs', ['a.txt'])  # planned name must become a_(1).txt
+
+    config_path = write_config(tmp_path / 'config.json', source, dest)
+    rules_path = write_rules(tmp_path / 'rules.json')
+    plan_path = tmp_path / 'plan.json'
+
+    planned: OrganizeResult = bootstrap(
+        ConfigOverrides(config_files=config_path, rules_file=rules_path, plan_out=plan_path)
+    )
+
+    assert planned.dry_run is True
+    assert sorted(dst for _, dst in planned.moved) == [dest / 'Docs' / 'a_(1).txt', dest / 'Images' / 'photo.jpg']
+    assert plan_path.exists()
+    assert (source / 'a.txt').exists()  # nothing moved while planning
+    assert sorted(p.name for p in (dest / 'Docs').iterdir()) == ['a.txt']
+
+    applied: OrganizeResult = bootstrap(ConfigOverrides(config_files=config_path, apply_plan=plan_path))
+
+    assert applied.success
+    assert len(applied.moved) == 2
+    assert (dest / 'Docs' / 'a_(1).txt').read_text() == 'dummy'
+    assert (dest / 'Images' / 'photo.jpg').exists()
+    assert not (source / 'a.txt').exists()
+
+
+@pytest.mark.parametrize('policy', ['delete', 'hardlink'])
+def test_bootstrap_plan_rejects_unplannable_dedup(tmp_path, policy):
+    """delete/hardlink duplicates cannot be written to a plan - the combination is refused."""
+    source = tmp_path / 'source'
+    make_files(source, ['a.txt'])
+    config_path = write_config(tmp_path / 'config.json', source, tmp_path / 'dest')
+
+    with pytest.raises(ConfigValidationError):
+        bootstrap(ConfigOverrides(config_files=config_path, dedup=policy, plan_out=tmp_path / 'plan.json'))
+    assert not (tmp_path / 'plan.json').exists()
+
+
+def test_bootstrap_apply_plan_records_missing_source(tmp_path):
+    """A file removed since planning is an error; the rest of the plan is applied."""
+    source = tmp_path / 'source'
+    dest = tmp_path / 'dest'
+    make_files(source, ['doc.txt', 'photo.jpg'])
+
+    config_path = write_config(tmp_path / 'config.json', source, dest)
+    rules_path = write_rules(tmp_path / 'rules.json')
+    plan_path = tmp_path / 'plan.json'
+
+    bootstrap(ConfigOverrides(config_files=config_path, rules_file=rules_path, plan_out=plan_path))
+    (source / 'doc.txt').unlink()
+
+    result: OrganizeResult = bootstrap(ConfigOverrides(config_files=config_path, apply_plan=plan_path))
+
+    assert len(result.errors) == 1
+    assert len(result.moved) == 1
+    assert (dest / 'Images' / 'photo.jpg').exists()
+
+
+def test_bootstrap_apply_plan_rejects_bad_file(tmp_path):
+    """A malformed plan file raises PlanFormatError before anything moves."""
+    config_path = write_config(tmp_path / 'config.json', tmp_path / 'source', tmp_path / 'dest')
+    plan_path = tmp_path / 'plan.json'
+    plan_path.write_text('{"version": 1, "moves": [["a.txt"]]}')
+
+    with pytest.raises(PlanFormatError):
+        bootstrap(ConfigOverrides(config_files=config_path, apply_plan=plan_path))
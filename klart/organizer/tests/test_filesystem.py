@@ -3,11 +3,24 @@ Tests for OSFileSystem adapter.
 Uses tmp_path to avoid touching the real file system.
 """
 
+import errno
+import os
 import pytest
+import threading
+from contextlib import ExitStack
 from pathlib import Path
 
-from ..domain import FileItem, Directory
+from ..domain import FileItem, Directory, FileTable
 from ..infrastructure import OSFileSystem
+from ..infrastructure.file_system import (
+    HashingDuplicateFinder,
+    IgnoreMatcher,
+    MoveEngine,
+    NameIndex,
+    ScanIndex,
+    ThreadedContentSniffer,
+)
+from ..infrastructure.watcher import InotifyWatcher, PollingWatcher
 from ..exceptions import SourceFileNotFoundError
 
 
@@ -82,6 +95,36 @@ def test_scan_ignore_patterns(tmp_path, fs):
     assert files[0].name == 'a.txt'
 
 
+def test_scan_dir_only_pattern_prunes_subtree(tmp_path, fs):
+    """'node_modules/' skips the whole directory but not a file with the same name."""
+    make_structure(
+        tmp_path,
+        {
+            'a.txt': None,
+            'node_modules': {'lib.js': None, 'deep': {'x.js': None}},
+            'sub': {'node_modules': None, 'b.txt': None},
+        },
+    )
+    root = fs.scan(tmp_path, recursive=True, ignore_patterns=['node_modules/'])
+    names = sorted(f.name for f in root.walk_files())
+    assert names == ['a.txt', 'b.txt', 'node_modules']
+    assert root.get_child('node_modules') is None
+
+
+def test_ignore_matcher_buckets():
+    """Literal, suffix, generic glob and path patterns all match like Path.match."""
+    matcher = IgnoreMatcher(['.DS_Store', '*.log', 'IMG_??.jpg', 'build/*.o', '.git/'])
+
+    assert matcher.is_ignored('.DS_Store', Path('/x/.DS_Store'), is_dir=False)
+    assert matcher.is_ignored('app.log', Path('/x/app.log'), is_dir=False)
+    assert matcher.is_ignored('IMG_01.jpg', Path('/x/IMG_01.jpg'), is_dir=False)
+    assert not matcher.is_ignored('IMG_001.jpg', Path('/x/IMG_001.jpg'), is_dir=False)
+    assert matcher.is_ignored('main.o', Path('/x/build/main.o'), is_dir=False)
+    assert not matcher.is_ignored('main.o', Path('/x/src/main.o'), is_dir=False)
+    assert matcher.is_ignored('.git', Path('/x/.git'), is_dir=True)
+    assert not matcher.is_ignored('.git', Path('/x/.git'), is_dir=False)
+
+
 def test_scan_empty_directory(tmp_path, fs):
     """Scanning an empty directory returns zero children."""
     root = fs.scan(tmp_path, recursive=False)
@@ -98,9 +141,361 @@ def test_scan_builds_correct_tree_structure(tmp_path, fs):
     assert sub.get_child('b.txt') is not None
 
 
+def test_directory_children_keep_order_and_detach(tmp_path):
+    """Children are looked up by name, keep insertion order and detach on move."""
+    root = Directory(tmp_path)
+    files = [FileItem(tmp_path / f'f{i}.txt', root) for i in range(3)]
+    target = Directory(tmp_path / 'Docs')
+
+    files[1].update_location(target.path / 'f1.txt', target)
+
+    assert [c.name for c in root.children] == ['f0.txt', 'f2.txt']
+    assert root.get_child('f1.txt') is None
+    assert target.get_child('f1.txt') is files[1]
+    assert root.del_child(files[1]) is False
+
+
+def test_directory_replaces_stale_child_with_same_name(tmp_path):
+    """A different child with an existing name replaces the stale one; re-adding the same one is a no-op."""
+    root = Directory(tmp_path)
+    item = FileItem(tmp_path / 'a.txt', root, size=3)
+    root.add_child(item)
+    assert root.children == [item]
+
+    newer = FileItem(tmp_path / 'a.txt', root, size=5)
+    assert root.children == [newer]
+    assert item.parent is None
+    assert root.size == 5
+
+
+def test_move_reuses_name_of_externally_removed_file(tmp_path, fs):
+    """A moved file removed outside the app frees its name; the next move there succeeds."""
+    source = tmp_path / 'source'
+    source.mkdir()
+    (source / 'a.txt').write_text('first')
+    src_dir = fs.scan(source)
+    dest = Directory(tmp_path / 'dest')
+
+    fs.move(src_dir.get_child('a.txt'), dest.path / 'a.txt', dest, dry_run=False)
+    (dest.path / 'a.txt').unlink()  # removed by the user
+    (source / 'a.txt').write_text('second')
+    second = fs.scan(source).get_child('a.txt')
+    fs.move(second, dest.path / 'a.txt', dest, dry_run=False)
+
+    assert (dest.path / 'a.txt').read_text() == 'second'
+    assert dest.children == [second]
+    assert dest.size == 6
+
+
+def test_directory_traversals_handle_deep_trees(tmp_path):
+    """Walks, find and size work on trees deeper than the recursion limit."""
+    root = Directory(tmp_path)
+    directory = root
+    # Every level held in batch(), as the scanner does: each file updates only
+    # its own directory, so building the chain is O(depth), not O(depth^2)
+    with ExitStack() as batches:
+        for i in range(3000):
+            directory = Directory(directory.path / f'd{i}', directory)
+            batches.enter_context(directory.batch())
+            FileItem(directory.path / 'f.txt', directory, size=1)
+
+    assert sum(1 for _ in root.walk_files()) == 3000
+    assert next(root.walk_dirs()) is directory  # deepest first
+    assert root.find('d2999', recursive=True) is directory
+    assert len(root.find_all('f.txt')) == 3000
+    assert root.size == 3000
+
+
+def test_directory_walk_order(tmp_path):
+    """walk_files is pre-order, walk_dirs is post-order, both in insertion order."""
+    root = Directory(tmp_path)
+    a = Directory(tmp_path / 'a', root)
+    FileItem(a.path / 'a1.txt', a, size=1)
+    b = Directory(a.path / 'b', a)
+    FileItem(b.path / 'b1.txt', b, size=2)
+    FileItem(tmp_path / 'r1.txt', root, size=3)
+    c = Directory(tmp_path / 'c', root)
+
+    assert [f.name for f in root.walk_files()] == ['a1.txt', 'b1.txt', 'r1.txt']
+    assert list(root.walk_dirs()) == [b, a, c]
+    assert (root.size, a.size) == (6, 3)
+
+
+def test_directory_size_updates_all_ancestors(tmp_path):
+    """Adding, moving and removing files keeps every ancestor total current."""
+    root = Directory(tmp_path)
+    a = Directory(tmp_path / 'a', root)
+    b = Directory(a.path / 'b', a)
+    other = Directory(tmp_path / 'other', root)
+    item = FileItem(b.path / 'x.bin', b, size=10)
+    FileItem(a.path / 'y.bin', a, size=5)
+    assert (root.size, a.size, b.size) == (15, 15, 10)
+
+    other.path.mkdir()
+    (other.path / 'x.bin').write_bytes(b'0' * 10)
+    item.update_location(other.path / 'x.bin', other)
+    assert (root.size, a.size, b.size, other.size) == (15, 5, 0, 10)
+
+    with a.batch():
+        FileItem(a.path / 'z.bin', a, size=7)
+        assert root.size == 15  # held back until the batch ends
+    assert root.size == 22
+
+    a.remove_from_parent()
+    assert root.size == 10
+
+
+def test_directory_size_fetches_lazy_and_reports_missing(tmp_path):
+    """Files without scan data are stat-ed on demand; an unreadable one makes the total unknown."""
+    (tmp_path / 'a.txt').write_text('dummy')
+    root = Directory(tmp_path)
+    FileItem(tmp_path / 'a.txt', root)
+    assert root.size == 5
+
+    FileItem(tmp_path / 'gone.txt', root)
+    assert root.size is None
+
+
+def test_directory_size_updates_are_serialized(tmp_path):
+    """Counter updates (lazy stats, moves on workers) wait for each other - none is lost."""
+    from ..domain.entities import directory
+
+    root = Directory(tmp_path)
+    item = FileItem(tmp_path / 'gone.txt', Directory(tmp_path / 'a', root))
+
+    with directory._SIZE_LOCK:
+        # A stat on another thread while an update is in progress must wait for it
+        worker = threading.Thread(target=item._fetch_stat)
+        worker.start()
+        worker.join(0.2)
+        assert worker.is_alive()
+        assert root._size_state() == (0, 1, 0)
+    worker.join()
+    assert root._size_state() == (0, 0, 1)
+
+
+def test_scan_reuses_stat_data(tmp_path, fs, mocker):
+    """Scanned files carry size/mtime/ctime/inode; reading them makes no extra stat() call."""
+    (tmp_path / 'a.txt').write_text('hello')
+    root = fs.scan(tmp_path, recursive=False)
+    file_item = root.get_child('a.txt')
+
+    stat_spy = mocker.spy(Path, 'stat')
+    stat = (tmp_path / 'a.txt').stat()
+    assert file_item.size == 5
+    assert file_item.mtime == stat.st_mtime
+    assert file_item.ctime == stat.st_ctime
+    assert file_item.inode == stat.st_ino
+    # Only the explicit stat() call in this test was made
+    assert stat_spy.call_count == 1
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_scan_stats_only_files_needs_stat_accepts(tmp_path, workers):
+    """Files whose suffix needs_stat rejects are listed but not stat-ed."""
+    make_files(tmp_path, ['a.txt', 'b.bin'])
+    root = OSFileSystem(scan_workers=workers).scan(tmp_path, recursive=True, needs_stat=lambda s: s == '.bin')
+
+    assert root.get_child('a.txt')._stat_fetched is False
+    assert root.get_child('b.bin')._stat_fetched is True
+    assert root.get_child('a.txt').size == 5  # still available lazily
+
+
+def test_parallel_scan_builds_same_tree(tmp_path):
+    """scan_workers > 1 builds the same tree (names, order, sizes) as the sequential walk."""
+    make_structure(
+        tmp_path,
+        {
+            'a.txt': None,
+            'one': {'b.txt': None, 'deep': {'c.txt': None, 'deeper': {'d.txt': None}}},
+            'two': {'e.txt': None, 'f.jpg': None},
+            'empty': {},
+        },
+    )
+
+    def shape(directory: Directory) -> list:
+        return [
+            (child.name, shape(child) if isinstance(child, Directory) else child.size)
+            for child in directory.children
+        ]
+
+    sequential = OSFileSystem().scan(tmp_path, recursive=True)
+    parallel = OSFileSystem(scan_workers=4).scan(tmp_path, recursive=True)
+
+    assert shape(parallel) == shape(sequential)
+    assert len(list(parallel.walk_files())) == 6
+
+
+def test_scan_workers_must_be_positive():
+    """OSFileSystem rejects a worker count below 1."""
+    with pytest.raises(ValueError):
+        OSFileSystem(scan_workers=0)
+
+
+def test_stream_yields_all_files_with_small_buffer(tmp_path):
+    """stream() yields every file even when the queue is much smaller than the tree."""
+    make_structure(tmp_path, {'a.txt': None, 'sub': {'b.txt': None, 'deep': {'c.txt': None}}})
+    for i in range(20):
+        (tmp_path / f'f{i}.txt').write_text('x')
+
+    fs = OSFileSystem(stream_buffer=2)
+    names = {item.name for item in fs.stream(tmp_path, recursive=True)}
+
+    assert names == {'a.txt', 'b.txt', 'c.txt'} | {f'f{i}.txt' for i in range(20)}
+
+
+def test_stream_stops_producer_when_consumer_quits(tmp_path):
+    """Closing the stream early does not hang on the blocked producer thread."""
+    make_files(tmp_path, [f'f{i}.txt' for i in range(50)])
+    stream = OSFileSystem(stream_buffer=1).stream(tmp_path)
+
+    first = next(stream)
+    stream.close()  # must return promptly
+
+    assert first.size == 5
+
+
+def test_scan_table_matches_tree_scan(tmp_path, fs):
+    """scan_table() finds the same files with the same stat data as scan()."""
+    make_structure(tmp_path, {'a.txt': None, '.hidden': None, 'sub': {'b.tar.gz': None, 'deep': {'c': None}}})
+    tree = {(f.path, f.suffix, f.size, f.mtime) for f in fs.scan(tmp_path, recursive=True).walk_files()}
+
+    table = fs.scan_table(tmp_path, recursive=True)
+    rows = {(table.path(i), table.suffix(i), table.size(i), table.mtime(i)) for i in range(len(table))}
+    views = {(f.path, f.suffix, f.size, f.mtime) for f in table.views()}
+
+    assert rows == tree
+    assert views == tree
+
+
+def test_file_table_stays_compact():
+    """Per-file footprint stays under 64 bytes for typical names."""
+    table = FileTable()
+    dir_id = table.add_dir('/data/photos')
+    for i in range(10_000):
+        table.append(dir_id, f'IMG_{i:06d}.jpg', size=i, mtime=1.0)
+
+    assert table.nbytes / len(table) < 64
+    assert table.suffixes == ['.jpg']
+    assert table.view(42).path == Path('/data/photos/IMG_000042.jpg')
+    assert table.size(42) == 42
+
+
+def _age_dirs(base: Path) -> None:
+    """Push directory mtimes into the past so the scan index trusts them."""
+    for path in [base, *(p for p in base.rglob('*') if p.is_dir())]:
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+
+
+def test_scan_index_skips_listing_unchanged_dirs(tmp_path, mocker):
+    """Second run rebuilds unchanged directories from the index without scandir()."""
+    source = tmp_path / 'source'
+    source.mkdir()
+    make_structure(source, {'a.txt': None, 'sub': {'b.txt': None}})
+    _age_dirs(source)
+    index_file = tmp_path / 'cache' / 'index.json'
+
+    first = OSFileSystem(scan_index=ScanIndex(index_file)).scan(source, recursive=True)
+    assert index_file.exists()
+
+    scandir_spy = mocker.spy(os, 'scandir')
+    second = OSFileSystem(scan_index=ScanIndex(index_file)).scan(source, recursive=True)
+
+    assert scandir_spy.call_count == 0
+    assert sorted(f.name for f in second.walk_files()) == sorted(f.name for f in first.walk_files())
+    assert second.get_child('a.txt').size == 5
+
+
+def test_scan_index_rescans_changed_dir(tmp_path):
+    """A directory whose mtime changed is listed again and picks up new files."""
+    source = tmp_path / 'source'
+    source.mkdir()
+    make_structure(source, {'a.txt': None, 'sub': {'b.txt': None}})
+    _age_dirs(source)
+    index_file = tmp_path / 'index.json'
+
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(source, recursive=True)
+    (source / 'sub' / 'c.txt').write_text('new')
+    root = OSFileSystem(scan_index=ScanIndex(index_file)).scan(source, recursive=True)
+
+    assert sorted(f.name for f in root.walk_files()) == ['a.txt', 'b.txt', 'c.txt']
+
+
+def test_scan_index_keeps_subtrees_and_other_roots(tmp_path, mocker):
+    """A non-recursive scan keeps cached subdirectories; roots with other ignore patterns keep theirs."""
+    first = tmp_path / 'first'
+    second = tmp_path / 'second'
+    for source in (first, second):
+        source.mkdir()
+        make_structure(source, {'a.txt': None, 'sub': {'b.txt': None}})
+        _age_dirs(source)
+    index_file = tmp_path / 'index.json'
+
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(first, recursive=True)
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(first, recursive=False)
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(second, recursive=True, ignore_patterns=['*.log'])
+
+    scandir_spy = mocker.spy(os, 'scandir')
+    root = OSFileSystem(scan_index=ScanIndex(index_file)).scan(first, recursive=True)
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(second, recursive=True, ignore_patterns=['*.log'])
+
+    assert scandir_spy.call_count == 0
+    assert sorted(f.name for f in root.walk_files()) == ['a.txt', 'b.txt']
+
+
+def test_scan_index_fills_stats_skipped_by_earlier_run(tmp_path):
+    """Files cached without stat data are stat-ed once a later scan needs them."""
+    source = tmp_path / 'source'
+    source.mkdir()
+    make_files(source, ['a.txt'])
+    _age_dirs(source)
+    index_file = tmp_path / 'index.json'
+
+    OSFileSystem(scan_index=ScanIndex(index_file)).scan(source, needs_stat=lambda s: False)
+    root = OSFileSystem(scan_index=ScanIndex(index_file)).scan(source)
+
+    item = root.get_child('a.txt')
+    assert item._stat_fetched is True
+    assert item.size == 5
+
+
 # ── move ──────────────────────────────────────────────────────────────────────
 
 
+def _collect_first(watcher, path: Path, create) -> list:
+    """Iterate watcher.watch(), call create() shortly after it starts, return what was reported first."""
+    seen = []
+    creator = threading.Timer(0.2, create)
+    timeout = threading.Timer(5, watcher.stop)  # never hang the suite
+    creator.start()
+    timeout.start()
+    try:
+        for event in watcher.watch(path):
+            seen.append(event)
+            watcher.stop()
+    finally:
+        creator.cancel()
+        timeout.cancel()
+    return seen
+
+
+def test_polling_watcher_reports_new_files_only(tmp_path):
+    """Files present before watch() are not reported; a new file is, once stable."""
+    make_files(tmp_path, ['old.txt'])
+    seen = _collect_first(PollingWatcher(poll_interval=0.05), tmp_path, lambda: make_files(tmp_path, ['new.txt']))
+
+    assert seen == [tmp_path / 'new.txt']
+
+
+@pytest.mark.skipif(not InotifyWatcher.available(), reason='inotify is Linux only')
+def test_inotify_watcher_reports_closed_files(tmp_path):
+    """A file is reported after it is written and closed."""
+    make_files(tmp_path, ['old.txt'])
+    seen = _collect_first(InotifyWatcher(poll_timeout=0.05), tmp_path, lambda: make_files(tmp_path, ['new.txt']))
+
+    assert seen == [tmp_path / 'new.txt']
+
+
 def test_move_physically_moves_file(tmp_path, fs):
     """File is moved from source to destination."""
     src = tmp_path / 'source'
@@ -170,6 +565,89 @@ def test_move_resolves_name_conflict(tmp_path, fs):
     assert (dest / 'doc_(1).txt').exists()  # moved with new name
 
 
+def test_concurrent_moves_never_share_a_name(tmp_path, fs, mocker):
+    """Moves of same-named files into one folder from many threads all get distinct names."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    src = tmp_path / 'source'
+    for i in range(12):
+        (src / f'd{i}').mkdir(parents=True)
+        (src / f'd{i}' / 'doc.txt').write_text(str(i))
+    dest = tmp_path / 'dest'
+    files = list(fs.scan(src, recursive=True).walk_files())
+
+    # Widen the window between resolving a name and the file being in place
+    real_move = MoveEngine.move
+
+    def delayed_move(engine, source, destination):
+        threading.Event().wait(0.01)
+        return real_move(engine, source, destination)
+
+    mocker.patch.object(MoveEngine, 'move', autospec=True, side_effect=delayed_move)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        for future in [
+            pool.submit(fs.move, item, dest / 'doc.txt', Directory(dest), False) for item in files
+        ]:
+            future.result()
+
+    names = sorted(p.name for p in dest.iterdir())
+    assert len(names) == 12
+    assert 'doc.txt' in names and 'doc_(11).txt' in names
+    assert sorted(int((dest / name).read_text()) for name in names) == list(range(12))
+    assert sorted(item.path.name for item in files) == names
+
+
+def test_move_creates_each_destination_folder_once(tmp_path, fs, mocker):
+    """Many moves into one folder cost one mkdir; a folder removed meanwhile is recreated."""
+    src = tmp_path / 'source'
+    src.mkdir()
+    make_files(src, [f'doc{i}.txt' for i in range(5)] + ['late.txt'])
+    files = {item.name: item for item in fs.scan(src).walk_files()}
+    dest = tmp_path / 'dest' / 'Docs'
+    dest.parent.mkdir()  # so mkdir(parents=True) does not recurse
+    node = Directory(dest)
+    mkdir_spy = mocker.spy(Path, 'mkdir')
+
+    for i in range(5):
+        fs.move(files[f'doc{i}.txt'], dest / f'doc{i}.txt', node, dry_run=False)
+    assert mkdir_spy.call_count == 1
+    assert sorted(child.name for child in node.children) == [f'doc{i}.txt' for i in range(5)]
+
+    for path in dest.iterdir():
+        path.unlink()
+    dest.rmdir()
+    fs.move(files['late.txt'], dest / 'late.txt', node, dry_run=False)
+    assert (dest / 'late.txt').exists()
+
+
+def test_name_index_resolves_conflicts_from_one_listing(tmp_path, mocker):
+    """The directory is listed once, on the first conflict; later conflicts continue the counter."""
+    make_files(tmp_path, ['report.pdf', 'report_(1).pdf', 'report_(4).pdf', 'notes.txt'])
+    scandir_spy = mocker.spy(os, 'scandir')
+    index = NameIndex(tmp_path)
+
+    assert index.reserve('fresh.pdf') == 'fresh.pdf'
+    assert scandir_spy.call_count == 0
+
+    assert index.reserve('report.pdf') == 'report_(5).pdf'
+    assert index.reserve('report_(2).pdf') == 'report_(2).pdf'
+    assert index.reserve('report_(1).pdf') == 'report_(6).pdf'
+    assert index.reserve('notes.txt') == 'notes_(1).txt'
+    assert scandir_spy.call_count == 1
+
+    # Created by someone else after the listing - never handed out
+    (tmp_path / 'report_(7).pdf').write_text('dummy')
+    assert index.reserve('report.pdf') == 'report_(8).pdf'
+
+    # Reserved but unused (failed move) - free again
+    index.release('fresh.pdf')
+    assert index.reserve('fresh.pdf') == 'fresh.pdf'
+
+    # Removed by the user since the listing (long-running watch) - free again
+    (tmp_path / 'report.pdf').unlink()
+    assert index.reserve('report.pdf') == 'report.pdf'
+
+
 def test_move_creates_dest_parent_dirs(tmp_path, fs):
     """move() creates destination parent directories if they don't exist."""
     src = tmp_path / 'source'
@@ -201,3 +679,147 @@ def test_mkdir_on_existing_dir_no_error(tmp_path, fs):
     target = tmp_path / 'existing'
     target.mkdir()
     fs.mkdir(target)  # should not raise
+
+
+def test_threaded_sniffer_prefetches_in_order_and_caches(tmp_path, fs, mocker):
+    """Wanted files get their header before they are yielded; a second pass hits the cache."""
+    for i in range(20):
+        (tmp_path / f'f{i:02d}.bin').write_bytes(bytes([i]) * 80)
+        (tmp_path / f'f{i:02d}.txt').write_text('text')
+    root = fs.scan(tmp_path)
+    files = sorted(root.walk_files(), key=lambda f: f.name)
+    sniffer = ThreadedContentSniffer(workers=4, window=3)
+    read_spy = mocker.spy(ThreadedContentSniffer, '_read_header')
+
+    wanted = lambda file_item: file_item.suffix == '.bin'
+    yielded = list(sniffer.prefetch(files, wanted))
+
+    assert yielded == files
+    assert read_spy.call_count == 20
+
+    # Same files (same inode, mtime, size) in a fresh scan - served from the cache
+    again = list(sniffer.prefetch(fs.scan(tmp_path).walk_files(), wanted))
+    assert len(again) == 40
+    assert read_spy.call_count == 20
+
+    # Headers were handed over - a lazy read now would find nothing
+    for path in tmp_path.iterdir():
+        path.unlink()
+    for file_item in yielded + again:
+        if file_item.suffix == '.bin':
+            assert file_item.header == bytes([int(file_item.stem[1:])]) * FileItem.HEADER_SIZE
+
+
+def test_duplicate_finder_reads_only_colliding_files(tmp_path, fs, mocker):
+    """Unique sizes are never read; full hashes only for files equal in size and first/last block."""
+    block = 16
+    big = b'A' * block + b'middle-one' + b'Z' * block
+    (tmp_path / 'unique.txt').write_bytes(b'only one this long')
+    (tmp_path / 'b.txt').write_bytes(b'small')
+    (tmp_path / 'c.txt').write_bytes(b'small')
+    (tmp_path / 'd.bin').write_bytes(big)
+    (tmp_path / 'e.bin').write_bytes(big)
+    (tmp_path / 'f.bin').write_bytes(big.replace(b'one', b'two'))
+    (tmp_path / 'empty1').write_bytes(b'')
+    (tmp_path / 'empty2').write_bytes(b'')
+    files = sorted(fs.scan(tmp_path).walk_files(), key=lambda f: f.name)
+    finder = HashingDuplicateFinder(workers=2, block_size=block)
+    partial_spy = mocker.spy(HashingDuplicateFinder, '_partial_hash')
+    full_spy = mocker.spy(HashingDuplicateFinder, '_full_hash')
+
+    duplicates = finder.find(files)
+
+    assert duplicates == {tmp_path / 'c.txt': tmp_path / 'b.txt', tmp_path / 'e.bin': tmp_path / 'd.bin'}
+    partial_names = sorted(call.args[1].name for call in partial_spy.call_args_list)
+    assert partial_names == ['b.txt', 'c.txt', 'd.bin', 'e.bin', 'f.bin']
+    assert sorted(call.args[0].name for call in full_spy.call_args_list) == ['d.bin', 'e.bin', 'f.bin']
+    assert finder.same_content(tmp_path / 'd.bin', tmp_path / 'e.bin')
+    assert not finder.same_content(tmp_path / 'd.bin', tmp_path / 'f.bin')
+    assert not finder.same_content(tmp_path / 'empty1', tmp_path / 'empty2')
+    assert not finder.same_content(tmp_path / 'd.bin', tmp_path / 'd.bin')  # a file is not its own duplicate
+
+
+def test_duplicate_finder_skips_hard_links_to_one_file(tmp_path, fs):
+    """Hard links to one inode are one file - only a real copy is reported."""
+    (tmp_path / 'a.txt').write_text('shared')
+    os.link(tmp_path / 'a.txt', tmp_path / 'b.txt')
+    files = sorted(fs.scan(tmp_path).walk_files(), key=lambda f: f.name)
+    assert HashingDuplicateFinder().find(files) == {}
+
+    (tmp_path / 'c.txt').write_text('shared')
+    files = sorted(fs.scan(tmp_path).walk_files(), key=lambda f: f.name)
+    assert HashingDuplicateFinder().find(files) == {tmp_path / 'c.txt': tmp_path / 'a.txt'}
+
+
+def test_remove_and_replace_with_link(tmp_path, fs):
+    """remove() deletes and detaches; replace_with_link() makes both names one file."""
+    make_files(tmp_path, ['keep.txt', 'copy.txt', 'gone.txt'])
+    root = fs.scan(tmp_path)
+
+    fs.remove(root.get_child('gone.txt'), dry_run=True)
+    assert (tmp_path / 'gone.txt').exists()
+    fs.remove(root.get_child('gone.txt'), dry_run=False)
+    assert not (tmp_path / 'gone.txt').exists()
+    assert root.get_child('gone.txt') is None
+
+    fs.replace_with_link(root.get_child('copy.txt'), tmp_path / 'keep.txt', dry_run=False)
+    assert os.path.samefile(tmp_path / 'copy.txt', tmp_path / 'keep.txt')
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['copy.txt', 'keep.txt']
+
+
+def test_move_engine_same_device_is_a_rename(tmp_path, mocker):
+    """On one file system the file is renamed - same inode, no data copied."""
+    (tmp_path / 'a.txt').write_text('hello')
+    inode = (tmp_path / 'a.txt').stat().st_ino
+    copy_spy = mocker.spy(MoveEngine, '_copy')
+
+    MoveEngine().move(tmp_path / 'a.txt', tmp_path / 'b.txt')
+
+    assert (tmp_path / 'b.txt').stat().st_ino == inode
+    assert not (tmp_path / 'a.txt').exists()
+    assert copy_spy.call_count == 0
+
+
+@pytest.mark.parametrize('unsupported', [(), ('copy_file_range',), ('copy_file_range', 'sendfile')])
+def test_move_engine_cross_device_copies_data_and_metadata(tmp_path, mocker, unsupported):
+    """On EXDEV the data is copied in chunks (falling back primitive by primitive), metadata kept, source removed."""
+    data = os.urandom(100_000)
+    source = tmp_path / 'big.bin'
+    source.write_bytes(data)
+    os.chmod(source, 0o640)
+    os.utime(source, (1_000_000_000, 1_000_000_000))
+    mocker.patch.object(os, 'rename', side_effect=OSError(errno.EXDEV, 'Invalid cross-device link'))
+    for name in unsupported:
+        if hasattr(os, name):
+            mocker.patch.object(os, name, side_effect=OSError(errno.ENOSYS, 'Function not implemented'))
+    read_spy = mocker.spy(MoveEngine, '_read_write')
+
+    MoveEngine(chunk_size=4096).move(source, tmp_path / 'moved.bin')
+
+    moved = tmp_path / 'moved.bin'
+    assert moved.read_bytes() == data
+    assert moved.stat().st_mode & 0o777 == 0o640
+    assert moved.stat().st_mtime == 1_000_000_000
+    assert not source.exists()
+    # Without the kernel primitives, only the last resort reads the data
+    assert (read_spy.call_count > 0) == (len(unsupported) == 2)
+
+
+def test_move_engine_failed_copy_keeps_source(tmp_path, mocker):
+    """A copy error removes the partial destination and leaves the source alone."""
+    source = tmp_path / 'a.bin'
+    source.write_bytes(b'x' * 10_000)
+    mocker.patch.object(os, 'rename', side_effect=OSError(errno.EXDEV, 'Invalid cross-device link'))
+    mocker.patch.object(MoveEngine, '_copiers', return_value=(_failing_copier,))
+
+    with pytest.raises(OSError):
+        MoveEngine().move(source, tmp_path / 'b.bin')
+
+    assert source.read_bytes() == b'x' * 10_000
+    assert not (tmp_path / 'b.bin').exists()
+
+
+def _failing_copier(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    if offset:
+        raise OSError(errno.EIO, 'Input/output error')
+    return os.write(dst_fd, os.read(src_fd, 100))
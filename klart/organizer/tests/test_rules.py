@@ -4,9 +4,23 @@ Tests for rule repository implementations and RuleSet behavior.
 
 import pytest
 import json
+import time
 from pathlib import Path
 
-from ..domain import FileItem, Directory
+from ..domain import (
+    CompositeRule,
+    ContentRule,
+    DateRule,
+    Directory,
+    ExtensionRule,
+    FileItem,
+    FileTable,
+    NamePatternMatcher,
+    NameRule,
+    RuleSet,
+    SizeIndex,
+    SizeRule,
+)
 from ..exceptions import (
     RuleNotFoundError,
     RuleFileNotFoundError,
@@ -78,6 +92,25 @@ def test_json_repo_extension_rules(default_repo, parent_dir):
     assert rule_set.get_folder_name(xyz) == 'Other'  # use_other behavior
 
 
+def test_json_repo_name_rules(tmp_path, parent_dir):
+    """'name' rules are parsed and take part in classification."""
+    rules_file = tmp_path / 'rules.json'
+    rules_file.write_text(
+        json.dumps(
+            {
+                'rules': [
+                    {'type': 'name', 'patterns': ['Screenshot*'], 'folder': 'Screenshots', 'priority': 10},
+                    {'type': 'extension', 'extensions': ['.png'], 'folder': 'Images'},
+                ]
+            }
+        )
+    )
+    rule_set = JsonRuleRepository(rules_file).load_rules()
+
+    assert rule_set.get_folder_name(FileItem(Path('/tmp/screenshot 1.png'), parent_dir)) == 'Screenshots'
+    assert rule_set.get_folder_name(FileItem(Path('/tmp/photo.png'), parent_dir)) == 'Images'
+
+
 def test_json_repo_missing_file_raises(tmp_path):
     """Non-existent file raises RuleFileNotFoundError."""
     repo = JsonRuleRepository(tmp_path / 'missing.json')
@@ -145,6 +178,417 @@ def test_ruleset_ignore_behavior(tmp_path, parent_dir):
     assert rule_set.get_folder_name(unknown) is None
 
 
+def test_ruleset_dispatches_on_suffix(default_repo):
+    """Only rules that can match a suffix are candidates, still in priority order."""
+    rule_set = default_repo.load_rules()
+
+    sh = [type(r).__name__ for r in rule_set.candidates('.SH')]
+    txt = [type(r).__name__ for r in rule_set.candidates('.txt')]
+    unknown = [type(r).__name__ for r in rule_set.candidates('.xyz')]
+
+    assert sh == ['CompositeRule', 'SizeRule']
+    assert txt == ['SizeRule', 'ExtensionRule']
+    assert unknown == ['SizeRule']
+
+
+def test_ruleset_dispatch_matches_full_scan(default_repo, tmp_path):
+    """Suffix dispatch picks the same folder as testing every rule in order."""
+    rule_set = default_repo.load_rules()
+    root = Directory(tmp_path)
+    for name, size in [('a.sh', 2000), ('b.sh', 10), ('c.TXT', 2000), ('d.txt', 10), ('e.png', 5), ('f', 3000)]:
+        item = FileItem(tmp_path / name, root, size=size)
+        expected = next(('/'.join(r.target_segments(item)) for r in rule_set.rules if r.match(item)), 'Other')
+        assert rule_set.get_folder_name(item) == expected
+
+
+def test_rule_evaluate_single_pass(tmp_path, mocker):
+    """Nested OR composites evaluate each leaf at most once and agree with match/target_segments."""
+    docs = ExtensionRule(['.txt'], 'Docs')
+    big = SizeRule(min_size=1000, folder='Big')
+    inner = CompositeRule([docs, big], operator='OR')
+    outer = CompositeRule([inner, ExtensionRule(['.jpg'], 'Images')], operator='OR')
+    and_rule = CompositeRule([ExtensionRule(['.txt'], 'Docs'), SizeRule(max_size=10, folder='Tiny')])
+    root = Directory(tmp_path)
+    small_txt = FileItem(tmp_path / 'a.txt', root, size=5)
+    big_bin = FileItem(tmp_path / 'b.bin', root, size=5000)
+    small_bin = FileItem(tmp_path / 'c.bin', root, size=5)
+
+    spy = mocker.spy(SizeRule, 'evaluate')
+    assert outer.evaluate(small_txt) == ['Docs']
+    assert spy.call_count == 1  # the failed size check is not repeated
+    assert outer.evaluate(big_bin) == outer.target_segments(big_bin) == ['Big']
+    assert outer.evaluate(small_bin) is None and not outer.match(small_bin)
+    assert and_rule.evaluate(small_txt) == and_rule.target_segments(small_txt) == ['Tiny', 'Docs']
+    assert and_rule.evaluate(big_bin) is None
+
+
+def test_ruleset_cache_matches_uncached_decisions(tmp_path):
+    """Cached decisions equal the full rule chain on every size interval boundary."""
+
+    def make(cache_size):
+        return RuleSet(
+            {
+                'rules': [
+                    ExtensionRule(['.txt'], 'Docs'),
+                    CompositeRule([ExtensionRule(['.sh'], 'Scripts'), SizeRule(100, 200, 'Medium')], priority=100),
+                    SizeRule(min_size=500, folder='Big'),
+                ],
+                'other_behavior': 'use_other',
+                'ignore_extensions': ['.bak'],
+                'ignore_size_more_than': 1000,
+                'ignore_size_less_than': 5,
+            },
+            cache_size=cache_size,
+        )
+
+    cached, plain = make(64), make(0)
+    root = Directory(tmp_path)
+    for i, size in enumerate([None, 1, 5, 6, 99, 100, 150, 200, 201, 499, 500, 999, 1000]):
+        for suffix in ['.txt', '.SH', '.bin', '.bak']:
+            item = FileItem(tmp_path / f'f{i}{suffix}', root, size=size)  # size None: no such file
+            assert cached.get_folder_name(item) == plain.get_folder_name(item), (suffix, size)
+
+    # Second round is served from the cache
+    misses = cached.cache_misses
+    assert cached.get_folder_name(FileItem(tmp_path / 'again.txt', root, size=150)) == 'Docs'
+    assert cached.cache_misses == misses and cached.cache_hits > 0
+
+
+def test_ruleset_cache_is_bounded(tmp_path):
+    """The LRU never grows past cache_size."""
+    rule_set = RuleSet(
+        {
+            'rules': [ExtensionRule(['.txt'], 'Docs')],
+            'other_behavior': 'use_other',
+            'ignore_extensions': [],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        },
+        cache_size=2,
+    )
+    root = Directory(tmp_path)
+    for suffix in ['.a', '.b', '.c', '.txt']:
+        rule_set.get_folder_name(FileItem(tmp_path / f'x{suffix}', root))
+
+    assert len(rule_set._cache) == 2
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_ruleset_classify_columns_matches_batch(default_repo, tmp_path, mocker, use_numpy):
+    """Columnar classification gives the same decisions as classifying FileItems."""
+    from ..domain.rules import setter
+
+    if use_numpy and setter._np is None:
+        pytest.skip('numpy not installed')
+    if not use_numpy:
+        mocker.patch.object(setter, '_np', None)
+    rule_set = default_repo.load_rules()
+    table = FileTable()
+    dir_id = table.add_dir(tmp_path)
+    for i, size in enumerate([None, 0, 1023, 1024, 5000, 10240, 10241, 10_000_000]):
+        for suffix in ['.sh', '.TXT', '.bak', '.bin', '']:
+            table.append(dir_id, f'f{i}{suffix}', size=size, mtime=0.0)
+
+    columnar = rule_set.classify_columns(table.suffix_ids, table.suffixes, table.sizes)
+    batch = rule_set.classify_batch(table.views())
+
+    assert columnar == batch
+    assert rule_set.feature_only
+
+
+def test_ruleset_classify_batch_returns_errors_for_raise(tmp_path):
+    """With other_behavior='raise', unmatched rows get a RuleNotFoundError instead of aborting."""
+    rule_set = RuleSet(
+        {
+            'rules': [ExtensionRule(['.txt'], 'Docs')],
+            'other_behavior': 'raise',
+            'ignore_extensions': [],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        }
+    )
+    root = Directory(tmp_path)
+    files = [FileItem(tmp_path / 'a.txt', root, size=1), FileItem(tmp_path / 'b.xyz', root, size=1)]
+
+    decisions = rule_set.classify_batch(files)
+    columnar = rule_set.classify_columns([0, 1], ['.txt', '.xyz'], [1, 1])
+
+    assert decisions[0] == columnar[0] == 'Docs'
+    assert isinstance(decisions[1], RuleNotFoundError)
+    assert isinstance(columnar[1], RuleNotFoundError)
+
+
+def test_ruleset_dependency_analysis_skips_stat(tmp_path, mocker):
+    """Suffixes whose rule path never reaches a size check are classified without stat()."""
+    rule_set = RuleSet(
+        {
+            'rules': [ExtensionRule(['.txt'], 'Docs', priority=60), SizeRule(min_size=100, folder='Big')],
+            'other_behavior': 'use_other',
+            'ignore_extensions': ['.bak'],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        }
+    )
+    assert rule_set.required_attributes('.TXT') == {'suffix'}
+    assert rule_set.required_attributes('.bak') == {'suffix'}
+    assert rule_set.needs_stat('.bin')
+    assert not rule_set.needs_stat('.txt')
+
+    fetch_spy = mocker.spy(FileItem, '_fetch_stat')
+    root = Directory(tmp_path)
+    assert rule_set.get_folder_name(FileItem(tmp_path / 'a.txt', root)) == 'Docs'
+    assert rule_set.get_folder_name(FileItem(tmp_path / 'b.bak', root)) is None
+    assert fetch_spy.call_count == 0
+
+
+def test_ruleset_size_threshold_needs_stat_everywhere():
+    """An ignore size threshold makes every non-ignored suffix need size."""
+    rule_set = RuleSet(
+        {
+            'rules': [ExtensionRule(['.txt'], 'Docs')],
+            'other_behavior': 'use_other',
+            'ignore_extensions': [],
+            'ignore_size_more_than': 1000,
+            'ignore_size_less_than': None,
+        }
+    )
+    assert rule_set.needs_stat('.txt')
+    assert rule_set.needs_stat('')
+
+
+def test_size_index_returns_matching_tiers_in_order():
+    """lookup() returns exactly the rules whose range holds the size, in input order."""
+    tiers = [
+        SizeRule(max_size=99, folder='Tiny'),
+        SizeRule(100, 999, folder='Small'),
+        SizeRule(500, 5000, folder='Overlap'),
+        SizeRule(min_size=1000, folder='Large'),
+    ]
+    unbounded = ExtensionRule(['.txt'], 'Docs')
+    index = SizeIndex([tiers[2], unbounded, *tiers])
+
+    for size in [0, 99, 100, 499, 500, 999, 1000, 5000, 5001, 10**9]:
+        expected = [r for r in [tiers[2], unbounded, *tiers] if r.size_bounds() is None or r._match_size(size)]
+        assert list(index.lookup(size)) == expected, size
+    assert index.lookup(None) == (unbounded,)
+
+
+def test_size_index_stays_small_with_nested_ranges():
+    """Nested ranges cost O(rules * log boundaries) entries, not one per rule per segment."""
+    rules = [SizeRule(i, 10_000 - i, folder=f'N{i}') for i in range(1, 501)]
+    index = SizeIndex(rules)
+
+    assert sum(len(node) for node in index._nodes) <= len(rules) * 2 * 11
+    assert index.lookup(5000) == tuple(rules)
+    assert index.lookup(3) == tuple(rules[:3])
+    assert index.lookup(10_000) == ()
+
+
+def test_composite_size_bounds():
+    """AND intersects size ranges, OR takes their hull; extension rules do not bound."""
+    small_images = CompositeRule([ExtensionRule(['.jpg'], 'Images'), SizeRule(0, 1000, 'Small')])
+    both = CompositeRule([SizeRule(100, 900, 'A'), SizeRule(min_size=500, folder='B')])
+    tiers = CompositeRule([SizeRule(max_size=10, folder='T'), SizeRule(100, 200, folder='M')], operator='OR')
+
+    assert small_images.size_bounds() == (0, 1000)
+    assert both.size_bounds() == (500, 900)
+    assert tiers.size_bounds() == (0, 200)
+    assert CompositeRule([ExtensionRule(['.jpg'], 'I'), tiers], operator='OR').size_bounds() is None
+
+
+def test_ruleset_size_tiers_match_full_scan(tmp_path):
+    """Many (extension AND size tier) rules classify the same as trying every rule."""
+    bounds = [(0, 1023), (1024, 10239), (10240, 1048575), (1048576, None)]
+    rules = []
+    for ext, kind in [('.jpg', 'Images'), ('.mp4', 'Videos'), ('.txt', 'Docs')]:
+        for tier, (low, high) in enumerate(bounds):
+            rules.append(CompositeRule([ExtensionRule([ext], kind), SizeRule(low or None, high, f'T{tier}')]))
+    rules.append(CompositeRule([SizeRule(max_size=10, folder='A'), SizeRule(5000, 6000, folder='B')], 'OR', 10))
+    rule_set = RuleSet(
+        {
+            'rules': rules,
+            'other_behavior': 'use_other',
+            'ignore_extensions': [],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        },
+        cache_size=0,
+    )
+    root = Directory(tmp_path)
+    for i, size in enumerate([0, 5, 1023, 1024, 5500, 10240, 2_000_000]):
+        for ext in ['.jpg', '.MP4', '.txt', '.bin']:
+            item = FileItem(tmp_path / f'f{i}{ext}', root, size=size)
+            expected = next(('/'.join(r.target_segments(item)) for r in rule_set.rules if r.match(item)), 'Other')
+            assert rule_set.get_folder_name(item) == expected, (ext, size)
+
+
+def test_name_rule_patterns_and_suffixes(parent_dir):
+    """Patterns match the whole name case-insensitively; literal extensions feed the dispatch table."""
+    invoices = NameRule(['invoice-*.PDF'], 'Invoices')
+    photos = NameRule(['IMG_*', '*.jpg'], 'Photos')
+
+    assert invoices.match(FileItem(Path('/tmp/Invoice-2024.pdf'), parent_dir))
+    assert not invoices.match(FileItem(Path('/tmp/my-invoice-2024.pdf'), parent_dir))
+    assert photos.match(FileItem(Path('/tmp/img_0001.HEIC'), parent_dir))
+    assert invoices.suffixes() == frozenset({'.pdf'})
+    assert photos.suffixes() is None
+    assert NameRule(['*.jpg'], 'J').suffixes() == frozenset({'.jpg', ''})
+    assert invoices.requires() == frozenset({'name'})
+
+
+def test_name_pattern_matcher_reports_every_match():
+    """One lookup returns every rule with a matching pattern, plus unpatterned rules, in input order."""
+    rules = [
+        NameRule(['IMG_*'], 'A'),
+        ExtensionRule(['.jpg'], 'Images'),
+        NameRule(['img_*.jpg', 'DSC?????.*'], 'B'),
+        NameRule(['*screenshot*'], 'C'),
+        NameRule(['[0-9][0-9]-*'], 'D'),
+    ]
+    matcher = NamePatternMatcher(rules)
+    names = ['IMG_1.jpg', 'img_1.png', 'DSC01234.raw', 'DSC0123.raw', 'My Screenshot.png', '07-notes.txt', 'x']
+
+    for name in names:
+        fake = FileItem(Path('/tmp') / name, Directory('/tmp'))
+        expected = tuple(r for r in rules if r.name_patterns() is None or r.match(fake))
+        assert matcher.lookup(name) == expected, name
+
+
+def test_ruleset_many_name_rules_match_full_scan(tmp_path):
+    """Hundreds of vendor patterns classify the same as trying every rule."""
+    rules = [NameRule([f'vendor{i:03d}_*', f'*-v{i:03d}.pdf'], f'Vendor{i:03d}', priority=i % 7) for i in range(300)]
+    rules += [
+        NameRule(['Screenshot*'], 'Screenshots', 5),
+        CompositeRule([NameRule(['IMG_*'], 'Camera'), SizeRule(max_size=1000, folder='Small')]),
+        ExtensionRule(['.pdf', '.png'], 'Docs'),
+    ]
+    rule_set = RuleSet(
+        {
+            'rules': rules,
+            'other_behavior': 'use_other',
+            'ignore_extensions': [],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        }
+    )
+    root = Directory(tmp_path)
+    names = [
+        'vendor042_report.txt',
+        'VENDOR299_a.pdf',
+        'bill-v150.pdf',
+        'bill-v150.PDF',
+        'bill-v1500.pdf',
+        'Screenshot 2024.png',
+        'IMG_0001.jpg',
+        'notes.png',
+        'x',
+    ]
+    for name in names:
+        for size in [10, 5000]:
+            item = FileItem(tmp_path / name, root, size=size)
+            expected = next(('/'.join(r.target_segments(item)) for r in rule_set.rules if r.match(item)), 'Other')
+            assert rule_set.get_folder_name(item) == expected, (name, size)
+            root.del_child(item)
+
+
+def test_date_rule_renders_template_per_day(tmp_path):
+    """Segments come from the scanned timestamp and are formatted once per (year, month, day)."""
+    root = Directory(tmp_path)
+    morning = time.mktime((2024, 3, 7, 8, 0, 0, 0, 0, -1))
+    rule = DateRule('Photos/{year}/{month}', priority=1)
+    photos = CompositeRule([ExtensionRule(['.jpg'], 'Images'), DateRule('{year}-{month}-{day}')])
+
+    a = FileItem(tmp_path / 'a.jpg', root, size=1, mtime=morning)
+    b = FileItem(tmp_path / 'b.jpg', root, size=1, mtime=morning + 3600)
+    c = FileItem(tmp_path / 'c.jpg', root, size=1, mtime=morning + 86400)
+
+    assert rule.evaluate(a) == ['Photos', '2024', '03']
+    assert rule.evaluate(b) == ['Photos', '2024', '03']
+    assert rule.evaluate(c) == ['Photos', '2024', '03']
+    assert len(rule._segments) == 2
+    assert photos.evaluate(c) == ['Images', '2024-03-08']
+    assert rule.requires() == frozenset({'mtime'})
+    for template in ['Photos/{week}', '{year.x}', '{year[x]}']:
+        with pytest.raises(ValueError):
+            DateRule(template)
+
+
+def test_date_rule_older_than_days_and_ctime(tmp_path):
+    """older_than_days only matches old enough files; field picks mtime or ctime."""
+    root = Directory(tmp_path)
+    now = time.time()
+    old = FileItem(tmp_path / 'old.txt', root, size=1, mtime=now - 40 * 86400, ctime=now)
+    new = FileItem(tmp_path / 'new.txt', root, size=1, mtime=now - 86400, ctime=now - 40 * 86400)
+    unknown = FileItem(tmp_path / 'unknown.txt', root, size=1)
+
+    by_mtime = DateRule('Archive', older_than_days=30)
+    by_ctime = DateRule('Archive', field='ctime', older_than_days=30)
+    assert by_mtime.match(old) and not by_mtime.match(new)
+    assert by_ctime.match(new) and not by_ctime.match(old)
+    assert not by_mtime.match(unknown)
+
+
+def test_ruleset_date_rule_uses_scan_stat(tmp_path, mocker):
+    """A 'date' rule from the repo routes on the timestamp the scanner handed over."""
+    rules_file = tmp_path / 'rules.json'
+    rules_file.write_text(
+        json.dumps(
+            {
+                'other_behavior': 'ignore',
+                'rules': [{'type': 'date', 'folder': 'Archive/{year}', 'older_than_days': 30}],
+            }
+        )
+    )
+    rule_set = JsonRuleRepository(rules_file).load_rules()
+    root = Directory(tmp_path)
+    stale = FileItem(tmp_path / 'stale.log', root, size=1, mtime=time.mktime((2020, 6, 1, 12, 0, 0, 0, 0, -1)))
+    fresh = FileItem(tmp_path / 'fresh.log', root, size=1, mtime=time.time())
+
+    stat_spy = mocker.spy(Path, 'stat')
+    assert rule_set.get_folder_name(stale) == 'Archive/2020'
+    assert rule_set.get_folder_name(fresh) is None
+    assert stat_spy.call_count == 0
+    assert rule_set.needs_stat('.log')
+
+
+def test_content_rule_detects_type_from_header(tmp_path):
+    """Content rules look at magic bytes, not at the name."""
+    root = Directory(tmp_path)
+    (tmp_path / 'photo.txt').write_bytes(b'\xff\xd8\xff\xe0' + bytes(60))
+    (tmp_path / 'clip').write_bytes(b'\x00\x00\x00\x18ftypisom' + bytes(20))
+    (tmp_path / 'notes.jpg').write_text('just text')
+    photo = FileItem(tmp_path / 'photo.txt', root)
+    clip = FileItem(tmp_path / 'clip', root)
+    notes = FileItem(tmp_path / 'notes.jpg', root)
+
+    images = ContentRule(['image'], 'Images')
+    video = ContentRule(['MP4', 'mkv'], 'Video')
+    assert images.evaluate(photo) == ['Images'] and not images.match(clip)
+    assert video.match(clip) and not video.match(photo)
+    assert not images.match(notes)
+    assert len(photo.header) == FileItem.HEADER_SIZE
+    with pytest.raises(ValueError):
+        ContentRule(['jpg-ish'], 'X')
+
+
+def test_ruleset_needs_content_only_past_extension_rules():
+    """Only suffixes that can reach a content rule are worth sniffing."""
+    rule_set = RuleSet(
+        {
+            'rules': [ExtensionRule(['.jpg'], 'Images', 10), ContentRule(['image'], 'Sniffed')],
+            'other_behavior': 'use_other',
+            'ignore_extensions': ['.tmp'],
+            'ignore_size_more_than': None,
+            'ignore_size_less_than': None,
+        }
+    )
+    assert rule_set.reads_content
+    assert not rule_set.needs_content('.JPG')
+    assert not rule_set.needs_content('.tmp')
+    assert rule_set.needs_content('')
+    assert rule_set.needs_content('.txt')
+
+
 # ── InMemoryRuleRepository ────────────────────────────────────────────────────
 
 
@@ -4,12 +4,13 @@ Uses fake implementations of all ports — no real filesystem, no real logger.
 """
 
 # import pytest
+import pytest
 from pathlib import Path
 from typing import List, Optional
 
 from ..application import AppConfig
-from ..application.use_cases import OrganizeFilesUseCase
-from ..application.ports import FileSystem, Logger
+from ..application.use_cases import OrganizeFilesUseCase, WatchFilesUseCase
+from ..application.ports import ContentSniffer, DuplicateFinder, FileSystem, FileWatcher, Logger
 from ..domain import FileItem, Directory
 from ..infrastructure.config import InMemoryConfigRepository
 from ..infrastructure.rules import JsonRuleRepository
@@ -53,8 +54,10 @@ class FakeFileSystem(FileSystem):
             FileItem(f, self._root)
         self.moved: List[tuple] = []
         self.mkdirs: List[Path] = []
+        self.removed: List[Path] = []
+        self.linked: List[tuple] = []
 
-    def scan(self, path, recursive=False, ignore_patterns=None) -> Directory:
+    def scan(self, path, recursive=False, ignore_patterns=None, needs_stat=None) -> Directory:
         return self._root
 
     def move(self, file_item, destination, new_parent, dry_run):
@@ -63,6 +66,17 @@ class FakeFileSystem(FileSystem):
         if not dry_run:
             self.moved.append((file_item.path, destination))
 
+    def reserve_name(self, destination):
+        return destination
+
+    def remove(self, file_item, dry_run):
+        if not dry_run:
+            self.removed.append(file_item.path)
+
+    def replace_with_link(self, file_item, target, dry_run):
+        if not dry_run:
+            self.linked.append((file_item.path, target))
+
     def mkdir(self, path, parents=True):
         self.mkdirs.append(path)
 
@@ -79,6 +93,49 @@ class FakeFileSystem(FileSystem):
         return False
 
 
+class FakeWatcher(FileWatcher):
+    """Yields a fixed list of paths as if they had just arrived."""
+
+    def __init__(self, paths: List[Path]):
+        self.paths = paths
+        self.stopped = False
+
+    def watch(self, path, recursive=False, ignore_patterns=None):
+        yield from self.paths
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeSniffer(ContentSniffer):
+    """Hands out fixed headers and records which files were wanted."""
+
+    def __init__(self, headers: dict):
+        self.headers = headers
+        self.sniffed: List[str] = []
+
+    def prefetch(self, files, wanted):
+        for file_item in files:
+            if wanted(file_item):
+                self.sniffed.append(file_item.name)
+                file_item.provide_header(self.headers.get(file_item.name, b''))
+            yield file_item
+
+
+class FakeFinder(DuplicateFinder):
+    """Reports a fixed duplicate -> kept copy mapping."""
+
+    def __init__(self, duplicates: dict):
+        self.duplicates = duplicates
+
+    def find(self, files):
+        paths = {file_item.path for file_item in files}
+        return {dup: kept for dup, kept in self.duplicates.items() if dup in paths}
+
+    def same_content(self, first, second):
+        return False
+
+
 def make_config(
     source_dir: Path,
     dest_dir: Optional[Path] = None,
@@ -223,3 +280,253 @@ def test_use_case_dest_none_uses_source_as_base(tmp_path):
     # dest path should be source / 'Docs'
     moved_dest = result.moved[0][1]
     assert str(moved_dest).startswith(str(source))
+
+
+def test_watch_use_case_organizes_reported_files(tmp_path):
+    """Each file reported by the watcher is classified and moved once."""
+    source = Path('/source')
+    dest = tmp_path / 'dest'
+
+    class WatchedFileSystem(FakeFileSystem):
+        def is_file(self, path):
+            return path.name != 'gone.txt'
+
+    config_repo = InMemoryConfigRepository(make_config(source, dest))
+    rule_repo = make_rule_repo(tmp_path)
+    logger = FakeLogger()
+    fs = WatchedFileSystem([])
+    watcher = FakeWatcher([Path('/source/doc.txt'), Path('/source/gone.txt'), Path('/source/img.jpg')])
+
+    use_case = WatchFilesUseCase(config_repo, rule_repo, fs, logger, watcher=watcher)
+    result = use_case.execute()
+
+    assert len(result.moved) == 2
+    assert fs.moved[0] == (Path('/source/doc.txt'), dest / 'Docs' / 'doc.txt')
+    assert watcher.stopped
+
+
+def test_watch_use_case_skips_already_organized_files(tmp_path):
+    """Files landing in their own destination folder (our own moves) are left alone."""
+    source = Path('/source')
+
+    class WatchedFileSystem(FakeFileSystem):
+        def is_file(self, path):
+            return True
+
+    config_repo = InMemoryConfigRepository(make_config(source, dest_dir=None, recursive=True))
+    rule_repo = make_rule_repo(tmp_path)
+    fs = WatchedFileSystem([])
+    watcher = FakeWatcher([Path('/source/Docs/doc.txt')])
+
+    result = WatchFilesUseCase(config_repo, rule_repo, fs, FakeLogger(), watcher=watcher).execute()
+
+    assert len(result.moved) == 0
+    assert fs.moved == []
+
+
+def test_use_case_columnar_mode_moves_files(tmp_path):
+    """Columnar mode organizes the same files through FileTable views."""
+    source = Path('/source')
+    dest = tmp_path / 'dest'
+
+    config = AppConfig(source_dir=source, dest_dir=dest, columnar=True)
+    config_repo = InMemoryConfigRepository(config)
+    rule_repo = make_rule_repo(tmp_path)
+    fs = FakeFileSystem([Path('/source/doc.txt'), Path('/source/img.jpg')])
+
+    result = OrganizeFilesUseCase(config_repo, rule_repo, fs, FakeLogger()).execute()
+
+    assert sorted(dst for _, dst in fs.moved) == [dest / 'Docs' / 'doc.txt', dest / 'Images' / 'img.jpg']
+    assert len(result.moved) == 2
+
+
+def test_use_case_columnar_mode_records_unmatched_as_errors(tmp_path):
+    """Columnar batch decisions keep per-file error handling for other_behavior='raise'."""
+    source = Path('/source')
+    config = AppConfig(source_dir=source, dest_dir=tmp_path / 'dest', columnar=True)
+    fs = FakeFileSystem([Path('/source/doc.txt'), Path('/source/script.py')])
+
+    result = OrganizeFilesUseCase(
+        InMemoryConfigRepository(config), make_rule_repo(tmp_path, other_behavior='raise'), fs, FakeLogger()
+    ).execute()
+
+    assert len(result.moved) == 1
+    assert len(result.errors) == 1
+
+
+def test_use_case_sniffs_only_files_reaching_content_rule(tmp_path):
+    """Headers are prefetched only for files a content rule can see; they route by content."""
+    import json
+
+    rules_file = tmp_path / 'rules.json'
+    rules_file.write_text(
+        json.dumps(
+            {
+                'other_behavior': 'ignore',
+                'rules': [
+                    {'type': 'extension', 'extensions': ['.txt'], 'folder': 'Docs', 'priority': 10},
+                    {'type': 'content', 'types': ['image'], 'folder': 'Images'},
+                ],
+            }
+        )
+    )
+    source = Path('/source')
+    dest = tmp_path / 'dest'
+    fs = FakeFileSystem([source / 'doc.txt', source / 'download', source / 'notes'])
+    sniffer = FakeSniffer({'download': b'\x89PNG\r\n\x1a\n' + bytes(8), 'notes': b'hello'})
+
+    use_case = OrganizeFilesUseCase(
+        InMemoryConfigRepository(make_config(source, dest)), JsonRuleRepository(rules_file), fs, FakeLogger(), sniffer
+    )
+    result = use_case.execute()
+
+    assert sorted(sniffer.sniffed) == ['download', 'notes']
+    assert sorted(dst for _, dst in fs.moved) == [dest / 'Docs' / 'doc.txt', dest / 'Images' / 'download']
+    assert result.skipped == [source / 'notes']
+
+
+@pytest.mark.parametrize('policy', ['skip', 'delete', 'hardlink', 'move'])
+def test_use_case_dedup_policies(tmp_path, policy):
+    """Duplicates found before the moves are handled by the policy; the kept copy is organized."""
+    source = Path('/source')
+    dest = tmp_path / 'dest'
+    config = AppConfig(source_dir=source, dest_dir=dest, dedup=policy, streaming=True)
+    fs = FakeFileSystem([source / 'a.txt', source / 'a copy.txt', source / 'b.jpg'])
+    finder = FakeFinder({source / 'a copy.txt': source / 'a.txt'})
+    logger = FakeLogger()
+
+    use_case = OrganizeFilesUseCase(
+        InMemoryConfigRepository(config), make_rule_repo(tmp_path), fs, logger, finder=finder
+    )
+    result = use_case.execute()
+
+    assert result.duplicates == [(source / 'a copy.txt', source / 'a.txt')]
+    assert logger.messages[-1].endswith('Duplicates: 1 | Errors: 0')
+    moved = sorted(dst for _, dst in fs.moved)
+    expected = [dest / 'Docs' / 'a.txt', dest / 'Images' / 'b.jpg']
+    if policy == 'move':
+        expected.append(dest / 'Duplicates' / 'a copy.txt')
+    assert moved == sorted(expected)
+    assert fs.removed == ([source / 'a copy.txt'] if policy == 'delete' else [])
+    assert fs.linked == ([(source / 'a copy.txt', source / 'a.txt')] if policy == 'hardlink' else [])
+
+
+def test_use_case_dedup_against_existing_destination(tmp_path):
+    """A file identical to the one already at its destination is not moved as name_(1)."""
+    from ..infrastructure import HashingDuplicateFinder, OSFileSystem
+
+    source = tmp_path / 'inbox'
+    dest = tmp_path / 'dest'
+    source.mkdir()
+    (dest / 'Docs').mkdir(parents=True)
+    (source / 'report.txt').write_text('same attachment')
+    (dest / 'Docs' / 'report.txt').write_text('same attachment')
+    (source / 'notes.txt').write_text('new')
+    (dest / 'Docs' / 'notes.txt').write_text('old')
+
+    config = AppConfig(source_dir=source, dest_dir=dest, dedup='delete')
+    use_case = OrganizeFilesUseCase(
+        InMemoryConfigRepository(config),
+        make_rule_repo(tmp_path),
+        OSFileSystem(),
+        FakeLogger(),
+        finder=HashingDuplicateFinder(),
+    )
+    result = use_case.execute()
+
+    assert result.duplicates == [(source / 'report.txt', dest / 'Docs' / 'report.txt')]
+    assert sorted(p.name for p in (dest / 'Docs').iterdir()) == ['notes.txt', 'notes_(1).txt', 'report.txt']
+    assert list(source.iterdir()) == []
+
+
+def test_use_case_dedup_ignores_skipped_files(tmp_path):
+    """Files the rules skip are left alone by the dedup policy, even when identical."""
+    from ..infrastructure import HashingDuplicateFinder, OSFileSystem
+
+    source = tmp_path / 'inbox'
+    dest = tmp_path / 'dest'
+    source.mkdir()
+    (source / 'a.tmp').write_text('scratch')
+    (source / 'b.tmp').write_text('scratch')
+    (source / 'a.txt').write_text('letter')
+    (source / 'b.txt').write_text('letter')
+
+    config = AppConfig(source_dir=source, dest_dir=dest, dedup='delete')
+    use_case = OrganizeFilesUseCase(
+        InMemoryConfigRepository(config),
+        make_rule_repo(tmp_path, other_behavior='ignore'),
+        OSFileSystem(),
+        FakeLogger(),
+        finder=HashingDuplicateFinder(),
+    )
+    result = use_case.execute()
+
+    # Only the .txt pair is deduplicated (the kept copy depends on scan order)
+    assert len(result.duplicates) == 1
+    assert sorted(result.skipped) == [source / 'a.tmp', source / 'b.tmp']
+    assert sorted(p.name for p in source.iterdir()) == ['a.tmp', 'b.tmp']
+    assert [p.read_text() for p in (dest / 'Docs').iterdir()] == ['letter']
+
+
+def test_use_case_parallel_moves_record_in_scan_order(tmp_path):
+    """With jobs > 1 every file is moved once and results keep the scan order."""
+    from ..infrastructure import OSFileSystem
+
+    source = tmp_path / 'inbox'
+    for sub in ('a', 'b', 'c'):
+        (source / sub).mkdir(parents=True)
+        for i in range(5):
+            (source / sub / f'note{i}.txt').write_text(f'{sub}{i}')
+        (source / sub / 'pic.jpg').write_text(sub)
+    dest = tmp_path / 'dest'
+    fs = OSFileSystem()
+    scan_order = [item.path for item in fs.scan(source, recursive=True).walk_files()]
+
+    config = AppConfig(source_dir=source, dest_dir=dest, recursive=True, jobs=4)
+    use_case = OrganizeFilesUseCase(InMemoryConfigRepository(config), make_rule_repo(tmp_path), fs, FakeLogger())
+    result = use_case.execute()
+
+    assert result.success
+    assert [src for src, _ in result.moved] == scan_order
+    assert len(list((dest / 'Docs').iterdir())) == 15
+    assert sorted(p.name for p in (dest / 'Images').iterdir()) == ['pic.jpg', 'pic_(1).jpg', 'pic_(2).jpg']
+
+
+def test_use_case_parallel_moves_record_errors(tmp_path):
+    """A move failing on a worker is recorded as an error; the others go through."""
+    source = Path('/source')
+
+    class FlakyFileSystem(FakeFileSystem):
+        def move(self, file_item, destination, new_parent, dry_run):
+            if file_item.suffix == '.jpg':
+                raise OSError('disk error')
+            super().move(file_item, destination, new_parent, dry_run)
+
+    fs = FlakyFileSystem([source / f'doc{i}.txt' for i in range(6)] + [source / 'img.jpg'])
+    config = AppConfig(source_dir=source, dest_dir=tmp_path / 'dest', jobs=3)
+    use_case = OrganizeFilesUseCase(InMemoryConfigRepository(config), make_rule_repo(tmp_path), fs, FakeLogger())
+    result = use_case.execute()
+
+    assert len(result.moved) == 6
+    assert result.errors == [(source / 'img.jpg', 'disk error')]
+
+
+def test_use_case_builds_destination_tree(tmp_path):
+    """Moved files share one Directory node per destination folder, all under one root."""
+    from ..infrastructure import OSFileSystem
+
+    source = tmp_path / 'inbox'
+    source.mkdir()
+    for name in ('a.txt', 'b.txt', 'c.jpg', 'd.txt'):
+        (source / name).write_text(name)
+    dest = tmp_path / 'dest'
+    use_case = OrganizeFilesUseCase(
+        InMemoryConfigRepository(make_config(source, dest)), make_rule_repo(tmp_path), OSFileSystem(), FakeLogger()
+    )
+    use_case.execute()
+
+    tree = use_case.destination_tree
+    assert tree is not None and tree.path == dest
+    assert sorted(child.name for child in tree.children) == ['Docs', 'Images']
+    assert sorted(child.name for child in tree.get_child('Docs').children) == ['a.txt', 'b.txt', 'd.txt']
+    assert tree.get_child('Images').get_child('c.jpg').path == dest / 'Images' / 'c.jpg'
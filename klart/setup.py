@@ -35,6 +35,10 @@ setup(
             'pytest>=7.0',
             'pytest-mock>=3.0',
         ],
+        # Optional: vectorized classification for --columnar scans
+        'fast': [
+            'numpy>=1.24',
+        ],
     },
     # Cli command script runner
     entry_points={